@@ -0,0 +1,49 @@
+"""
+Settings and synthetic captures shared by the benchmarks (OPERATE M-sequences of type 2, COM3 timing).
+"""
+from typing import Iterable, Tuple
+
+from iolink_utils.definitions.bitRate import BitRate
+from iolink_utils.octetStreamDecoder._compressChecksum import lookup_8to6_compression
+from iolink_utils.octetStreamDecoder.octetStreamDecoderSettings import DecoderSettings, MSeqPayloadLength, TimestampMode
+
+
+def createSettings() -> DecoderSettings:
+    return DecoderSettings(
+        transmissionRate=BitRate.COM3,
+        startup=MSeqPayloadLength(pdOut=0, od=1, pdIn=0),
+        preoperate=MSeqPayloadLength(pdOut=0, od=8, pdIn=0),
+        operate=MSeqPayloadLength(pdOut=2, od=2, pdIn=4),
+        timestampMode=TimestampMode.Nanoseconds
+    )
+
+
+def _checksum(octets) -> int:
+    checksum = 0x52
+    for octet in octets:
+        checksum ^= octet
+    return lookup_8to6_compression[checksum]
+
+
+def masterFrame(mc: int, pdOut: bytes, od: bytes) -> bytes:
+    """Master frame of M-sequence type 2."""
+    return bytes([mc, 0x80 | _checksum(bytes([mc, 0x80]) + pdOut + od)]) + pdOut + od
+
+
+def deviceFrame(od: bytes, pdIn: bytes) -> bytes:
+    return od + pdIn + bytes([_checksum(od + pdIn + b'\x00')])
+
+
+def createCapture(mSequences: Iterable[Tuple[bytes, bytes]]):
+    """Octet values and start/end times in nanoseconds of (master frame, device frame), one per cycle."""
+    values, startTimes, endTimes = bytearray(), [], []
+    now = 0
+    for master, device in mSequences:
+        for octetIndex, octet in enumerate(master + device):
+            now += 20_000 if octetIndex == len(master) else 1_000
+            values.append(octet)
+            startTimes.append(now)
+            now += 47_740
+            endTimes.append(now)
+        now += 1_000_000
+    return bytes(values), startTimes, endTimes
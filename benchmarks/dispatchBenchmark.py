@@ -0,0 +1,117 @@
+"""
+Dispatch benchmark: messages per second of MessageInterpreter.processMessage (decoded messages only).
+
+Compares the table-driven dispatch with the previous dispatch (CommChannel enum per message, double dispatch
+and a state handler dict per ISDU message), emulated by LegacyInterpreter (the FlowControl lookup table is
+used by both).
+
+    python benchmarks/dispatchBenchmark.py [--count N] [--repeat R]
+"""
+import argparse
+import time
+from typing import Callable, List
+
+from iolink_utils.definitions.communicationChannel import CommChannel
+from iolink_utils.definitions.transmissionDirection import TransmissionDirection
+from iolink_utils.messageInterpreter.isdu.commChannelISDU import CommChannelISDU
+from iolink_utils.messageInterpreter.isdu.ISDUflowControl import FlowControl
+from iolink_utils.messageInterpreter.messageInterpreter import MessageInterpreter
+from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder
+
+from benchmarkHelper import createCapture, createSettings, deviceFrame, masterFrame
+
+
+def createIsduCapture(mSequenceCount: int):
+    """
+    Operate M-sequences (type 2: pdOut=2, od=2, pdIn=4), COM3 timing in nanoseconds:
+    an ISDU read (index 0x10) every 16 M-sequences, cyclic process data in between.
+    """
+    pdOut, pdIn = b'\x01\x02', b'\x0A\x0B\x0C\x0D'
+    isdu = [(masterFrame(0x70, pdOut, b'\x93\x10'), deviceFrame(b'\x00\x00', pdIn)),  # write, start
+            (masterFrame(0x61, pdOut, b'\x00\x83'), deviceFrame(b'\x00\x00', pdIn)),  # write, count 1
+            (masterFrame(0xF0, pdOut, b''), deviceFrame(b'\xD3\x00', pdIn)),  # read, start
+            (masterFrame(0xE1, pdOut, b''), deviceFrame(b'\x00\x00', pdIn))]  # read, count 1 (trailing 0)
+    process = (masterFrame(0x80, pdOut, b''), deviceFrame(b'\x00\x00', pdIn))
+    return createCapture(isdu[index % 16] if index % 16 < len(isdu) else process for index in range(mSequenceCount))
+
+
+class LegacyCommChannelISDU(CommChannelISDU):
+    """State handler dict created per message (as before the handler tables)."""
+
+    def handleMasterMessage(self, message):
+        self._direction = TransmissionDirection(message.mc.read)
+        flowControl = FlowControl(message.mc.address)
+        if flowControl.state == FlowControl.State.Abort:
+            self.reset()
+            return
+        handler = {
+            self.State.Idle: self.handleMasterMsgInStateIdle,
+            self.State.Request: self.handleMasterMsgInStateRequest,
+            self.State.WaitForResponse: self.handleMasterMsgInStateWaitForResponse,
+        }.get(self._state)
+        if handler:
+            handler(message, flowControl)
+        self._flowControl = flowControl
+
+    def handleDeviceMessage(self, message):
+        handler = {
+            self.State.RequestFinished: self.handleDeviceMsgInStateRequestFinished,
+            self.State.WaitForResponse: self.handleDeviceMsgInStateWaitForResponse,
+            self.State.Response: self.handleDeviceMsgInStateResponse,
+        }.get(self._state)
+        if handler:
+            isdu = handler(message)
+            self._previousFlowControl = self._flowControl.copy()
+            return isdu
+        return None
+
+
+class LegacyInterpreter(MessageInterpreter):
+    """CommChannel enum per message and double dispatch (as before the dispatch tables)."""
+
+    def __init__(self):
+        super().__init__()
+        self._channelHandler[CommChannel.ISDU] = LegacyCommChannelISDU()
+
+    def processMessage(self, message):
+        self._updateActiveChannel(message.channel())
+        return message.dispatch(self._channelHandler[self._activeChannel])
+
+
+def measure(createInterpreter: Callable[[], MessageInterpreter], messages: List, repeat: int) -> float:
+    """Best messages per second of repeat runs."""
+    best = 0.0
+    for _ in range(repeat):
+        processMessage = createInterpreter().processMessage
+        start = time.perf_counter()
+        for message in messages:
+            processMessage(message)
+        best = max(best, len(messages) / (time.perf_counter() - start))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=50_000, help='number of M-sequences')
+    parser.add_argument('--repeat', type=int, default=5, help='number of runs per measurement (best is reported)')
+    args = parser.parse_args()
+
+    settings = createSettings()
+    messages = OctetStreamDecoder(settings).processOctets(*createIsduCapture(args.count))
+    assert len(messages) == 2 * args.count
+
+    results = {
+        'before (enum + double dispatch)': measure(LegacyInterpreter, messages, args.repeat),
+        'after (dispatch tables)': measure(MessageInterpreter, messages, args.repeat),
+        'after, ISDU + Diagnosis only': measure(
+            lambda: MessageInterpreter(channels=[CommChannel.ISDU, CommChannel.Diagnosis]), messages, args.repeat),
+    }
+
+    width = max(len(name) for name in results)
+    print(f"{'dispatch':<{width}}  messages/s  (n={len(messages)})")
+    for name, rate in results.items():
+        print(f"{name:<{width}}  {rate:10.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Memory benchmark: bytes per decoded message and per transaction (retained objects only).
+
+    python benchmarks/memoryBenchmark.py [--count N]
+"""
+import argparse
+import gc
+import tracemalloc
+from datetime import datetime as dt
+from typing import Callable, List
+
+from iolink_utils.definitions.eventMemory import EventMemory
+from iolink_utils.definitions.transmissionDirection import TransmissionDirection
+from iolink_utils.messageInterpreter.diagnosis.transactionDiagnosis import TransactionDiagEventMemory, \
+    TransactionDiagEventReset
+from iolink_utils.messageInterpreter.isdu.ISDUrequests import createISDURequest
+from iolink_utils.messageInterpreter.isdu.ISDUresponses import createISDUResponse
+from iolink_utils.messageInterpreter.page.transactionPage import TransactionPage
+from iolink_utils.messageInterpreter.process.transactionProcess import TransactionProcess
+from iolink_utils.octetDecoder.octetDecoder import IService
+from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder
+from iolink_utils.octetStreamDecoder.octetStreamDecoderSettings import DecoderSettings
+
+from benchmarkHelper import createCapture, createSettings, deviceFrame, masterFrame
+
+
+def createOperateCapture(mSequenceCount: int):
+    """Operate M-sequences (type 2: pdOut=2, od=2 (write), pdIn=4), COM3 timing in nanoseconds."""
+    return createCapture([(masterFrame(0x70, b'\x01\x02', b'\x10\x11'), deviceFrame(b'', b'\x0A\x0B\x0C\x0D'))] *
+                         mSequenceCount)
+
+
+def measure(create: Callable[[], List], count: int) -> float:
+    """Retained bytes per object created by create()."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = create()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    assert len(objects) == count
+    return size / count
+
+
+def createDecoder(settings: DecoderSettings, frameSegmentation: bool) -> OctetStreamDecoder:
+    decoder = OctetStreamDecoder(settings)
+    decoder._useFrameSegmentation = frameSegmentation
+    return decoder
+
+
+def createISDU(count: int) -> List:
+    isdus = []
+    for _ in range(count):
+        request = createISDURequest(IService(0x93))
+        request.appendOctets(bytearray([0x93, 0x10, 0x00, 0x83]))
+        isdus.append(request)
+    return isdus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=20_000, help='number of objects per measurement')
+    count = parser.parse_args().count
+
+    settings = createSettings()
+    values, startTimes, endTimes = createOperateCapture(count // 2)
+    now = dt.now()
+
+    results = {
+        'MasterMessage/DeviceMessage (octet decoding)': measure(
+            lambda: createDecoder(settings, frameSegmentation=False).processOctets(values, startTimes, endTimes), count),
+        'MasterMessage/DeviceMessage (frame decoding)': measure(
+            lambda: OctetStreamDecoder(settings).processOctets(values, startTimes, endTimes), count),
+        'MasterMessageView/DeviceMessageView': measure(
+            lambda: OctetStreamDecoder(settings, messageViews=True).processOctets(values, startTimes, endTimes), count),
+        'TransactionPage': measure(
+            lambda: [TransactionPage(TransmissionDirection.Read, 2, 0x49) for _ in range(count)], count),
+        'TransactionProcess': measure(
+            lambda: [TransactionProcess('master', TransmissionDirection.Write) for _ in range(count)], count),
+        'TransactionDiagEventMemory': measure(
+            lambda: [TransactionDiagEventMemory(now, now, EventMemory()) for _ in range(count)], count),
+        'TransactionDiagEventReset': measure(
+            lambda: [TransactionDiagEventReset(now, now) for _ in range(count)], count),
+        'ISDURequest_Read8bitIdx': measure(lambda: createISDU(count), count),
+        'ISDUResponse_WriteResp_P': measure(
+            lambda: [createISDUResponse(IService(0x52)) for _ in range(count)], count),
+    }
+
+    width = max(len(name) for name in results)
+    print(f"{'object':<{width}}  bytes/object  (n={count})")
+    for name, size in results.items():
+        print(f"{name:<{width}}  {size:12.1f}")
+
+
+if __name__ == '__main__':
+    main()
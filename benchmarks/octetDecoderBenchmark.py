@@ -0,0 +1,59 @@
+"""
+Octet decoder microbenchmarks: ctypes (OctetDecoderBase), plain int (IntOctetDecoderBase) and interned
+decoded octets (decode()), in nanoseconds per operation.
+
+    python benchmarks/octetDecoderBenchmark.py [--number N] [--repeat R]
+"""
+import argparse
+import copy
+import timeit
+
+from iolink_utils.octetDecoder import octetDecoder, intOctetDecoder
+
+
+def createOperations(decoderClass, decoded: bool) -> dict:
+    create = decoderClass.decode if decoded else decoderClass
+    mc, other = create(0x70), create(0x70)
+    return {
+        'create (MC(0x70))': lambda: create(0x70),
+        'read field (mc.channel)': lambda: mc.channel,
+        'int(mc)': lambda: int(mc),
+        'mc == other': lambda: mc == other,
+        'hash(mc)': lambda: hash(mc),
+        'mc.copy()': lambda: mc.copy(),
+        'copy.deepcopy(mc)': lambda: copy.deepcopy(mc),
+        'mc.valuesAsString()': lambda: mc.valuesAsString(),
+    }
+
+
+def measure(operation, number: int, repeat: int) -> float:
+    """Best time per operation in nanoseconds (None if not supported)."""
+    try:
+        operation()
+    except TypeError:  # e.g. ctypes structures are not hashable
+        return float('nan')
+    return min(timeit.repeat(operation, number=number, repeat=repeat)) / number * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=100_000, help='number of calls per run')
+    parser.add_argument('--repeat', type=int, default=5, help='number of runs (best is reported)')
+    args = parser.parse_args()
+
+    variants = {
+        'ctypes': createOperations(octetDecoder.MC, decoded=False),
+        'int': createOperations(intOctetDecoder.MC, decoded=False),
+        'decode()': createOperations(intOctetDecoder.MC, decoded=True),
+    }
+    operations = list(variants['ctypes'])
+
+    width = max(len(name) for name in operations)
+    print(f"{'ns/operation':<{width}}" + "".join(f"  {variant:>9}" for variant in variants))
+    for operation in operations:
+        print(f"{operation:<{width}}" + "".join(
+            f"  {measure(variants[variant][operation], args.number, args.repeat):9.1f}" for variant in variants))
+
+
+if __name__ == '__main__':
+    main()
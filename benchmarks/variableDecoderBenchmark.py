@@ -0,0 +1,53 @@
+"""
+Decoding of ISDU data with the compiled variable decoders of an IODD (Iodd.variableDecoders), in nanoseconds
+per decoded ISDU (e.g. parameter dumps with tens of thousands of ISDUs).
+
+    python benchmarks/variableDecoderBenchmark.py [--number N] [--repeat R]
+"""
+from pathlib import Path
+import argparse
+import struct
+import timeit
+
+from iolink_utils.iodd.iodd import Iodd
+
+EXAMPLES = Path(__file__).parent.parent / 'tests' / 'iodd' / 'IODDViewer1.4_Examples'
+SIMPLE_IODD = EXAMPLES / 'IO-Link-09-AllSimpleDatatypesDevice-20211215-IODD1.1.xml'
+COMPLEX_IODD = EXAMPLES / 'IO-Link-10-AllComplexDatatypesDevice-20211215-IODD1.1.xml'
+
+
+def createOperations(simpleIodd: Iodd, complexIodd: Iodd) -> dict:
+    simpleDecoders, complexDecoders = simpleIodd.variableDecoders, complexIodd.variableDecoders
+    return {
+        'UIntegerT 16 (index 67)': lambda: simpleDecoders.decode(67, 0, b'\x01\xF4'),
+        'IntegerT 32 (index 68)': lambda: simpleDecoders.decode(68, 0, b'\xFF\xF8\x5E\xE0'),
+        'Float32T (index 69)': lambda: simpleDecoders.decode(69, 0, struct.pack('>f', 1.5)),
+        'StringT 32 (index 25)': lambda: simpleDecoders.decode(25, 0, b'Function tag'),
+        'OctetStringT 8 (index 70)': lambda: simpleDecoders.decode(70, 0, b'\x55\xAA' * 4),
+        'RecordT 3 items (index 68)': lambda: complexDecoders.decode(68, 0, b'\x07\x00\xFF\xF6\x40\x20\x00\x00'),
+        'RecordT subindex (index 67)': lambda: complexDecoders.decode(67, 3, b'\x01\xF4'),
+        'ArrayT 3 x IntegerT (index 66)': lambda: complexDecoders.decode(66, 0, b'\x00\x01\xFF\xFE\x01\xF4'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=100_000, help='number of calls per run')
+    parser.add_argument('--repeat', type=int, default=5, help='number of runs (best is reported)')
+    args = parser.parse_args()
+
+    start = timeit.default_timer()
+    simpleIodd, complexIodd = Iodd(str(SIMPLE_IODD)), Iodd(str(COMPLEX_IODD))
+    simpleIodd.variableDecoders, complexIodd.variableDecoders
+    print(f"load IODDs and create decoders: {(timeit.default_timer() - start) * 1e3:.1f} ms\n")
+
+    operations = createOperations(simpleIodd, complexIodd)
+    width = max(len(name) for name in operations)
+    print(f"{'ns/ISDU':<{width}}")
+    for name, operation in operations.items():
+        nanoseconds = min(timeit.repeat(operation, number=args.number, repeat=args.repeat)) / args.number * 1e9
+        print(f"{name:<{width}}  {nanoseconds:9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,249 @@
+from typing import NamedTuple, Iterator, Iterable, List, Optional
+import mmap
+import struct
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from iolink_utils.definitions.bitRate import BitRate
+from iolink_utils.exceptions import InvalidCaptureFile
+from .csvCaptureReader import TimestampParser
+from .octetChunk import OctetChunk
+
+
+# File layout (little endian):
+#   header: magic (8 bytes), version (uint16), bitRate (uint32), port (uint16)
+#   records: value (uint8), flags (uint8), startTime (int64, ns), endTime (int64, ns)
+CAPTURE_MAGIC = b'IOLCAP\x00\x00'
+CAPTURE_VERSION = 1
+
+_HEADER = struct.Struct('<8sHIH')
+_RECORD = struct.Struct('<BBqq')
+
+HEADER_SIZE = _HEADER.size
+RECORD_SIZE = _RECORD.size
+
+# record flags (rows that are not decodable octets are kept, so the conversion is lossless)
+FLAG_ERROR = 0x01  # e.g. framing/parity error
+FLAG_NO_DATA = 0x02  # row type is not 'data' (e.g. break)
+
+RECORD_DTYPE = np.dtype([('value', '<u1'), ('flags', '<u1'), ('startTime', '<i8'), ('endTime', '<i8')]) \
+    if np is not None else None
+
+
+class CaptureHeader(NamedTuple):
+    bitRate: BitRate = BitRate.Undefined
+    port: int = 0
+
+
+def writeBinaryCapture(filename: str, records: Iterable[tuple], header: CaptureHeader = CaptureHeader()) -> int:
+    """
+    Writes a binary capture file.
+
+    :param filename: name of the binary capture file
+    :param records: iterable of (value, flags, startTime, endTime) with timestamps in nanoseconds
+    :param header: bit rate and port the capture was taken from
+    :return: number of records written
+    """
+    recordCount = 0
+    pack = _RECORD.pack
+    with open(filename, 'wb') as file:
+        file.write(_HEADER.pack(CAPTURE_MAGIC, CAPTURE_VERSION, int(header.bitRate), header.port))
+        batch: List[bytes] = []
+        for record in records:
+            batch.append(pack(*record))
+            if len(batch) >= 65536:
+                file.write(b''.join(batch))
+                recordCount += len(batch)
+                batch = []
+        file.write(b''.join(batch))
+        recordCount += len(batch)
+    return recordCount
+
+
+def readCsvRecords(lines: Iterable[str]) -> Iterator[tuple]:
+    """
+    Converts the rows of a CSV capture 'value,error,start,end,type' into binary capture records.
+    Rows with error or of another type than 'data' are kept (see FLAG_ERROR/FLAG_NO_DATA).
+    """
+    parseTimestamp = TimestampParser()
+    for line in lines:
+        columns = line.split(',')
+        if len(columns) != 5:
+            continue
+
+        value, error, start, end, typeStr = columns
+        try:
+            value = int(value)
+        except ValueError:  # header row
+            continue
+
+        flags = (FLAG_ERROR if error.strip() else 0) | (FLAG_NO_DATA if typeStr.strip() != 'data' else 0)
+        yield value & 0xFF, flags, parseTimestamp(start.strip()), parseTimestamp(end.strip())
+
+
+def convertCsvToBinary(csvFilename: str, binaryFilename: str, header: CaptureHeader = CaptureHeader()) -> int:
+    """
+    Converts a CSV capture into the binary capture format (once), so that later runs do not have to parse text.
+
+    :return: number of records written
+    """
+    with open(csvFilename, newline="", encoding="utf-8") as file:
+        return writeBinaryCapture(binaryFilename, readCsvRecords(file), header)
+
+
+def unpackHeader(data, filename: str = '') -> CaptureHeader:
+    """Checks and converts the file header (first HEADER_SIZE bytes of data)."""
+    magic, version, bitRate, port = _HEADER.unpack_from(data, 0)
+    if magic != CAPTURE_MAGIC:
+        raise InvalidCaptureFile(f"Not a binary capture file: {filename}")
+    if version != CAPTURE_VERSION:
+        raise InvalidCaptureFile(f"Unsupported capture file version {version}: {filename}")
+    return CaptureHeader(BitRate(bitRate), port)
+
+
+def unpackRecords(data) -> OctetChunk:
+    """
+    Converts a buffer of whole records (e.g. received from a live source, see RECORD_SIZE)
+    into a chunk of decodable octets (records without flags).
+    """
+    if len(data) % RECORD_SIZE != 0:
+        raise InvalidCaptureFile(f"Buffer does not contain whole records ({len(data)} bytes)")
+
+    if np is None:
+        values, startTimes, endTimes = [], [], []
+        for value, flags, startTime, endTime in _RECORD.iter_unpack(data):
+            if not flags:
+                values.append(value)
+                startTimes.append(startTime)
+                endTimes.append(endTime)
+        return OctetChunk(values, startTimes, endTimes)
+
+    records = np.frombuffer(data, dtype=RECORD_DTYPE)
+    if records['flags'].any():
+        records = records[records['flags'] == 0]
+    return OctetChunk(records['value'], records['startTime'], records['endTime'])
+
+
+class BinaryCaptureReader:
+    """
+    Reads a binary capture via mmap (see writeBinaryCapture/convertCsvToBinary).
+
+    With numpy, chunks are zero-copy views into the mapped file (only chunks containing flagged records
+    are filtered, which creates a copy). Without numpy, chunks are unpacked into lists.
+    Chunks can directly be decoded by an OctetStreamDecoder configured with TimestampMode.Nanoseconds:
+
+        with BinaryCaptureReader('capture.iolcap') as reader:
+            for chunk in reader:
+                messages = decoder.processOctets(*chunk)
+    """
+
+    def __init__(self, filename: str, chunkSize: int = 65536):
+        self._filename: str = filename
+        self._chunkSize: int = chunkSize
+
+        self._file = open(filename, 'rb')
+        try:
+            self._mmap: Optional[mmap.mmap] = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            self._file.close()
+            raise InvalidCaptureFile(f"Empty capture file: {filename}")
+
+        try:
+            self._header: CaptureHeader = self._readHeader()
+        except InvalidCaptureFile:
+            self.close()
+            raise
+        self._recordCount: int = (len(self._mmap) - HEADER_SIZE) // RECORD_SIZE
+
+    def _readHeader(self) -> CaptureHeader:
+        if len(self._mmap) < HEADER_SIZE:
+            raise InvalidCaptureFile(f"Capture file too short: {self._filename}")
+
+        header = unpackHeader(self._mmap, self._filename)
+        if (len(self._mmap) - HEADER_SIZE) % RECORD_SIZE != 0:
+            raise InvalidCaptureFile(f"Truncated capture file: {self._filename}")
+        return header
+
+    @property
+    def filename(self) -> str:
+        return self._filename
+
+    @property
+    def header(self) -> CaptureHeader:
+        return self._header
+
+    @property
+    def chunkSize(self) -> int:
+        return self._chunkSize
+
+    def __len__(self) -> int:
+        return self._recordCount
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # chunks (numpy views) are still referenced -> mapping is released together with the last view
+                pass
+            self._mmap = None
+        self._file.close()
+
+    def records(self):
+        """
+        All records as numpy structured array (view into the mapped file, see RECORD_DTYPE).
+        Without numpy, a list of (value, flags, startTime, endTime) tuples.
+        """
+        if np is None:
+            return list(_RECORD.iter_unpack(self._mmap[HEADER_SIZE:HEADER_SIZE + self._recordCount * RECORD_SIZE]))
+        return np.frombuffer(self._mmap, dtype=RECORD_DTYPE, count=self._recordCount, offset=HEADER_SIZE)
+
+    def __iter__(self) -> Iterator[OctetChunk]:
+        return self.chunks()
+
+    def chunks(self, startRecord: int = 0) -> Iterator[OctetChunk]:
+        """
+        Yields chunks of decodable octets (records without flags).
+
+        :param startRecord: index of the first record (e.g. to resume decoding, chunk n ends at record
+                            startRecord + (n + 1) * chunkSize)
+        """
+        if np is not None:
+            yield from self._numpyChunks(startRecord)
+        else:
+            yield from self._structChunks(startRecord)
+
+    def _numpyChunks(self, startRecord: int = 0) -> Iterator[OctetChunk]:
+        records = self.records()
+        for begin in range(startRecord, len(records), self._chunkSize):
+            chunk = records[begin:begin + self._chunkSize]
+            if chunk['flags'].any():
+                chunk = chunk[chunk['flags'] == 0]
+            if len(chunk) > 0:
+                yield OctetChunk(chunk['value'], chunk['startTime'], chunk['endTime'])
+
+    def _structChunks(self, startRecord: int = 0) -> Iterator[OctetChunk]:
+        data = memoryview(self._mmap)
+        try:
+            for begin in range(startRecord, self._recordCount, self._chunkSize):
+                end = min(begin + self._chunkSize, self._recordCount)
+                records = _RECORD.iter_unpack(data[HEADER_SIZE + begin * RECORD_SIZE:HEADER_SIZE + end * RECORD_SIZE])
+                values, startTimes, endTimes = [], [], []
+                for value, flags, startTime, endTime in records:
+                    if not flags:
+                        values.append(value)
+                        startTimes.append(startTime)
+                        endTimes.append(endTime)
+                if values:
+                    yield OctetChunk(values, startTimes, endTimes)
+        finally:
+            data.release()
@@ -0,0 +1,152 @@
+from typing import Dict, Iterator, List
+from datetime import datetime as dt, timedelta, timezone
+
+from .octetChunk import OctetChunk
+
+
+_EPOCH = dt(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+class TimestampParser:
+    """
+    Converts ISO timestamps (e.g. '2050-01-01 00:01:02.128865+00:00') into integer nanoseconds since epoch.
+
+    Consecutive timestamps of a capture share everything except the fractional seconds, so the
+    'date time' prefix is parsed only once and then looked up. Per timestamp, only the fractional part
+    is converted. Timestamps without time zone are treated as UTC.
+    """
+    _PREFIX_LENGTH = len('YYYY-MM-DD HH:MM:SS')
+    _MAX_CACHE_SIZE = 1024
+    _FRACTION_SCALE = [10 ** (9 - digits) for digits in range(10)]
+
+    def __init__(self):
+        self._prefixCache: Dict[str, int] = {}
+        self._timezone: str = ''  # time zone of all cached prefixes
+
+    def __call__(self, timestamp: str) -> int:
+        return self.parseMany([timestamp])[0]
+
+    def parseMany(self, timestamps: List[str]) -> List[int]:
+        """Converts a list of timestamps (e.g. a column of a chunk) at once."""
+        prefixLength = TimestampParser._PREFIX_LENGTH
+        fractionScale = TimestampParser._FRACTION_SCALE
+        prefixCache = self._prefixCache
+        timezoneSuffix = self._timezone
+
+        result: List[int] = []
+        appendResult = result.append
+        for timestamp in timestamps:
+            prefixNs = prefixCache.get(timestamp[:prefixLength])
+            fraction = timestamp[prefixLength + 1:len(timestamp) - len(timezoneSuffix)]
+            if (prefixNs is not None and timestamp[prefixLength:prefixLength + 1] == '.' and
+                    timestamp.endswith(timezoneSuffix) and fraction.isdigit() and len(fraction) <= 9):
+                appendResult(prefixNs + int(fraction) * fractionScale[len(fraction)])
+            else:
+                appendResult(self._parse(timestamp))
+                timezoneSuffix = self._timezone
+        return result
+
+    def _parse(self, timestamp: str) -> int:
+        prefix = timestamp[:TimestampParser._PREFIX_LENGTH]
+        remainder = timestamp[TimestampParser._PREFIX_LENGTH:]
+
+        fraction = ''
+        if remainder.startswith('.'):
+            fractionLength = len(remainder)
+            for timezoneSeparator in '+-Z':
+                pos = remainder.find(timezoneSeparator)
+                if 0 <= pos < fractionLength:
+                    fractionLength = pos
+            fraction = remainder[1:fractionLength][:9]
+            remainder = remainder[fractionLength:]
+
+        if remainder != self._timezone or len(self._prefixCache) >= TimestampParser._MAX_CACHE_SIZE:
+            self._prefixCache.clear()
+            self._timezone = remainder
+
+        prefixNs = self._prefixCache.get(prefix)
+        if prefixNs is None:
+            prefixNs = self._toNanoseconds(prefix + remainder)
+            self._prefixCache[prefix] = prefixNs
+
+        return prefixNs + (int(fraction) * TimestampParser._FRACTION_SCALE[len(fraction)] if fraction else 0)
+
+    @staticmethod
+    def _toNanoseconds(timestamp: str) -> int:
+        if timestamp.endswith('Z'):  # not supported by fromisoformat in python < 3.11
+            timestamp = timestamp[:-1] + '+00:00'
+        value = dt.fromisoformat(timestamp)
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return (value - _EPOCH) // _ONE_MICROSECOND * 1000
+
+
+class CsvCaptureReader:
+    """
+    Streams a logic analyzer capture in CSV format 'value,error,start,end,type' in chunks.
+
+    Only rows without error and of type 'data' are returned (all other rows are counted in skippedRows).
+    Timestamps are converted to integer nanoseconds, so the chunks can directly be decoded by an
+    OctetStreamDecoder configured with TimestampMode.Nanoseconds:
+
+        for chunk in CsvCaptureReader('capture.csv'):
+            messages = decoder.processOctets(*chunk)
+
+    Memory usage only depends on chunkSize (not on the size of the capture).
+    """
+
+    def __init__(self, filename: str, chunkSize: int = 65536):
+        self._filename: str = filename
+        self._chunkSize: int = chunkSize
+        self._skippedRows: int = 0
+        self._parseTimestamp: TimestampParser = TimestampParser()
+
+    @property
+    def filename(self) -> str:
+        return self._filename
+
+    @property
+    def skippedRows(self) -> int:
+        return self._skippedRows
+
+    def __iter__(self) -> Iterator[OctetChunk]:
+        return self.chunks()
+
+    def chunks(self) -> Iterator[OctetChunk]:
+        self._skippedRows = 0
+        with open(self._filename, newline="", encoding="utf-8") as file:
+            yield from self.readChunks(file)
+
+    def readChunks(self, lines) -> Iterator[OctetChunk]:
+        """Reads chunks from any iterable of CSV lines (e.g. an open file)."""
+        values: List[int] = []
+        startTimes: List[str] = []
+        endTimes: List[str] = []
+
+        for line in lines:
+            columns = line.split(',')
+            if len(columns) != 5:
+                if line.strip():
+                    self._skippedRows += 1
+                continue
+
+            value, error, start, end, typeStr = columns
+            if error.strip() or typeStr.strip() != 'data':
+                self._skippedRows += 1
+                continue
+
+            values.append(int(value))
+            startTimes.append(start.strip())
+            endTimes.append(end.strip())
+
+            if len(values) >= self._chunkSize:
+                yield self._createChunk(values, startTimes, endTimes)
+                values, startTimes, endTimes = [], [], []
+
+        if values:
+            yield self._createChunk(values, startTimes, endTimes)
+
+    def _createChunk(self, values: List[int], startTimes: List[str], endTimes: List[str]) -> OctetChunk:
+        # timestamps are converted per chunk (column-wise), which keeps the per-row work minimal
+        return OctetChunk(values, self._parseTimestamp.parseMany(startTimes), self._parseTimestamp.parseMany(endTimes))
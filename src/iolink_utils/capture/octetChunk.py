@@ -0,0 +1,21 @@
+from typing import NamedTuple, Sequence, Iterable, Iterator, Union
+
+from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder
+from iolink_utils.octetStreamDecoder.octetStreamDecoderMessages import MasterMessage, DeviceMessage
+
+
+class OctetChunk(NamedTuple):
+    """
+    A chunk of captured octets with integer timestamps (nanoseconds, see TimestampMode.Nanoseconds).
+    Can be passed directly to the batch decoder: decoder.processOctets(*chunk)
+    """
+    values: Sequence[int]
+    startTimes: Sequence[int]
+    endTimes: Sequence[int]
+
+
+def decodeChunks(chunks: Iterable[OctetChunk], decoder: OctetStreamDecoder) \
+        -> Iterator[Union[MasterMessage, DeviceMessage]]:
+    """Feeds all chunks into the decoder and yields the decoded messages."""
+    for chunk in chunks:
+        yield from decoder.processOctets(*chunk)
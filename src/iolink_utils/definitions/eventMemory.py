@@ -2,7 +2,7 @@ from enum import Flag, auto
 from typing import Tuple
 
 from iolink_utils.exceptions import InvalidEventMemoryAddress, InvalidEventStatusCode
-from iolink_utils.octetDecoder.octetDecoder import StatusCodeType2, EventQualifier
+from iolink_utils.octetDecoder.intOctetDecoder import StatusCodeType2, EventQualifier
 
 
 class Event:
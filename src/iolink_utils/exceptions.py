@@ -100,3 +100,19 @@ class InvalidISDUMessage(IOLinkUtilsException):
 
 class InvalidLengthInProcessDataParameter(IOLinkUtilsException):
     """Raised if value of length (ProcessDataIn / ProcessDataOut) is invalid"""
+
+
+class InvalidSampleRate(IOLinkUtilsException):
+    """Raised if sample rate is invalid (required for sample count timestamps)"""
+
+
+class InvalidCaptureFile(IOLinkUtilsException):
+    """Raised if a capture file has an invalid format (e.g. wrong magic or version)"""
+
+
+class SettingsInferenceFailed(IOLinkUtilsException):
+    """Raised if decoder settings cannot be inferred from the octet stream"""
+
+
+class InvalidVariableData(IOLinkUtilsException):
+    """Raised if data does not match the datatype of an IODD variable (e.g. wrong length)"""
@@ -1,5 +1,21 @@
-from typing import Dict
-from dataclasses import dataclass
+from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Datatype:
+    xsiType: str = ""  # e.g. 'UIntegerT', 'StringT', 'RecordT'
+    bitLength: int = 0  # StringT/OctetStringT: fixedLength (max length) in bits
+    encoding: str = ""  # StringT only
+    items: List["DatatypeItem"] = field(default_factory=list)  # RecordT/ArrayT only
+
+
+@dataclass
+class DatatypeItem:
+    subIndex: int = 0
+    bitOffset: int = 0  # offset of the least significant bit (0: last bit of the last octet)
+    name: str = ""
+    datatype: Datatype = field(default_factory=Datatype)
 
 
 @dataclass
@@ -7,6 +23,7 @@ class Variable:
     id: str = ""
     index: int = 0
     name: str = ""
+    datatype: Optional[Datatype] = None
 
 
 standardVariableCollection: Dict[int, Variable] = {
@@ -1,4 +1,4 @@
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Optional
 import xml.etree.ElementTree as elTree
 from datetime import date
 
@@ -6,7 +6,7 @@ from .iodd_documentInfo import DocumentInfo
 from .iodd_identity import Identity, DeviceVariant
 from .iodd_features import Features
 from .iodd_physical_layer import PhysicalLayer
-from .iodd_variableCollection import Variable
+from .iodd_variableCollection import Variable, Datatype, DatatypeItem
 
 from iolink_utils.exceptions import UnsupportedComplexDataType, UnsupportedSimpleDataType
 from iolink_utils.utils.version import Version
@@ -122,6 +122,11 @@ class IoddXmlDoc:
             variable.id = xml_variable.get("id")
             variable.index = int(xml_variable.get("index"))
             variable.name = self._getTextForTextID(xml_variable.find('iolink:Name', self._namespaces).get('textId'))
+            try:
+                variable.datatype = self._getVariableDatatype(self._getDatatype(xml_variable))
+            except (AttributeError, TypeError, ValueError):
+                # incomplete datatype definition (e.g. missing attributes): variable has no decoder
+                variable.datatype = None
 
             variableCollection[variable.index] = variable
 
@@ -176,6 +181,48 @@ class IoddXmlDoc:
                 return el
         return None
 
+    def _getVariableDatatype(self, xmlDatatype) -> Optional[Datatype]:
+        # None: no datatype or datatype not resolvable (e.g. DatatypeRef to an unknown datatype)
+        xsiType = None if xmlDatatype is None else xmlDatatype.get(f"{{{self._namespaces['xsi']}}}type")
+        if xsiType is None:
+            return None
+
+        if xsiType == 'RecordT':
+            items = []
+            for recordItem in xmlDatatype.findall("iolink:RecordItem", self._namespaces):
+                datatype = self._getVariableDatatype(self._getDatatype(recordItem))
+                if datatype is None:
+                    return None
+                items.append(DatatypeItem(
+                    subIndex=int(recordItem.get("subindex")),
+                    bitOffset=int(recordItem.get("bitOffset")),
+                    name=self._getTextForTextID(recordItem.find('iolink:Name', self._namespaces).get('textId')),
+                    datatype=datatype
+                ))
+            return Datatype(xsiType=xsiType, bitLength=int(xmlDatatype.get("bitLength")), items=items)
+
+        if xsiType == 'ArrayT':
+            count = int(xmlDatatype.get('count'))
+            element = self._getVariableDatatype(self._getDatatype(xmlDatatype))
+            if element is None:
+                return None
+            # element with subindex 1 is transmitted first (highest bit offset)
+            items = [DatatypeItem(subIndex=subIndex, bitOffset=(count - subIndex) * element.bitLength, datatype=element)
+                     for subIndex in range(1, count + 1)]
+            return Datatype(xsiType=xsiType, bitLength=count * element.bitLength, items=items)
+
+        if xsiType == 'BooleanT':
+            bitLength = 1
+        elif xsiType == 'Float32T':
+            bitLength = 32
+        elif xsiType in ('StringT', 'OctetStringT'):
+            bitLength = int(xmlDatatype.get("fixedLength")) * 8
+        elif xsiType in ('TimeT', 'TimeSpanT'):
+            bitLength = 64
+        else:
+            bitLength = int(xmlDatatype.get("bitLength", 0))
+        return Datatype(xsiType=xsiType, bitLength=bitLength, encoding=xmlDatatype.get("encoding", ""))
+
     def _getProcessDataInOutAsJSON(self, xmlProcessData):
         textId = xmlProcessData.find('iolink:Name', self._namespaces).get('textId')
         dataType = self._getDatatype(xmlProcessData)
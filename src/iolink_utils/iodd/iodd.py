@@ -1,6 +1,7 @@
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 from .iodd_fileInfo import IoddFileInfo
+from .iodd_variableDecoder import VariableDecoders
 from ._internal.iodd_documentInfo import DocumentInfo
 from ._internal.iodd_identity import Identity
 from ._internal.iodd_features import Features
@@ -28,6 +29,7 @@ class Iodd:
             self._physicalLayer: PhysicalLayer = ioddXmlDoc.getPhysicalLayer()
             self._processDataDefinition: Dict = ioddXmlDoc.getProcessDataDefinition()
             self._variableCollection: Dict[int, Variable] = ioddXmlDoc.getVariableCollection()
+            self._variableDecoders: Optional[VariableDecoders] = None  # created on first use
         else:
             # e.g. language file
             raise InvalidIoddFile(f"Expected IODevice inside XML file, got {ioddXmlDoc.docType}.")  # pragma: no cover
@@ -56,6 +58,13 @@ class Iodd:
     def variableCollection(self) -> Dict[int, Variable]:
         return self._variableCollection
 
+    @property
+    def variableDecoders(self) -> VariableDecoders:
+        """Decoders for the ISDU data of all variables (see VariableDecoders)."""
+        if self._variableDecoders is None:
+            self._variableDecoders = VariableDecoders(self._variableCollection)
+        return self._variableDecoders
+
     @property
     def standardVariableCollection(self) -> Dict[int, Variable]:
         return standardVariableCollection
@@ -0,0 +1,148 @@
+from typing import Any, Callable, Dict, Optional, Tuple
+import struct
+
+from ._internal.iodd_variableCollection import Variable, Datatype
+
+from iolink_utils.exceptions import InvalidVariableData
+
+
+VariableDecoder = Callable[[bytes], Any]  # decodes the ISDU data of a variable (or of one of its subindices)
+
+_float32 = struct.Struct('>f')
+
+
+def _octetCount(bitLength: int) -> int:
+    return (bitLength + 7) // 8
+
+
+def _createValueConverter(datatype: Datatype) -> Optional[Callable[[int], Any]]:
+    # converts the bits of a numeric value (None: not a numeric type)
+    bitLength = datatype.bitLength
+    if datatype.xsiType == 'BooleanT':
+        return bool
+    if datatype.xsiType == 'UIntegerT':
+        return int
+    if datatype.xsiType == 'IntegerT':
+        signBit = 1 << (bitLength - 1)
+        return lambda value: (value ^ signBit) - signBit
+    if datatype.xsiType == 'Float32T':
+        return lambda value: _float32.unpack(value.to_bytes(4, 'big'))[0]
+    return None
+
+
+def _createOctetsConverter(datatype: Datatype) -> Callable[[bytes], Any]:
+    if datatype.xsiType == 'StringT':
+        encoding = 'ascii' if datatype.encoding.upper() == 'US-ASCII' else (datatype.encoding or 'utf-8')
+        return lambda data: bytes(data).rstrip(b'\x00').decode(encoding, errors='replace')
+    return bytes  # OctetStringT and types without a decoder (e.g. TimeT): raw octets
+
+
+def _createSimpleDecoder(datatype: Datatype) -> VariableDecoder:
+    octetCount = _octetCount(datatype.bitLength)
+    convertValue = _createValueConverter(datatype)
+
+    if convertValue is None:
+        convertOctets = _createOctetsConverter(datatype)
+        if datatype.xsiType in ('StringT', 'OctetStringT'):  # variable length up to fixedLength
+            def decodeOctets(data: bytes) -> Any:
+                if len(data) > octetCount:
+                    raise InvalidVariableData(f"{datatype.xsiType}: {len(data)} octets (max {octetCount})")
+                return convertOctets(data)
+            return decodeOctets
+        return convertOctets
+
+    mask = (1 << datatype.bitLength) - 1
+
+    def decodeValue(data: bytes) -> Any:
+        if len(data) != octetCount:
+            raise InvalidVariableData(f"{datatype.xsiType}: {len(data)} octets (expected {octetCount})")
+        return convertValue(int.from_bytes(data, 'big') & mask)
+    return decodeValue
+
+
+def _createItemExtractor(datatype: Datatype, bitOffset: int, totalBitLength: int) -> Callable[[int, bytes], Any]:
+    # extracts an item from the data of a complete record/array (value: data as int)
+    convertValue = _createValueConverter(datatype)
+    if convertValue is not None:
+        mask = (1 << datatype.bitLength) - 1
+        return lambda value, data: convertValue((value >> bitOffset) & mask)
+
+    # octet based types are octet aligned
+    convertOctets = _createOctetsConverter(datatype)
+    end = _octetCount(totalBitLength) - bitOffset // 8
+    begin = end - _octetCount(datatype.bitLength)
+    return lambda value, data: convertOctets(data[begin:end])
+
+
+def _createComplexDecoder(datatype: Datatype) -> VariableDecoder:
+    octetCount = _octetCount(datatype.bitLength)
+    extractors = [(item.subIndex, _createItemExtractor(item.datatype, item.bitOffset, datatype.bitLength))
+                  for item in datatype.items]
+
+    def checkLength(data: bytes):
+        if len(data) != octetCount:
+            raise InvalidVariableData(f"{datatype.xsiType}: {len(data)} octets (expected {octetCount})")
+
+    if datatype.xsiType == 'ArrayT':
+        arrayExtractors = [extract for _, extract in extractors]
+
+        def decodeArray(data: bytes) -> list:
+            checkLength(data)
+            value = int.from_bytes(data, 'big')
+            return [extract(value, data) for extract in arrayExtractors]
+        return decodeArray
+
+    def decodeRecord(data: bytes) -> Dict[int, Any]:
+        checkLength(data)
+        value = int.from_bytes(data, 'big')
+        return {subIndex: extract(value, data) for subIndex, extract in extractors}
+    return decodeRecord
+
+
+def createVariableDecoders(variable: Variable) -> Dict[Tuple[int, int], VariableDecoder]:
+    """
+    :return: decoders of the variable (subindex 0) and of all its record items/array elements
+        (accessed by subindex), keyed by (index, subindex)
+    """
+    datatype = variable.datatype
+    if datatype is None:
+        return {}
+    if datatype.xsiType not in ('RecordT', 'ArrayT'):
+        return {(variable.index, 0): _createSimpleDecoder(datatype)}
+
+    decoders = {(variable.index, 0): _createComplexDecoder(datatype)}
+    for item in datatype.items:
+        decoders[(variable.index, item.subIndex)] = _createSimpleDecoder(item.datatype)
+    return decoders
+
+
+class VariableDecoders:
+    """
+    Decoders for the ISDU data of all variables of an IODD, created once and looked up by index and subindex:
+
+        decoders = iodd.variableDecoders
+        value = decoders.decode(index, subIndex, data)
+
+    Values are int, bool, float, str (StringT), bytes (OctetStringT and types without decoder, e.g. TimeT),
+    dict {subindex: value} (RecordT) or list (ArrayT).
+    """
+
+    def __init__(self, variables: Dict[int, Variable]):
+        self._decoders: Dict[Tuple[int, int], VariableDecoder] = {}
+        for variable in variables.values():
+            self._decoders.update(createVariableDecoders(variable))
+
+    def decoder(self, index: int, subIndex: int = 0) -> Optional[VariableDecoder]:
+        """:return: decoder of the variable (None: unknown index/subindex or variable without datatype)"""
+        return self._decoders.get((index, subIndex))
+
+    def decode(self, index: int, subIndex: int, data: bytes) -> Any:
+        """
+        :return: decoded value (None: no decoder for index/subindex)
+        :raises InvalidVariableData: data does not match the datatype (e.g. wrong length)
+        """
+        decoder = self._decoders.get((index, subIndex))
+        return None if decoder is None else decoder(data)
+
+    def __len__(self) -> int:
+        return len(self._decoders)
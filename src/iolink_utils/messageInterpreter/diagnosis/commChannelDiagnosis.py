@@ -1,6 +1,6 @@
 from datetime import datetime as dt
 from enum import IntEnum
-from typing import Union
+from typing import Optional, Union
 
 from iolink_utils.exceptions import UnexpectedMasterMessageReceived
 from iolink_utils.octetStreamDecoder.octetStreamDecoderMessages import DeviceMessage, MasterMessage
@@ -29,6 +29,30 @@ class CommChannelDiagnosis:
         self._state = CommChannelDiagnosis.State.Idle
 
     def handleMasterMessage(self, message: MasterMessage):
+        if not self._updateMasterState(message):
+            # we stay in idle -> device message will be discarded
+            raise UnexpectedMasterMessageReceived(
+                f"Diagnosis: in Idle: {TransmissionDirection(message.mc.read).name} address {self._eventMemoryIndex}")
+
+    def handleDeviceMessage(self, message: DeviceMessage) \
+            -> Union[None, TransactionDiagEventMemory, TransactionDiagEventReset]:
+        finishedState = self._updateDeviceState(message)
+
+        if finishedState == CommChannelDiagnosis.State.ReadEventMemory:
+            return TransactionDiagEventMemory(self._startTime, self._endTime, self._eventMemory)
+        elif finishedState == CommChannelDiagnosis.State.ResetEventFlag:
+            return TransactionDiagEventReset(self._startTime, self._endTime)
+        return None
+
+    # channel filtered out (see MessageInterpreter channels): state is kept, transactions and errors are dropped
+    def trackMasterMessage(self, message: MasterMessage) -> None:
+        self._updateMasterState(message)
+
+    def trackDeviceMessage(self, message: DeviceMessage) -> None:
+        self._updateDeviceState(message)
+
+    def _updateMasterState(self, message: MasterMessage) -> bool:
+        """:return: False if the master message is unexpected"""
         self._eventMemoryIndex = message.mc.address
 
         if self._state == CommChannelDiagnosis.State.Idle:
@@ -43,23 +67,21 @@ class CommChannelDiagnosis:
             elif direction == TransmissionDirection.Write and self._eventMemoryIndex == 0:
                 self._state = CommChannelDiagnosis.State.ResetEventFlag
             else:
-                # we stay in idle -> device message will be discarded
-                raise UnexpectedMasterMessageReceived(
-                    f"Diagnosis: in Idle: {direction.name} address {self._eventMemoryIndex}")
+                return False
+        return True
 
-    def handleDeviceMessage(self, message: DeviceMessage) \
-            -> Union[None, TransactionDiagEventMemory, TransactionDiagEventReset]:
-
-        if self._state == CommChannelDiagnosis.State.ReadEventMemory:
+    def _updateDeviceState(self, message: DeviceMessage) -> Optional["CommChannelDiagnosis.State"]:
+        """:return: state of the finished transaction (None: nothing finished)"""
+        state = self._state
+        if state == CommChannelDiagnosis.State.ReadEventMemory:
             self._endTime = message.endTime
             self._eventMemory.setMemory(self._eventMemoryIndex, message.od[0])
-
-            if self._eventMemory.isComplete():
-                self._state = CommChannelDiagnosis.State.Idle
-                return TransactionDiagEventMemory(self._startTime, self._endTime, self._eventMemory)
-
-        elif self._state == CommChannelDiagnosis.State.ResetEventFlag:
+            if not self._eventMemory.isComplete():
+                return None
+        elif state == CommChannelDiagnosis.State.ResetEventFlag:
             self._endTime = message.endTime
-            self._state = CommChannelDiagnosis.State.Idle
-            return TransactionDiagEventReset(self._startTime, self._endTime)
-        # else we didn't expect anything -> discard
+        else:
+            return None  # we didn't expect anything -> discard
+
+        self._state = CommChannelDiagnosis.State.Idle
+        return state
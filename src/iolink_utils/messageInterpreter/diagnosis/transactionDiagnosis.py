@@ -8,6 +8,8 @@ from iolink_utils.messageInterpreter.transaction import Transaction
 
 
 class TransactionDiagEventMemory(Transaction):
+    __slots__ = ('eventMemory',)
+
     def __init__(self, startTime: dt, endTime: dt, eventMemory: EventMemory):
         super().__init__()
         self.setTime(startTime, endTime)
@@ -45,6 +47,8 @@ class TransactionDiagEventMemory(Transaction):
 
 
 class TransactionDiagEventReset(Transaction):
+    __slots__ = ()
+
     def __init__(self, startTime: dt, endTime: dt):
         super().__init__()
         self.setTime(startTime, endTime)
@@ -1,5 +1,6 @@
 from datetime import datetime as dt
 from abc import abstractmethod
+from typing import Optional
 
 from iolink_utils.exceptions import InvalidISDUService
 from iolink_utils.definitions.iServiceNibble import IServiceNibble
@@ -8,15 +9,35 @@ from iolink_utils.messageInterpreter.transaction import Transaction
 
 
 class ISDU(Transaction):
+    """
+    ISDU reassembled from the on-request data of several M-sequences.
+
+    As soon as the length is known (I-Service, extended length), the buffer is allocated with the final size
+    (max 238 octets) and segments are written into it. The check byte is updated per segment, so reassembly
+    costs O(total length) and completion is detected in O(1).
+    """
+    __slots__ = ('_service', '_buffer', '_length', '_targetLength', '_checkByte', '_chkpdu', '_isValid', '_isComplete')
+
+    _HEADER_LENGTH = 2  # I-Service and (optional) extended length
+
     def __init__(self):
         super().__init__()
 
-        self._service: IService = IService()
-        self._rawData: bytearray = bytearray()
+        self._service: IService = IService.decode(0)
+        self._buffer: bytearray = bytearray()
+        self._length: int = 0  # number of octets received (written to the buffer)
+        self._targetLength: Optional[int] = None  # None until the header has been received
+        self._checkByte: int = 0  # XOR of all received octets (incl. chkpdu)
         self._chkpdu: int = 0
         self._isValid: bool = False
         self._isComplete: bool = False
 
+    def _recycle(self) -> None:
+        # initial state for reuse by ISDUPool, the buffer keeps its allocation (stale octets are overwritten)
+        buffer = self._buffer
+        self.__init__()
+        self._buffer = buffer
+
     @property
     def isValid(self) -> bool:
         return self._isValid
@@ -25,6 +46,11 @@ class ISDU(Transaction):
     def isComplete(self) -> bool:
         return self._isComplete
 
+    @property
+    def _rawData(self) -> bytearray:
+        # complete ISDU: the buffer itself (no copy)
+        return self._buffer if self._length == len(self._buffer) else self._buffer[:self._length]
+
     def setEndTime(self, endTime: dt):
         self.endTime = endTime
 
@@ -33,40 +59,67 @@ class ISDU(Transaction):
 
     def _getTotalLength(self):
         if self._hasExtendedLength():
-            return int(self._rawData[1]) if len(self._rawData) > 1 else 0xFF
+            return int(self._buffer[1]) if self._length > 1 else 0xFF
         else:
             return self._service.length
 
     def _calculateCheckByte(self) -> int:
-        chk = 0
-        for octet in self._rawData[:-1]:  # except chkpdu which is last byte
-            chk ^= octet
-        return chk
-
-    def _updateInternalData(self):
-        if len(self._rawData) > 0:
-            self._service = IService(int(self._rawData[0]))
-            if self._SERVICE_NIBBLE != self._service.service:
-                raise InvalidISDUService(f"Service value {hex(self._service.service)} not expected ({self._SERVICE_NIBBLE})")
-
-        targetLength = self._getTotalLength()
-        if len(self._rawData) >= targetLength:
-            self._rawData = self._rawData[:targetLength]
-            self._chkpdu = self._rawData[-1]
-            self._isValid = self._chkpdu == self._calculateCheckByte()
+        return self._checkByte ^ self._chkpdu  # running XOR of all octets except chkpdu
+
+    def _updateHeader(self):
+        self._service = IService.decode(self._buffer[0])
+        if self._SERVICE_NIBBLE != self._service.service:
+            raise InvalidISDUService(f"Service value {hex(self._service.service)} not expected ({self._SERVICE_NIBBLE})")
+
+        self._targetLength = None if self._hasExtendedLength() and self._length < 2 else self._getTotalLength()
+        if self._targetLength is None:
+            return
+
+        # preallocate the complete ISDU, octets beyond its length are dropped
+        targetLength = self._targetLength
+        if self._length > targetLength:
+            for octet in self._buffer[targetLength:self._length]:
+                self._checkByte ^= octet
+            self._length = targetLength
+        if len(self._buffer) < targetLength:
+            self._buffer.extend(bytes(targetLength - len(self._buffer)))
+        elif len(self._buffer) > targetLength:
+            del self._buffer[targetLength:]
+
+    def _writeOctets(self, position: int, octets):
+        if self._targetLength is not None:
+            octets = octets[:max(self._targetLength - position, 0)]
+        end = position + len(octets)
+        if end > len(self._buffer):  # only while the header is incomplete
+            self._buffer.extend(bytes(end - len(self._buffer)))
+
+        checkByte = self._checkByte
+        for octet in self._buffer[position:min(end, self._length)]:  # replaced octets
+            checkByte ^= octet
+        for octet in octets:
+            checkByte ^= octet
+        self._checkByte = checkByte
+        self._buffer[position:end] = octets
+        self._length = max(self._length, end)
+
+        if position < ISDU._HEADER_LENGTH:
+            self._updateHeader()
+
+        targetLength = self._targetLength
+        if targetLength is not None and self._length >= targetLength:
+            self._chkpdu = self._buffer[targetLength - 1]
+            self._isValid = self._checkByte == 0  # chkpdu == XOR of all other octets
             self._isComplete = True
             self._onFinished()  # calls derived class to finish its data
 
     def replaceTrailingOctets(self, requestData: bytearray):
         lengthToReplace = len(requestData)
         if lengthToReplace > 0:
-            self._rawData[-lengthToReplace:] = requestData
-            self._updateInternalData()
+            self._writeOctets(max(self._length - lengthToReplace, 0), requestData)
 
     def appendOctets(self, requestData: bytearray):
         if len(requestData) > 0:
-            self._rawData.extend(requestData)
-            self._updateInternalData()
+            self._writeOctets(self._length, requestData)
 
     def dispatch(self, handler):
         return handler.handleISDU(self)
@@ -0,0 +1,65 @@
+from typing import Any, Dict, Union
+from datetime import timedelta
+
+from iolink_utils.definitions.iServiceNibble import IServiceNibble
+from iolink_utils.definitions.transmissionDirection import TransmissionDirection
+from iolink_utils.messageInterpreter.transaction import Transaction
+from iolink_utils.messageInterpreter.isdu.ISDU import ISDU
+from iolink_utils.messageInterpreter.isdu.ISDUerrors import IsduError
+
+Latency = Union[timedelta, int]
+
+
+class ISDUExchange(Transaction):
+    """
+    ISDU request and its response as one transaction (see CommChannelISDU exchanges).
+
+    startTime is the start of the request, endTime the end of the response. latency is the time from the end of
+    the request to the start of the M-sequence with the first response octets (i.e. the time the device was busy),
+    a timedelta or an int in the unit of the timestamps (see TimestampMode).
+    """
+    __slots__ = ('direction', 'index', 'subIndex', 'payload', 'isduError', 'isValid', 'isSuccess', 'latency', 'value')
+
+    def __init__(self, request: ISDU, response: ISDU):
+        """
+        :param request: complete request (the exchange does not keep a reference, request may be recycled)
+        :param response: complete response (see request)
+        """
+        super().__init__()
+        self.setTime(request.startTime, response.endTime)
+
+        # bit 3 of the I-Service nibble: read request (see Table A.12)
+        self.direction: TransmissionDirection = \
+            TransmissionDirection.Read if request._SERVICE_NIBBLE & 0b1000 else TransmissionDirection.Write
+        self.index: int = getattr(request, 'index', 0)
+        self.subIndex: int = getattr(request, 'subIndex', 0)
+        # written data (write request) or read data (read response)
+        self.payload: bytes = bytes((request if self.direction == TransmissionDirection.Write else response)
+                                    .data().get('data', b''))
+        self.isduError: IsduError = getattr(response, 'isduError', IsduError.UNDEFINED)  # UNDEFINED: no error
+        self.isValid: bool = request.isValid and response.isValid
+        # positive response of the requested service (a negative response may have error codes 0/0 = UNDEFINED)
+        positiveResponse = IServiceNibble.D_ReadResp_P if self.direction == TransmissionDirection.Read \
+            else IServiceNibble.D_WriteResp_P
+        self.isSuccess: bool = self.isValid and response._SERVICE_NIBBLE == positiveResponse
+        self.latency: Latency = response.startTime - request.endTime
+        self.value: Any = None  # decoded payload (see transactionStream.decodeISDUPayloads)
+
+    def data(self) -> Dict:
+        return {
+            'valid': self.isValid,
+            'success': self.isSuccess,
+            'direction': self.direction.name,
+            'index': self.index,
+            'subIndex': self.subIndex,
+            'data': self.payload,
+            'error': self.isduError.name,
+            'latency': self.latency,
+            'value': self.value
+        }
+
+    def dispatch(self, handler):
+        return handler.handleISDUExchange(self)
+
+    def __str__(self):  # pragma: no cover
+        return f"ISDUExchange({', '.join(f'{name}={value}' for name, value in self.data().items())})"
@@ -13,24 +13,11 @@ class FlowControl:
         Abort = 4
 
     def __init__(self, value: int = 0x11):
-        self._state = FlowControl.State.Invalid
-        self._value = FlowControl.INVALID_VALUE
-
-        # See Table 52 – FlowCTRL definitions
-        mappings = [
-            (range(0x00, 0x10), FlowControl.State.Count),  # 0x00–0x0F
-            ([0x10], FlowControl.State.Start),
-            ([0x11, 0x12], FlowControl.State.Idle),
-            ([0x1F], FlowControl.State.Abort),
-        ]
-
-        for key_range, state in mappings:
-            if value in key_range:
-                self._state = state
-                self._value = value
-                return
-
-        raise InvalidFlowControlValue(f"Invalid ISDU FlowControl value: {hex(value)}")
+        state = _STATE_BY_VALUE.get(value)
+        if state is None:
+            raise InvalidFlowControlValue(f"Invalid ISDU FlowControl value: {hex(value)}")
+        self._state = state
+        self._value = value
 
     def __eq__(self, other):
         if not isinstance(other, FlowControl):
@@ -59,3 +46,13 @@ class FlowControl:
         new._state = self._state
         new._value = self._value
         return new
+
+
+# See Table 52 – FlowCTRL definitions
+_STATE_BY_VALUE = {
+    **{value: FlowControl.State.Count for value in range(0x00, 0x10)},  # 0x00–0x0F
+    0x10: FlowControl.State.Start,
+    0x11: FlowControl.State.Idle,
+    0x12: FlowControl.State.Idle,
+    0x1F: FlowControl.State.Abort,
+}
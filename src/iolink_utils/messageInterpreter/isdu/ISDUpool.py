@@ -0,0 +1,49 @@
+from typing import Dict, List, Type, TypeVar
+
+from iolink_utils.messageInterpreter.transaction import Transaction
+from iolink_utils.messageInterpreter.isdu.ISDU import ISDU
+
+ISDUType = TypeVar('ISDUType', bound=ISDU)
+
+
+class ISDUPool:
+    """
+    Recycles ISDU objects instead of creating new ones for every request/response (e.g. commissioning
+    traces with thousands of ISDUs). An ISDU returned by the interpreter belongs to the consumer until it
+    is released; afterwards it must not be used anymore:
+
+        pool = ISDUPool()
+        interpreter = MessageInterpreter(isduPool=pool)
+        for transaction in interpreter.processMessages(messages):
+            store(transaction.data())
+            pool.release(transaction)
+    """
+
+    def __init__(self, maxSize: int = 16):
+        """
+        :param maxSize: max number of released objects kept per ISDU class
+        """
+        self._maxSize: int = maxSize
+        self._free: Dict[type, List[ISDU]] = {}
+
+    def acquire(self, isduClass: Type[ISDUType]) -> ISDUType:
+        """Released object of isduClass in its initial state (new object if none is available)."""
+        free = self._free.get(isduClass)
+        return free.pop() if free else isduClass()
+
+    def release(self, transaction: Transaction) -> None:
+        """
+        Returns an ISDU to the pool (other transactions are ignored, so every transaction can be released).
+        """
+        if not isinstance(transaction, ISDU):
+            return
+
+        free = self._free.setdefault(type(transaction), [])
+        if len(free) >= self._maxSize or any(isdu is transaction for isdu in free):  # full or released twice
+            return
+        transaction._recycle()
+        free.append(transaction)
+
+    def __len__(self) -> int:
+        """Number of released objects available."""
+        return sum(len(free) for free in self._free.values())
@@ -1,7 +1,10 @@
+from typing import List, Optional, Type
+
 from iolink_utils.exceptions import InvalidISDUService
 from iolink_utils.octetDecoder.octetDecoder import IService
 from iolink_utils.definitions.iServiceNibble import IServiceNibble
 from iolink_utils.messageInterpreter.isdu.ISDU import ISDU
+from iolink_utils.messageInterpreter.isdu.ISDUpool import ISDUPool
 
 
 #
@@ -10,6 +13,7 @@ from iolink_utils.messageInterpreter.isdu.ISDU import ISDU
 
 class ISDURequest_Write8bitIdx(ISDU):
     _SERVICE_NIBBLE: IServiceNibble = IServiceNibble.M_WriteReq_8bitIdx
+    __slots__ = ('index',)
 
     def __init__(self):
         super().__init__()
@@ -29,6 +33,7 @@ class ISDURequest_Write8bitIdx(ISDU):
 
 class ISDURequest_Write8bitIdxSub(ISDU):
     _SERVICE_NIBBLE: IServiceNibble = IServiceNibble.M_WriteReq_8bitIdxSub
+    __slots__ = ('index', 'subIndex')
 
     def __init__(self):
         super().__init__()
@@ -51,6 +56,7 @@ class ISDURequest_Write8bitIdxSub(ISDU):
 
 class ISDURequest_Write16bitIdxSub(ISDU):
     _SERVICE_NIBBLE: IServiceNibble = IServiceNibble.M_WriteReq_16bitIdxSub
+    __slots__ = ('index', 'subIndex')
 
     def __init__(self):
         super().__init__()
@@ -77,6 +83,7 @@ class ISDURequest_Write16bitIdxSub(ISDU):
 
 class ISDURequest_Read8bitIdx(ISDU):
     _SERVICE_NIBBLE: IServiceNibble = IServiceNibble.M_ReadReq_8bitIdx
+    __slots__ = ('index',)
 
     def __init__(self):
         super().__init__()
@@ -97,6 +104,7 @@ class ISDURequest_Read8bitIdx(ISDU):
 
 class ISDURequest_Read8bitIdxSub(ISDU):
     _SERVICE_NIBBLE: IServiceNibble = IServiceNibble.M_ReadReq_8bitIdxSub
+    __slots__ = ('index', 'subIndex')
 
     def __init__(self):
         super().__init__()
@@ -120,6 +128,7 @@ class ISDURequest_Read8bitIdxSub(ISDU):
 
 class ISDURequest_Read16bitIdxSub(ISDU):
     _SERVICE_NIBBLE: IServiceNibble = IServiceNibble.M_ReadReq_16bitIdxSub
+    __slots__ = ('index', 'subIndex')
 
     def __init__(self):
         super().__init__()
@@ -141,17 +150,42 @@ class ISDURequest_Read16bitIdxSub(ISDU):
         }
 
 
-def createISDURequest(iService: IService):
-    _req_map = {
-        IServiceNibble.M_WriteReq_8bitIdx: ISDURequest_Write8bitIdx,
-        IServiceNibble.M_WriteReq_8bitIdxSub: ISDURequest_Write8bitIdxSub,
-        IServiceNibble.M_WriteReq_16bitIdxSub: ISDURequest_Write16bitIdxSub,
-        IServiceNibble.M_ReadReq_8bitIdx: ISDURequest_Read8bitIdx,
-        IServiceNibble.M_ReadReq_8bitIdxSub: ISDURequest_Read8bitIdxSub,
-        IServiceNibble.M_ReadReq_16bitIdxSub: ISDURequest_Read16bitIdxSub,
-    }
+# request classes indexed by the raw I-Service nibble (see registerISDURequest)
+_requestClasses: List[Optional[Type[ISDU]]] = [None] * 16
+
+
+def registerISDURequest(isduClass: Type[ISDU]) -> Type[ISDU]:
+    """
+    Registers the class created for requests with its _SERVICE_NIBBLE (e.g. a vendor-specific service).
+    An already registered class of this nibble is replaced. Can be used as class decorator.
+
+    :raises InvalidISDUService: nibble is out of range or NoService
+    """
+    nibble = int(isduClass._SERVICE_NIBBLE)
+    if not 0 < nibble < len(_requestClasses):
+        raise InvalidISDUService(f"Invalid request nibble: {nibble}")
+    _requestClasses[nibble] = isduClass
+    return isduClass
 
-    if iService.service not in _req_map:
+
+for _isduClass in (ISDURequest_Write8bitIdx, ISDURequest_Write8bitIdxSub, ISDURequest_Write16bitIdxSub,
+                   ISDURequest_Read8bitIdx, ISDURequest_Read8bitIdxSub, ISDURequest_Read16bitIdxSub):
+    registerISDURequest(_isduClass)
+
+
+def getISDURequestClass(iService: IService) -> Type[ISDU]:
+    """
+    :raises InvalidISDUService: no class registered for the I-Service nibble (see registerISDURequest)
+    """
+    isduClass = _requestClasses[iService.service]
+    if isduClass is None:
         raise InvalidISDUService(f"Invalid request nibble: {iService}")
+    return isduClass
+
 
-    return _req_map[iService.service]()
+def createISDURequest(iService: IService, pool: Optional[ISDUPool] = None) -> ISDU:
+    """
+    :param pool: recycle released ISDU objects (None: a new object is created)
+    """
+    isduClass = getISDURequestClass(iService)
+    return isduClass() if pool is None else pool.acquire(isduClass)
@@ -1,7 +1,10 @@
+from typing import List, Optional, Type
+
 from iolink_utils.exceptions import InvalidISDUService
 from iolink_utils.octetDecoder.octetDecoder import IService
 from iolink_utils.definitions.iServiceNibble import IServiceNibble
 from iolink_utils.messageInterpreter.isdu.ISDU import ISDU
+from iolink_utils.messageInterpreter.isdu.ISDUpool import ISDUPool
 from iolink_utils.exceptions import UnknownISDUError
 from iolink_utils.messageInterpreter.isdu.ISDUerrors import IsduError
 
@@ -12,6 +15,7 @@ from iolink_utils.messageInterpreter.isdu.ISDUerrors import IsduError
 
 class ISDUResponse_WriteResp_M(ISDU):
     _SERVICE_NIBBLE: IServiceNibble = IServiceNibble.D_WriteResp_M
+    __slots__ = ('errorCode', 'additionalCode', 'isduError')
 
     def __init__(self):
         super().__init__()
@@ -41,6 +45,7 @@ class ISDUResponse_WriteResp_M(ISDU):
 
 class ISDUResponse_WriteResp_P(ISDU):
     _SERVICE_NIBBLE: IServiceNibble = IServiceNibble.D_WriteResp_P
+    __slots__ = ()
 
     def __init__(self):
         super().__init__()
@@ -61,6 +66,7 @@ class ISDUResponse_WriteResp_P(ISDU):
 
 class ISDUResponse_ReadResp_M(ISDU):
     _SERVICE_NIBBLE: IServiceNibble = IServiceNibble.D_ReadResp_M
+    __slots__ = ('errorCode', 'additionalCode', 'isduError')
 
     def __init__(self):
         super().__init__()
@@ -90,6 +96,7 @@ class ISDUResponse_ReadResp_M(ISDU):
 
 class ISDUResponse_ReadResp_P(ISDU):
     _SERVICE_NIBBLE: IServiceNibble = IServiceNibble.D_ReadResp_P
+    __slots__ = ()
 
     def __init__(self):
         super().__init__()
@@ -104,15 +111,42 @@ class ISDUResponse_ReadResp_P(ISDU):
         }
 
 
-def createISDUResponse(iService: IService):
-    _req_map = {
-        IServiceNibble.D_WriteResp_M: ISDUResponse_WriteResp_M,
-        IServiceNibble.D_WriteResp_P: ISDUResponse_WriteResp_P,
-        IServiceNibble.D_ReadResp_M: ISDUResponse_ReadResp_M,
-        IServiceNibble.D_ReadResp_P: ISDUResponse_ReadResp_P,
-    }
+# response classes indexed by the raw I-Service nibble (see registerISDUResponse)
+_responseClasses: List[Optional[Type[ISDU]]] = [None] * 16
+
+
+def registerISDUResponse(isduClass: Type[ISDU]) -> Type[ISDU]:
+    """
+    Registers the class created for responses with its _SERVICE_NIBBLE (e.g. a vendor-specific service).
+    An already registered class of this nibble is replaced. Can be used as class decorator.
+
+    :raises InvalidISDUService: nibble is out of range or NoService
+    """
+    nibble = int(isduClass._SERVICE_NIBBLE)
+    if not 0 < nibble < len(_responseClasses):
+        raise InvalidISDUService(f"Invalid response nibble: {nibble}")
+    _responseClasses[nibble] = isduClass
+    return isduClass
 
-    if iService.service not in _req_map:
+
+for _isduClass in (ISDUResponse_WriteResp_M, ISDUResponse_WriteResp_P, ISDUResponse_ReadResp_M,
+                   ISDUResponse_ReadResp_P):
+    registerISDUResponse(_isduClass)
+
+
+def getISDUResponseClass(iService: IService) -> Type[ISDU]:
+    """
+    :raises InvalidISDUService: no class registered for the I-Service nibble (see registerISDUResponse)
+    """
+    isduClass = _responseClasses[iService.service]
+    if isduClass is None:
         raise InvalidISDUService(f"Invalid response nibble: {iService}")
+    return isduClass
+
 
-    return _req_map[iService.service]()
+def createISDUResponse(iService: IService, pool: Optional[ISDUPool] = None) -> ISDU:
+    """
+    :param pool: recycle released ISDU objects (None: a new object is created)
+    """
+    isduClass = getISDUResponseClass(iService)
+    return isduClass() if pool is None else pool.acquire(isduClass)
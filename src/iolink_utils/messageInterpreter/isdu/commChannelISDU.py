@@ -1,19 +1,82 @@
 from enum import IntEnum
-from typing import Optional, Callable
+from typing import Callable, List, Optional, Union
 from datetime import datetime as dt
 
 from iolink_utils.octetStreamDecoder.octetStreamDecoderMessages import (
     DeviceMessage,
     MasterMessage,
 )
-from iolink_utils.exceptions import InvalidISDUMessage
+from iolink_utils.exceptions import InvalidISDUMessage, InvalidISDUService
 from iolink_utils.octetDecoder.octetDecoder import IService
 from iolink_utils.definitions.transmissionDirection import TransmissionDirection
 from iolink_utils.definitions.iServiceNibble import IServiceNibble
 from iolink_utils.messageInterpreter.isdu.ISDUflowControl import FlowControl
 from iolink_utils.messageInterpreter.isdu.ISDU import ISDU
-from iolink_utils.messageInterpreter.isdu.ISDUrequests import createISDURequest
-from iolink_utils.messageInterpreter.isdu.ISDUresponses import createISDUResponse
+from iolink_utils.messageInterpreter.isdu.ISDUpool import ISDUPool
+from iolink_utils.messageInterpreter.isdu.ISDUexchange import ISDUExchange
+from iolink_utils.messageInterpreter.isdu.ISDUrequests import createISDURequest, getISDURequestClass
+from iolink_utils.messageInterpreter.isdu.ISDUresponses import createISDUResponse, getISDUResponseClass
+
+
+class ISDULength:
+    """
+    Length of an ISDU received by a filtered channel (see CommChannelISDU trackMasterMessage): same completion
+    as ISDU (I-Service, extended length, replaced/appended segments), but no octets are stored.
+    """
+    __slots__ = ('_service', '_lengthNibble', '_extendedLength', '_length', '_targetLength')
+
+    def __init__(self, iService: IService):
+        self._service: int = iService.service
+        self._lengthNibble: int = iService.length
+        self._extendedLength: int = 0
+        self._length: int = 0  # number of octets received
+        self._targetLength: Optional[int] = None  # None until the header has been received
+
+    @property
+    def isComplete(self) -> bool:
+        return self._targetLength is not None and self._length >= self._targetLength
+
+    def setTime(self, startTime: dt, endTime: dt):
+        pass
+
+    def setEndTime(self, endTime: dt):
+        pass
+
+    def _writeOctets(self, position: int, octets):
+        if self._targetLength is not None:
+            octets = octets[:max(self._targetLength - position, 0)]
+        end = position + len(octets)
+        self._length = max(self._length, end)
+        if position >= 2:
+            return
+
+        # I-Service and extended length (see ISDU._updateHeader)
+        if position == 0 and end > 0:
+            iService = IService.decode(octets[0])
+            if iService.service != self._service:
+                raise InvalidISDUService(f"Service value {hex(iService.service)} not expected ({self._service})")
+            self._lengthNibble = iService.length
+        if position <= 1 < end:
+            self._extendedLength = octets[1 - position]
+
+        if self._lengthNibble != 1:
+            self._targetLength = self._lengthNibble
+        else:
+            self._targetLength = self._extendedLength if self._length > 1 else None
+        if self._targetLength is not None:
+            self._length = min(self._length, self._targetLength)
+
+    def replaceTrailingOctets(self, requestData: bytearray):
+        if len(requestData) > 0:
+            self._writeOctets(max(self._length - len(requestData), 0), requestData)
+
+    def appendOctets(self, requestData: bytearray):
+        if len(requestData) > 0:
+            self._writeOctets(self._length, requestData)
+
+
+MasterHandler = Callable[[MasterMessage, FlowControl, bool], None]
+DeviceHandler = Callable[[DeviceMessage, bool], Union[None, ISDU, ISDUExchange]]
 
 
 class CommChannelISDU:
@@ -24,22 +87,74 @@ class CommChannelISDU:
         WaitForResponse = 3
         Response = 4
 
-    def __init__(self) -> None:
+    def __init__(self, isduPool: Optional[ISDUPool] = None, exchanges: bool = False) -> None:
+        """
+        :param isduPool: requests and responses are taken from this pool (None: new objects are created)
+        :param exchanges: return an ISDUExchange per response instead of request and response (with isduPool,
+            both are released to the pool as soon as the exchange has been created)
+        """
+        self._isduPool: Optional[ISDUPool] = isduPool
+        self._exchanges: bool = exchanges
         self._state: CommChannelISDU.State = CommChannelISDU.State.Idle
         self._direction: TransmissionDirection = TransmissionDirection.Read
         self._flowControl: FlowControl = FlowControl()
         self._previousFlowControl: FlowControl = FlowControl()
 
-        self._isduRequest: Optional[ISDU] = None
-        self._isduResponse: Optional[ISDU] = None
+        self._isduRequest: Union[None, ISDU, ISDULength] = None  # ISDULength: received by a filtered channel
+        self._isduResponse: Union[None, ISDU, ISDULength] = None
         self._responseStartTime: Optional[dt] = None
 
+        # bound state handlers indexed by state (created once, see _createHandlerTables)
+        self._masterHandler: List[Optional[MasterHandler]] = []
+        self._deviceHandler: List[Optional[DeviceHandler]] = []
+        self._createHandlerTables()
+
+    def _createHandlerTables(self) -> None:
+        self._masterHandler = [None] * len(self.State)
+        self._masterHandler[self.State.Idle] = self.handleMasterMsgInStateIdle
+        self._masterHandler[self.State.Request] = self.handleMasterMsgInStateRequest
+        self._masterHandler[self.State.WaitForResponse] = self.handleMasterMsgInStateWaitForResponse
+
+        self._deviceHandler = [None] * len(self.State)
+        self._deviceHandler[self.State.RequestFinished] = self.handleDeviceMsgInStateRequestFinished
+        self._deviceHandler[self.State.WaitForResponse] = self.handleDeviceMsgInStateWaitForResponse
+        self._deviceHandler[self.State.Response] = self.handleDeviceMsgInStateResponse
+
+    @property
+    def isduPool(self) -> Optional[ISDUPool]:
+        return self._isduPool
+
+    @isduPool.setter
+    def isduPool(self, isduPool: Optional[ISDUPool]) -> None:
+        self._isduPool = isduPool
+
+    @property
+    def exchanges(self) -> bool:
+        return self._exchanges
+
+    @exchanges.setter
+    def exchanges(self, exchanges: bool) -> None:
+        self._exchanges = exchanges
+
+    def __getstate__(self) -> dict:
+        # bound methods reference self -> tables are recreated after copy/unpickling
+        state = self.__dict__.copy()
+        del state['_masterHandler'], state['_deviceHandler']
+        state['_isduPool'] = None  # shared by its owner, not part of the state (see MessageInterpreter.restore)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self._isduPool = None
+        self._exchanges = False
+        self.__dict__.update(state)
+        self._createHandlerTables()
+
     def reset(self) -> None:
         self._state = CommChannelISDU.State.Idle
         self._flowControl = FlowControl()
         self._previousFlowControl = FlowControl()
 
-    def handleMasterMessage(self, message: MasterMessage) -> None:
+    def handleMasterMessage(self, message: MasterMessage, track: bool = False) -> None:
         self._direction = TransmissionDirection(message.mc.read)
         flowControl = FlowControl(message.mc.address)
 
@@ -47,37 +162,39 @@ class CommChannelISDU:
             self.reset()
             return
 
-        MasterHandler = Callable[[MasterMessage, FlowControl], None]
-        handler: Optional[MasterHandler] = {
-            self.State.Idle: self.handleMasterMsgInStateIdle,
-            self.State.Request: self.handleMasterMsgInStateRequest,
-            self.State.WaitForResponse: self.handleMasterMsgInStateWaitForResponse,
-        }.get(self._state)
-
+        handler: Optional[MasterHandler] = self._masterHandler[self._state]
         if handler:
-            handler(message, flowControl)
+            handler(message, flowControl, track)
 
         self._flowControl = flowControl
 
-    def handleDeviceMessage(self, message: DeviceMessage) -> Optional[ISDU]:
-        DeviceHandler = Callable[[DeviceMessage], Optional[ISDU]]
-        handler: Optional[DeviceHandler] = {
-            self.State.RequestFinished: self.handleDeviceMsgInStateRequestFinished,
-            self.State.WaitForResponse: self.handleDeviceMsgInStateWaitForResponse,
-            self.State.Response: self.handleDeviceMsgInStateResponse,
-        }.get(self._state)
-
+    def handleDeviceMessage(self, message: DeviceMessage, track: bool = False) -> Union[None, ISDU, ISDUExchange]:
+        handler: Optional[DeviceHandler] = self._deviceHandler[self._state]
         if handler:
-            isdu = handler(message)
+            isdu = handler(message, track)
             self._previousFlowControl = self._flowControl.copy()
             return isdu
 
         return None
 
+    # channel filtered out (see MessageInterpreter channels): same state machine, but octets are only counted
+    # (ISDULength), no ISDU/ISDUExchange is created and errors are dropped
+    def trackMasterMessage(self, message: MasterMessage) -> None:
+        try:
+            self.handleMasterMessage(message, True)
+        except (InvalidISDUMessage, InvalidISDUService):
+            pass
+
+    def trackDeviceMessage(self, message: DeviceMessage) -> None:
+        try:
+            self.handleDeviceMessage(message, True)
+        except (InvalidISDUMessage, InvalidISDUService):
+            pass
+
     #
     # MasterMessage state handler
     #
-    def handleMasterMsgInStateIdle(self, message: MasterMessage, flow: FlowControl) -> None:
+    def handleMasterMsgInStateIdle(self, message: MasterMessage, flow: FlowControl, track: bool = False) -> None:
         if flow.state != FlowControl.State.Start:
             return
 
@@ -86,7 +203,12 @@ class CommChannelISDU:
 
         self.raiseIfOnRequestDataIsMissing(message)
 
-        self._isduRequest = createISDURequest(self.getService(message))
+        service = self.getService(message)
+        if track:
+            getISDURequestClass(service)  # raises InvalidISDUService (as createISDURequest)
+            self._isduRequest = ISDULength(service)
+        else:
+            self._isduRequest = createISDURequest(service, self._isduPool)
         self._isduRequest.setTime(message.startTime, message.endTime)
         self._isduRequest.appendOctets(message.od)
 
@@ -96,7 +218,7 @@ class CommChannelISDU:
             else self.State.Request
         )
 
-    def handleMasterMsgInStateRequest(self, message: MasterMessage, flow: FlowControl) -> None:
+    def handleMasterMsgInStateRequest(self, message: MasterMessage, flow: FlowControl, track: bool = False) -> None:
         if flow.state != FlowControl.State.Count:
             return
 
@@ -111,7 +233,8 @@ class CommChannelISDU:
             self._isduRequest.setEndTime(message.endTime)
             self._state = self.State.RequestFinished
 
-    def handleMasterMsgInStateWaitForResponse(self, message: MasterMessage, flow: FlowControl) -> None:
+    def handleMasterMsgInStateWaitForResponse(self, message: MasterMessage, flow: FlowControl,
+                                              track: bool = False) -> None:
         if flow.state != FlowControl.State.Start:
             return
         if self._direction != TransmissionDirection.Read:
@@ -123,12 +246,18 @@ class CommChannelISDU:
     # DeviceMessage state handler
     #
 
-    def handleDeviceMsgInStateRequestFinished(self, message: DeviceMessage) -> Optional[ISDU]:
+    def handleDeviceMsgInStateRequestFinished(self, message: DeviceMessage, track: bool = False) -> Optional[ISDU]:
         self._isduRequest.setEndTime(message.endTime)
         self._state = self.State.WaitForResponse
+        if self._exchanges or not isinstance(self._isduRequest, ISDU):
+            return None
+        if track:
+            self._releaseISDU(self._isduRequest)
+            return None
         return self._isduRequest
 
-    def handleDeviceMsgInStateWaitForResponse(self, message: DeviceMessage) -> Optional[ISDU]:
+    def handleDeviceMsgInStateWaitForResponse(self, message: DeviceMessage,
+                                              track: bool = False) -> Union[None, ISDU, ISDUExchange]:
         if self._flowControl.state != FlowControl.State.Start:
             return None
         if self._direction != TransmissionDirection.Read:
@@ -140,18 +269,23 @@ class CommChannelISDU:
         if service.service == IServiceNibble.NoService:
             return None
 
-        self._isduResponse = createISDUResponse(service)
+        if track:
+            getISDUResponseClass(service)  # raises InvalidISDUService (as createISDUResponse)
+            self._isduResponse = ISDULength(service)
+        else:
+            self._isduResponse = createISDUResponse(service, self._isduPool)
         self._isduResponse.setTime(self._responseStartTime, message.endTime)
         self._isduResponse.appendOctets(message.od)
 
         if self._isduResponse.isComplete:
             self._state = self.State.Idle
-            return self._isduResponse
+            return self.finishResponse(track)
 
         self._state = self.State.Response
         return None
 
-    def handleDeviceMsgInStateResponse(self, message: DeviceMessage) -> Optional[ISDU]:
+    def handleDeviceMsgInStateResponse(self, message: DeviceMessage,
+                                       track: bool = False) -> Union[None, ISDU, ISDUExchange]:
         if self._flowControl.state != FlowControl.State.Count:
             return None
 
@@ -164,10 +298,35 @@ class CommChannelISDU:
         if self._isduResponse.isComplete:
             self._isduResponse.setEndTime(message.endTime)
             self._state = self.State.Idle
-            return self._isduResponse
+            return self.finishResponse(track)
 
         return None
 
+    def finishResponse(self, track: bool = False) -> Union[None, ISDU, ISDUExchange]:
+        """
+        :return: response or exchange (None: channel filtered out, or parts of the ISDU have been received while
+            the channel was filtered out)
+        """
+        request, response = self._isduRequest, self._isduResponse
+        result = None
+        if not track and isinstance(response, ISDU):
+            if not self._exchanges:
+                return response
+            if isinstance(request, ISDU):
+                result = ISDUExchange(request, response)
+
+        if self._exchanges:
+            self._releaseISDU(request)
+            self._isduRequest = None
+        self._releaseISDU(response)
+        self._isduResponse = None
+        return result
+
+    def _releaseISDU(self, isdu: Union[None, ISDU, ISDULength]) -> None:
+        # ISDU that is not returned (see ISDUPool)
+        if self._isduPool is not None and isinstance(isdu, ISDU):
+            self._isduPool.release(isdu)
+
     #
     # helpers
     #
@@ -178,7 +337,7 @@ class CommChannelISDU:
 
     @staticmethod
     def getService(message) -> IService:
-        return IService(message.od[0])
+        return IService.decode(message.od[0])
 
     @staticmethod
     def appendOnRequestData(isdu: ISDU, current: FlowControl, previous: FlowControl, od: bytearray) -> bool:
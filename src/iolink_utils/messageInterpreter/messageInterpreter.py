@@ -1,4 +1,5 @@
-from typing import Union
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+import copy
 
 from iolink_utils.octetStreamDecoder.octetStreamDecoderMessages import DeviceMessage, MasterMessage
 from iolink_utils.definitions.communicationChannel import CommChannel
@@ -7,31 +8,121 @@ from iolink_utils.messageInterpreter.diagnosis.commChannelDiagnosis import CommC
     TransactionDiagEventMemory, TransactionDiagEventReset
 from iolink_utils.messageInterpreter.isdu.commChannelISDU import CommChannelISDU
 from iolink_utils.messageInterpreter.isdu.ISDU import ISDU
+from iolink_utils.messageInterpreter.isdu.ISDUexchange import ISDUExchange
+from iolink_utils.messageInterpreter.isdu.ISDUpool import ISDUPool
 from iolink_utils.messageInterpreter.page.commChannelPage import CommChannelPage, TransactionPage
 from iolink_utils.messageInterpreter.process.commChannelProcess import CommChannelProcess
 
 
+class _StateTracker:
+    # handler of a filtered channel: keeps the state of the channel handler without creating transactions
+    __slots__ = ('handleMasterMessage', 'handleDeviceMessage')
+
+    def __init__(self, handler):
+        self.handleMasterMessage = handler.trackMasterMessage
+        self.handleDeviceMessage = handler.trackDeviceMessage
+
+
 class MessageInterpreter:
-    def __init__(self):
+    def __init__(self, channels: Optional[Iterable[CommChannel]] = None, isduPool: Optional[ISDUPool] = None,
+                 isduExchanges: bool = False):
+        """
+        :param channels: channels to create transactions for (None: all channels). Other channels only keep
+            their state up to date (e.g. no TransactionProcess per cyclic M-sequence in OPERATE, errors of these
+            channels are not raised), so requested channels get the same transactions as without filter and the
+            filter can be changed at any time (see channels).
+        :param isduPool: recycle ISDU objects released by the consumer (see ISDUPool, None: no pooling)
+        :param isduExchanges: one ISDUExchange per request/response instead of two ISDU transactions
+        """
         self._channelHandler = {
             CommChannel.Process: CommChannelProcess(),  # this is not ProcessData! (dummy handler)
             CommChannel.Page: CommChannelPage(),
             CommChannel.Diagnosis: CommChannelDiagnosis(),
-            CommChannel.ISDU: CommChannelISDU()
+            CommChannel.ISDU: CommChannelISDU(isduPool, isduExchanges)
         }
-        self._activeChannel: CommChannel = CommChannel.Process
+        self._activeChannel: int = CommChannel.Process  # raw channel of the last master message
+        self._isduPool: Optional[ISDUPool] = isduPool
+        self._isduExchanges: bool = isduExchanges
+        self._channels: frozenset = frozenset(channels) if channels is not None else frozenset(CommChannel)
+        self._requestedHandler: Dict[CommChannel, object] = {}  # handler or _StateTracker per channel
+        self._masterDispatch: List[Optional[Callable]] = []
+        self._deviceDispatch: List[Optional[Callable]] = []
+        self._updateRequestedHandler()
+
+    @property
+    def channels(self) -> frozenset:
+        return self._channels
+
+    @channels.setter
+    def channels(self, channels: Optional[Iterable[CommChannel]]):
+        """Changes the channels to create transactions for (None: all channels), e.g. in the middle of a capture."""
+        self._channels = frozenset(channels) if channels is not None else frozenset(CommChannel)
+        self._updateRequestedHandler()
+
+    @property
+    def isduPool(self) -> Optional[ISDUPool]:
+        return self._isduPool
+
+    @property
+    def isduExchanges(self) -> bool:
+        return self._isduExchanges
+
+    def _updateRequestedHandler(self):
+        # handler per channel, state tracker if the channel is filtered out
+        self._requestedHandler = {channel: handler if channel in self._channels else _StateTracker(handler)
+                                  for channel, handler in self._channelHandler.items()}
+        # bound handler methods indexed by the raw channel bits of MC (see processMessage)
+        self._masterDispatch = [handler.handleMasterMessage for _, handler in sorted(self._requestedHandler.items())]
+        self._deviceDispatch = [handler.handleDeviceMessage for _, handler in sorted(self._requestedHandler.items())]
 
     def _updateActiveChannel(self, channel: Union[None, CommChannel]):
         if channel is not None:
             self._activeChannel = channel
 
     def processMessage(self, message: Union[MasterMessage, DeviceMessage]) \
-            -> Union[None, TransactionPage, TransactionDiagEventMemory, TransactionDiagEventReset, ISDU]:
-        self._updateActiveChannel(message.channel())
-        return message.dispatch(self._channelHandler[self._activeChannel])
+            -> Union[None, TransactionPage, TransactionDiagEventMemory, TransactionDiagEventReset, ISDU, ISDUExchange]:
+        if isinstance(message, MasterMessage):
+            self._activeChannel = channel = message.mc.channel
+            return self._masterDispatch[channel](message)
+        elif isinstance(message, DeviceMessage):
+            return self._deviceDispatch[self._activeChannel](message)
+        else:  # any other message type: double dispatch
+            self._updateActiveChannel(message.channel())
+            result = message.dispatch(self._requestedHandler[self._activeChannel])
+            return result if self._activeChannel in self._channels else None
+
+    def processMessages(self, messages: Iterable[Union[MasterMessage, DeviceMessage]]) \
+            -> Iterator[Union[TransactionPage, TransactionDiagEventMemory, TransactionDiagEventReset, ISDU, ISDUExchange]]:
+        """Interprets messages one after the other and yields all transactions (see processMessage)."""
+        processMessage = self.processMessage
+        for message in messages:
+            result = processMessage(message)
+            if result is not None:
+                yield result
 
     def reset(self):
         self._activeChannel = CommChannel.Process
 
         for handler in self._channelHandler.values():
             handler.reset()
+
+    def snapshot(self) -> dict:
+        """
+        Snapshot of the complete interpreter state (active channel and all channel handlers, e.g. partial
+        ISDU or event memory), e.g. to resume interpreting a capture later (picklable, see restore()).
+        """
+        return copy.deepcopy({'activeChannel': self._activeChannel, 'channelHandler': self._channelHandler})
+
+    def restore(self, snapshot: dict):
+        """
+        Continues interpreting from a snapshot (the snapshot is not modified and can be restored several times).
+        Only the decoding state is restored, the configuration of this interpreter (channels, isduPool,
+        isduExchanges) is kept.
+        """
+        state = copy.deepcopy(snapshot)
+        self._activeChannel = state['activeChannel']
+        self._channelHandler = state['channelHandler']
+        isduHandler = self._channelHandler[CommChannel.ISDU]
+        isduHandler.isduPool = self._isduPool
+        isduHandler.exchanges = self._isduExchanges
+        self._updateRequestedHandler()
@@ -21,6 +21,24 @@ class CommChannelPage:
         self._octet = 0
 
     def handleMasterMessage(self, message: MasterMessage) -> None:
+        self._updateMasterState(message)
+        return None
+
+    def handleDeviceMessage(self, message: DeviceMessage) -> TransactionPage:
+        self._updateDeviceState(message)
+
+        transaction = TransactionPage(self._direction, self._pageIndex, int(self._octet))
+        transaction.setTime(self._startTime, self._endTime)
+        return transaction
+
+    # channel filtered out (see MessageInterpreter channels): state is kept, no transactions are created
+    def trackMasterMessage(self, message: MasterMessage) -> None:
+        self._updateMasterState(message)
+
+    def trackDeviceMessage(self, message: DeviceMessage) -> None:
+        self._updateDeviceState(message)
+
+    def _updateMasterState(self, message: MasterMessage) -> None:
         self._startTime = message.startTime
         self._endTime = message.endTime
 
@@ -28,13 +46,7 @@ class CommChannelPage:
         self._pageIndex = message.mc.address
         self._octet = message.od[0] if self._direction == TransmissionDirection.Write else 0
 
-        return None
-
-    def handleDeviceMessage(self, message: DeviceMessage) -> TransactionPage:
+    def _updateDeviceState(self, message: DeviceMessage) -> None:
         self._endTime = message.endTime
         if self._direction == TransmissionDirection.Read:
             self._octet = message.od[0]
-
-        transaction = TransactionPage(self._direction, self._pageIndex, int(self._octet))
-        transaction.setTime(self._startTime, self._endTime)
-        return transaction
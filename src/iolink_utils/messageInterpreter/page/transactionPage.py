@@ -7,6 +7,8 @@ from iolink_utils.utils.directParameterTranslator import translateDirectParamete
 
 
 class TransactionPage(Transaction):
+    __slots__ = ('direction', 'index', 'value')
+
     def __init__(self, direction: TransmissionDirection, pageIndex: int, value: int):
         super().__init__()
 
@@ -22,3 +22,10 @@ class CommChannelProcess:
         transaction = TransactionProcess("Device", self._direction)
         transaction.setTime(message.startTime, message.endTime)
         return transaction
+
+    # channel filtered out (see MessageInterpreter channels): state is kept, no transactions are created
+    def trackMasterMessage(self, message: MasterMessage) -> None:
+        self._direction = TransmissionDirection(message.mc.read)
+
+    def trackDeviceMessage(self, message: DeviceMessage) -> None:
+        pass
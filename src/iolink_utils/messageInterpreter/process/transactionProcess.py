@@ -5,6 +5,8 @@ from iolink_utils.definitions.transmissionDirection import TransmissionDirection
 
 
 class TransactionProcess(Transaction):
+    __slots__ = ('direction', 'source')
+
     def __init__(self, source: str, direction: TransmissionDirection):
         super().__init__()
 
@@ -4,6 +4,8 @@ from datetime import datetime as dt
 
 
 class Transaction(ABC):
+    __slots__ = ('startTime', 'endTime')
+
     def __init__(self):
         self.startTime: dt = dt(1970, 1, 1)
         self.endTime: dt = dt(1970, 1, 1)
@@ -1,5 +1,6 @@
 import ctypes
-from typing import Optional
+import inspect
+from typing import Dict, List, Optional, Tuple, Type
 from iolink_utils.exceptions import InvalidOctetValue
 
 
@@ -52,9 +53,249 @@ class OctetDecoderBase(ctypes.BigEndianStructure):
     def copy(self):
         return self.__class__(int(self))
 
+    @classmethod
+    def decode(cls, value: int) -> "DecodedOctet":
+        """
+        Immutable decoded octet with the same field names as plain ints (see DecodedOctet).
+        All 256 values of a class are decoded once, so this is just a table lookup.
+        """
+        table = _decodedOctets.get(cls)
+        if table is None:
+            table = _createDecodedOctets(cls)
+        if not 0 <= value <= 255:
+            raise InvalidOctetValue()
+        return table[value]
+
     def valuesAsString(self) -> str:
         return ", ".join(f"{name}={getattr(self, name)}" for name, *_ in self._fields_ if name != 'unused')
 
     def __repr__(self):  # pragma: no cover
         """String representation of decoded content."""
         return f"{self.__class__.__name__}({self.valuesAsString()})"
+
+
+class DecodedOctet:
+    """
+    Interned, immutable decoded octet created by OctetDecoderBase.decode (flyweight: one object per value and class).
+    Field values are plain ints in slots (faster to read than ctypes bitfields). Behaves like the octet it decodes:
+    compares equal to the OctetDecoderBase object and the int of the same value, bytes() is the single octet.
+    Use the OctetDecoderBase classes to encode (set fields).
+    """
+    __slots__ = ('value',)
+    _decoderClass = OctetDecoderBase
+
+    def __init__(self, value: int, fields: Dict[str, int]):
+        object.__setattr__(self, 'value', value)
+        for name, fieldValue in fields.items():
+            object.__setattr__(self, name, fieldValue)
+
+    def __setattr__(self, name, value):
+        # shared by all messages with the same octet: fields can't be set (replace the octet instead)
+        raise AttributeError(f"{type(self).__name__} is immutable (shared by all decoded messages), assign a new "
+                             f"octet instead, e.g. {self._decoderClass.__name__}({self.value:#04x})")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable (shared by all decoded messages)")
+
+    def __int__(self):
+        return self.value
+
+    def __bytes__(self):
+        return _OCTETS[self.value]
+
+    def get(self) -> int:
+        return self.value
+
+    def copy(self):
+        return self  # immutable
+
+    def valuesAsString(self) -> str:
+        return ", ".join(f"{name}={getattr(self, name)}" for name, *_ in self._decoderClass._fields_ if name != 'unused')
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return self._decoderClass.decode, (self.value,)
+
+    def __eq__(self, other):
+        if isinstance(other, _OCTET_TYPES):
+            return self.value == int(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, _OCTET_TYPES):
+            return self.value != int(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):  # pragma: no cover
+        return repr(self._decoderClass(self.value))
+
+    def __str__(self):  # pragma: no cover
+        return str(self._decoderClass(self.value))
+
+
+_OCTETS: Tuple[bytes, ...] = tuple(bytes((value,)) for value in range(256))
+_decodedOctets: Dict[type, Tuple[DecodedOctet, ...]] = {}
+
+
+def _baseClassIndex(decoderClass: type) -> int:
+    return next(index for index, base in enumerate(decoderClass.__mro__)
+                if base in (OctetDecoderBase, IntOctetDecoderBase))
+
+
+def _createDecodedOctets(decoderClass: type) -> Tuple[DecodedOctet, ...]:
+    fieldNames = list(dict.fromkeys(name for name, *_ in getattr(decoderClass, '_fields_', [])))
+
+    # methods of the decoder class (e.g. getWithoutChecksum) are available as well (only use int(self) and fields)
+    methods = {}
+    for base in reversed(decoderClass.__mro__[:_baseClassIndex(decoderClass)]):
+        methods.update({name: attr for name, attr in vars(base).items()
+                        if callable(attr) and not name.startswith('_')})
+
+    decodedClass = type(f"Decoded{decoderClass.__name__}", (DecodedOctet,),
+                        {'__slots__': tuple(fieldNames), '_decoderClass': decoderClass,
+                         '__module__': decoderClass.__module__, **methods})
+
+    decoder = decoderClass()
+    table = []
+    for value in range(256):
+        decoder.set(value)
+        table.append(decodedClass(value, {name: getattr(decoder, name) for name in fieldNames}))
+    _decodedOctets[decoderClass] = tuple(table)
+    return _decodedOctets[decoderClass]
+
+
+def _bitField(shift: int, bitCount: int) -> property:
+    # shift/mask accessor of a bitfield of IntOctetDecoderBase (a property is faster than a descriptor class)
+    mask = (1 << bitCount) - 1
+    clearMask = ~(mask << shift) & 0xFF
+
+    def getField(self) -> int:
+        return (self._value >> shift) & mask
+
+    def setField(self, value: int):
+        # like a ctypes bitfield, bits outside the field are cut off
+        self._value = (self._value & clearMask) | ((value & mask) << shift)
+
+    return property(getField, setField)
+
+
+class IntOctetDecoderBase:
+    """
+    Base class for octet decoder (decoding a single byte) storing a plain int instead of a ctypes structure.
+
+    Same _fields_ declarations (first field = most significant bits) and same API as OctetDecoderBase,
+    but int(), ==, hash() and copy() don't need a conversion. See createIntOctetDecoder and intOctetDecoder.
+    """
+    __slots__ = ('_value',)
+    _fields_: List[tuple] = []
+    _fieldNames: Tuple[str, ...] = ()  # fields shown by valuesAsString
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if '_fields_' in cls.__dict__:
+            shift = 8
+            for name, _, bitCount in cls._fields_:
+                shift -= bitCount
+                setattr(cls, name, _bitField(shift, bitCount))
+            cls._fieldNames = tuple(name for name, *_ in cls._fields_ if name != 'unused')
+
+    def __init__(self, value: Optional[int] = None, **kwargs):
+        if value is None:
+            value = 0
+        elif not 0 <= value <= 255:
+            raise InvalidOctetValue()
+        self._value: int = int(value)  # can be overridden by explicit field ctor parameters
+
+        for key, val in kwargs.items():
+            if not any(key == name for name, *_ in self._fields_):
+                raise TypeError(f"Unknown field '{key}' for {self.__class__.__name__}")
+            setattr(self, key, val)
+
+    @classmethod
+    def from_buffer_copy(cls, source, offset: int = 0):
+        """Same as the ctypes method: decodes the octet at offset of a bytes like object."""
+        return cls(source[offset])
+
+    def __int__(self):
+        return self._value
+
+    def __eq__(self, other):
+        if isinstance(other, _OCTET_TYPES):
+            return self._value == int(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, _OCTET_TYPES):
+            return self._value != int(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._value)
+
+    def __bytes__(self):
+        """Same as bytes() of the ctypes structure: the octet"""
+        return _OCTETS[self._value]
+
+    def get(self) -> int:
+        """Get octet as integer value"""
+        return self._value
+
+    def set(self, value: int):
+        """Set the underlying byte (octet) value (0–255, see OctetDecoderBase.set)."""
+        if 0 <= value <= 255:
+            self._value = int(value)
+        else:
+            raise InvalidOctetValue()
+
+    def copy(self):
+        new = self.__class__.__new__(self.__class__)
+        new._value = self._value
+        return new
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def __getstate__(self):
+        return self._value
+
+    def __setstate__(self, state: int):
+        self._value = state
+
+    decode = classmethod(OctetDecoderBase.decode.__func__)
+
+    def valuesAsString(self) -> str:
+        return ", ".join(f"{name}={getattr(self, name)}" for name in self._fieldNames)
+
+    def __repr__(self):  # pragma: no cover
+        """String representation of decoded content."""
+        return f"{self.__class__.__name__}({self.valuesAsString()})"
+
+
+_OCTET_TYPES = (DecodedOctet, OctetDecoderBase, IntOctetDecoderBase, int)
+
+
+def createIntOctetDecoder(decoderClass: Type[OctetDecoderBase], module: Optional[str] = None) \
+        -> Type[IntOctetDecoderBase]:
+    """
+    Creates the IntOctetDecoderBase counterpart of an OctetDecoderBase class (same name, fields and methods).
+
+    :param decoderClass: ctypes based octet decoder
+    :param module: module the class is assigned to (must be importable to pickle objects of the class)
+    """
+    methods = {name: attr for name, attr in vars(decoderClass).items()
+               if inspect.isfunction(attr) and name not in ('__init__', '__new__')}
+    return type(decoderClass.__name__, (IntOctetDecoderBase,),
+                {'__slots__': (), '_fields_': list(decoderClass._fields_), '__doc__': decoderClass.__doc__,
+                 '__module__': module or decoderClass.__module__, '__qualname__': decoderClass.__qualname__,
+                 **methods})
@@ -0,0 +1,24 @@
+"""
+Octet decoders of octetDecoder based on IntOctetDecoderBase (a plain int instead of a ctypes structure).
+
+Same names, fields and methods as the ctypes classes, e.g.:
+
+    from iolink_utils.octetDecoder.intOctetDecoder import MC
+"""
+from . import octetDecoder as _ctypesDecoder
+from ._octetDecoderBase import createIntOctetDecoder
+
+
+MC = createIntOctetDecoder(_ctypesDecoder.MC, __name__)
+CKT = createIntOctetDecoder(_ctypesDecoder.CKT, __name__)
+CKS = createIntOctetDecoder(_ctypesDecoder.CKS, __name__)
+IService = createIntOctetDecoder(_ctypesDecoder.IService, __name__)
+StatusCodeType1 = createIntOctetDecoder(_ctypesDecoder.StatusCodeType1, __name__)
+StatusCodeType2 = createIntOctetDecoder(_ctypesDecoder.StatusCodeType2, __name__)
+EventQualifier = createIntOctetDecoder(_ctypesDecoder.EventQualifier, __name__)
+CycleTimeOctet = createIntOctetDecoder(_ctypesDecoder.CycleTimeOctet, __name__)
+MSequenceCapability = createIntOctetDecoder(_ctypesDecoder.MSequenceCapability, __name__)
+RevisionId = createIntOctetDecoder(_ctypesDecoder.RevisionId, __name__)
+ProcessDataIn = createIntOctetDecoder(_ctypesDecoder.ProcessDataIn, __name__)
+ProcessDataOut = createIntOctetDecoder(_ctypesDecoder.ProcessDataOut, __name__)
+DataStorage_StateProperty = createIntOctetDecoder(_ctypesDecoder.DataStorage_StateProperty, __name__)
@@ -1,8 +1,9 @@
+from typing import List, Optional, Sequence
 from enum import IntEnum
-from datetime import datetime as dt
 
-from iolink_utils.octetDecoder.octetDecoder import MC, CKT, CKS
-from .octetStreamDecoderSettings import DecoderSettings
+from iolink_utils.octetDecoder.intOctetDecoder import MC, CKT, CKS
+from iolink_utils.exceptions import InvalidMSeqCode
+from .octetStreamDecoderSettings import FramePlan, Timestamp, getFramePlanIndex
 from .octetStreamDecoderMessages import MasterMessage, DeviceMessage
 from ._compressChecksum import lookup_8to6_compression
 
@@ -16,15 +17,66 @@ class DecodingState(IntEnum):
     Idle = 0,
     MasterMessage = 1,
     DeviceResponseDelay = 2,
-    DeviceMessage = 3
+    DeviceMessage = 3,
+    Resync = 4,  # searching a valid master frame within the octets of an invalid one (see resync mode)
+    Discard = 5  # resync failed: octets are skipped until the next M-sequence
+
+
+def calculateMasterChecksum(msg: MasterMessage) -> int:
+    checksum = 0x52
+    checksum ^= msg.mc.get()
+    checksum ^= msg.ckt.getWithoutChecksum()
+    for b in msg.pdOut:
+        checksum ^= b
+    for b in msg.od:
+        checksum ^= b
+    return lookup_8to6_compression[checksum]
+
+
+def calculateDeviceChecksum(msg: DeviceMessage) -> int:
+    checksum = 0x52
+    for b in msg.od:
+        checksum ^= b
+    for b in msg.pdIn:
+        checksum ^= b
+    checksum ^= msg.cks.getWithoutChecksum()
+    return lookup_8to6_compression[checksum]
+
+
+def createMasterMessage(values: Sequence[int], startTimes: Sequence[Timestamp], endTimes: Sequence[Timestamp],
+                        begin: int, pdOutLen: int, odLen: int) -> MasterMessage:
+    """Creates a complete master message from octets that are known to form one frame."""
+    msg = MasterMessage()
+    msg.startTime = startTimes[begin]
+    msg.endTime = endTimes[begin + 1 + pdOutLen + odLen]
+    msg.mc = MC.decode(values[begin])
+    msg.ckt = CKT.decode(values[begin + 1])
+    msg.pdOut = bytearray(values[begin + 2:begin + 2 + pdOutLen])
+    msg.od = bytearray(values[begin + 2 + pdOutLen:begin + 2 + pdOutLen + odLen])
+    msg.isValid = (msg.ckt.checksum == calculateMasterChecksum(msg))
+    return msg
+
+
+def createDeviceMessage(values: Sequence[int], startTimes: Sequence[Timestamp], endTimes: Sequence[Timestamp],
+                        begin: int, odLen: int, pdInLen: int) -> DeviceMessage:
+    """Creates a complete device message from octets that are known to form one frame."""
+    msg = DeviceMessage()
+    msg.startTime = startTimes[begin]
+    msg.endTime = endTimes[begin + odLen + pdInLen]
+    msg.od = bytearray(values[begin:begin + odLen])
+    msg.pdIn = bytearray(values[begin + odLen:begin + odLen + pdInLen])
+    msg.cks = CKS.decode(values[begin + odLen + pdInLen])
+    msg.isValid = (msg.cks.checksum == calculateDeviceChecksum(msg))
+    return msg
 
 
 class MasterMessageDecoder:
-    def __init__(self, settings: DecoderSettings):
-        self._settings: DecoderSettings = settings
+    def __init__(self, framePlans: List[Optional[FramePlan]]):
+        self._framePlans: List[Optional[FramePlan]] = framePlans
+        self._framePlan: Optional[FramePlan] = None
         self._octetCount: int = 0
-        self._pdOutLen: int = 0
-        self._odLen: int = 0
+        self._length: int = 2  # MC + CKT (until the M-sequence type is known)
+        self._checksum: int = 0x52  # seed, all octets are XORed in on arrival (CKT without checksum bits)
 
         self._msg: MasterMessage = MasterMessage()
 
@@ -32,93 +84,73 @@ class MasterMessageDecoder:
     def msg(self):
         return self._msg
 
-    def processOctet(self, octet, startTime: dt, endTime: dt) -> MessageState:
-        if not self._isComplete():
+    @property
+    def framePlan(self) -> Optional[FramePlan]:
+        return self._framePlan
+
+    def processOctet(self, octet, startTime: Timestamp, endTime: Timestamp) -> MessageState:
+        if self._octetCount < self._length:
             if self._octetCount == 0:
                 self._msg.startTime = startTime
-                self._msg.mc = MC.from_buffer_copy(bytes([octet]), 0)
+                self._msg.mc = MC.decode(octet)
+                self._checksum ^= octet
             elif self._octetCount == 1:
-                self._msg.ckt = CKT.from_buffer_copy(bytes([octet]), 0)
-
-                payloadLength = self._settings.getPayloadLength(self._msg.ckt.mSeqType)
-                self._pdOutLen = payloadLength.pdOut
-                self._odLen = payloadLength.od if self._msg.mc.read == 0 else 0
-            elif len(self._msg.pdOut) < self._pdOutLen:
+                self._msg.ckt = CKT.decode(octet)
+                self._checksum ^= octet & 0xC0
+
+                self._framePlan = self._framePlans[getFramePlanIndex(self._msg.ckt.mSeqType, self._msg.mc.read)]
+                if self._framePlan is None:
+                    raise InvalidMSeqCode(f"Invalid M-Sequence type: '{self._msg.ckt.mSeqType}'")
+                self._length = self._framePlan.masterLength
+            elif self._octetCount < 2 + self._framePlan.pdOut:
                 self._msg.pdOut.append(octet)
-            elif len(self._msg.od) < self._odLen:
+                self._checksum ^= octet
+            else:
                 self._msg.od.append(octet)
+                self._checksum ^= octet
 
             self._octetCount += 1
             self._msg.endTime = endTime
 
-        if self._isComplete():
-            self._msg.isValid = (self._msg.ckt.checksum == self._calculateChecksum())
+        if self._octetCount == self._length and self._framePlan is not None:
+            self._msg.isValid = (self._msg.ckt.checksum == lookup_8to6_compression[self._checksum])
             return MessageState.Finished
         else:
             return MessageState.Incomplete
 
-    def _calculateChecksum(self):
-        checksum = 0x52
-        checksum ^= self._msg.mc.get()
-        checksum ^= self._msg.ckt.getWithoutChecksum()
-        for b in self._msg.pdOut:
-            checksum ^= b
-        for b in self._msg.od:
-            checksum ^= b
-        return lookup_8to6_compression[checksum]
-
-    def _isComplete(self):
-        return ((self._octetCount >= 2) and
-                len(self._msg.pdOut) == self._pdOutLen and
-                len(self._msg.od) == self._odLen)
-
 
 class DeviceMessageDecoder:
-    def __init__(self, settings: DecoderSettings, read: int, mSeqType: int):
-        self._settings: DecoderSettings = settings
+    def __init__(self, framePlan: FramePlan):
+        self._framePlan: FramePlan = framePlan
         self._octetCount: int = 0
+        self._checksum: int = 0x52  # seed, all octets are XORed in on arrival (CKS without checksum bits)
 
         self._msg: DeviceMessage = DeviceMessage()
 
-        payloadLength = self._settings.getPayloadLength(mSeqType)
-        self._odLen: int = payloadLength.od if read == 1 else 0
-        self._pdInLen: int = payloadLength.pdIn
-
     @property
     def msg(self):
         return self._msg
 
-    def processOctet(self, octet, start_time: dt, end_time: dt) -> MessageState:
-        if not self._isComplete():
+    def processOctet(self, octet, start_time: Timestamp, end_time: Timestamp) -> MessageState:
+        if self._octetCount < self._framePlan.deviceLength:
             if self._octetCount == 0:
                 self._msg.startTime = start_time
 
-            if len(self._msg.od) < self._odLen:
+            if self._octetCount < self._framePlan.deviceOd:
                 self._msg.od.append(octet)
-            elif len(self._msg.pdIn) < self._pdInLen:
+                self._checksum ^= octet
+            elif self._octetCount < self._framePlan.deviceOd + self._framePlan.pdIn:
                 self._msg.pdIn.append(octet)
+                self._checksum ^= octet
             else:
-                self._msg.cks = CKS.from_buffer_copy(bytes([octet]), 0)
+                self._msg.cks = CKS.decode(octet)
+                self._checksum ^= octet & 0xC0
 
             self._octetCount += 1
             self._msg.endTime = end_time
 
-        if self._isComplete():
-            self._msg.isValid = (self._msg.cks.checksum == self._calculateChecksum())
+        if self._octetCount == self._framePlan.deviceLength:
+            self._msg.isValid = (self._msg.cks.checksum == lookup_8to6_compression[self._checksum])
             return MessageState.Finished
         else:
             return MessageState.Incomplete
-
-    def _calculateChecksum(self):
-        checksum = 0x52
-        for b in self._msg.od:
-            checksum ^= b
-        for b in self._msg.pdIn:
-            checksum ^= b
-        checksum ^= self._msg.cks.getWithoutChecksum()
-        return lookup_8to6_compression[checksum]
-
-    def _isComplete(self):
-        return (self._octetCount == (self._pdInLen + self._odLen + 1) and
-                len(self._msg.pdIn) == self._pdInLen and
-                len(self._msg.od) == self._odLen)
@@ -0,0 +1,69 @@
+from typing import List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from ._compressChecksum import lookup_8to6_compression
+
+
+_CHECKSUM_SEED = 0x52
+_CHECKSUM_BITS = 0x3F
+
+_lookupTable = np.array(lookup_8to6_compression, dtype=np.uint8) if np is not None else None
+
+
+def _validateChecksums(values, frameBegins: Sequence[int], frameEnds: Sequence[int],
+                       checksumPositions: Sequence[int]) -> List[bool]:
+    # XOR over the whole frame includes the 6 checksum bits of the checksum octet (CKT/CKS): they are
+    # XORed out again, so one reduction per frame is enough
+    if np is None:
+        result = []
+        for begin, end, checksumPos in zip(frameBegins, frameEnds, checksumPositions):
+            checksum = _CHECKSUM_SEED
+            for octet in values[begin:end]:
+                checksum ^= octet
+            transmitted = values[checksumPos] & _CHECKSUM_BITS
+            result.append(lookup_8to6_compression[checksum ^ transmitted] == transmitted)
+        return result
+
+    if len(frameBegins) == 0:
+        return []
+
+    octets = np.zeros(len(values) + 1, dtype=np.uint8)  # + 1: reduceat index of a frame ending at the last octet
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        values = np.frombuffer(values, dtype=np.uint8)
+    octets[:-1] = values
+
+    bounds = np.empty(2 * len(frameBegins), dtype=np.intp)
+    bounds[0::2] = frameBegins
+    bounds[1::2] = frameEnds
+    frameXor = np.bitwise_xor.reduceat(octets, bounds)[0::2]  # every 2nd reduction is the gap between frames
+
+    transmitted = octets[np.asarray(checksumPositions, dtype=np.intp)] & _CHECKSUM_BITS
+    return (_lookupTable[frameXor ^ transmitted ^ _CHECKSUM_SEED] == transmitted).tolist()
+
+
+def validateMasterChecksums(values, frameBegins: Sequence[int], frameEnds: Sequence[int]) -> List[bool]:
+    """
+    Checks the checksums of many master frames at once (e.g. when replaying bulk captures).
+
+    :param values: octet values of the capture (sequence of ints, bytes or numpy array)
+    :param frameBegins: index of the MC octet of each frame
+    :param frameEnds: index after the last octet of each frame
+    :return: checksum valid per frame
+    """
+    return _validateChecksums(values, frameBegins, frameEnds, [begin + 1 for begin in frameBegins])
+
+
+def validateDeviceChecksums(values, frameBegins: Sequence[int], frameEnds: Sequence[int]) -> List[bool]:
+    """
+    Checks the checksums of many device frames at once (e.g. when replaying bulk captures).
+
+    :param values: octet values of the capture (sequence of ints, bytes or numpy array)
+    :param frameBegins: index of the first octet of each frame
+    :param frameEnds: index after the CKS octet of each frame
+    :return: checksum valid per frame
+    """
+    return _validateChecksums(values, frameBegins, frameEnds, [end - 1 for end in frameEnds])
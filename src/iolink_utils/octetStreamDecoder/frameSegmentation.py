@@ -0,0 +1,59 @@
+from typing import NamedTuple, List
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+class FrameSegmentation(NamedTuple):
+    # index of every octet that starts a new M-sequence for sure (gap >= max response time)
+    boundaries: List[int]
+    # cumulated number of gaps violating the master/device frame transmission delay:
+    # violations within gaps (a, b] = violations[b] - violations[a]
+    masterGapViolations: List[int]
+    deviceGapViolations: List[int]
+
+
+def isFrameSegmentationAvailable() -> bool:
+    """Frame segmentation requires numpy (optional dependency)."""
+    return np is not None
+
+
+def calculateGaps(startTimes, endTimes, previousEndTime: int):
+    """
+    Calculates the gap in front of every octet (start of octet - end of previous octet).
+
+    :param startTimes: integer start time of each octet
+    :param endTimes: integer end time of each octet
+    :param previousEndTime: end time of the octet in front of the first octet
+    :return: numpy array (int64) with one gap per octet
+    """
+    startTimes = np.asarray(startTimes, dtype=np.int64)
+    endTimes = np.asarray(endTimes, dtype=np.int64)
+
+    gaps = np.empty(len(startTimes), dtype=np.int64)
+    if len(gaps) > 0:
+        gaps[0] = startTimes[0] - previousEndTime
+        np.subtract(startTimes[1:], endTimes[:-1], out=gaps[1:])
+    return gaps
+
+
+def segmentFrames(startTimes, endTimes, previousEndTime: int,
+                  maxMasterGap: int, maxResponseTime: int, maxDeviceGap: int) -> FrameSegmentation:
+    """
+    Splits a chunk of octets into candidate M-sequences using only the gaps between octets.
+
+    A gap of at least the max response time always restarts decoding (see OctetStreamDecoder), no
+    matter in which state the decoder is. All other gaps are only counted, so that a decoder can check
+    a whole master or device frame with two lookups instead of checking every single octet.
+
+    All times and thresholds must be integers of the same unit (see TimestampMode).
+    """
+    gaps = calculateGaps(startTimes, endTimes, previousEndTime)
+
+    return FrameSegmentation(
+        boundaries=np.flatnonzero(gaps >= maxResponseTime).tolist(),
+        masterGapViolations=np.cumsum(gaps >= maxMasterGap).tolist(),
+        deviceGapViolations=np.cumsum(gaps >= maxDeviceGap).tolist()
+    )
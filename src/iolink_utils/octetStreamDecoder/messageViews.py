@@ -0,0 +1,221 @@
+from typing import Optional, Sequence, Tuple, Union
+from array import array
+
+from iolink_utils.octetDecoder.intOctetDecoder import MC, CKT, CKS
+from .octetStreamDecoderSettings import FramePlan
+from .octetStreamDecoderMessages import MasterMessage, DeviceMessage
+from ._compressChecksum import lookup_8to6_compression
+
+
+def asOctetBuffer(values) -> Optional[memoryview]:
+    """
+    Returns a contiguous memoryview of octets (bytes, bytearray, array('B'), numpy uint8 array, ...)
+    or None if values do not support the buffer protocol with one octet per item.
+    A strided buffer (e.g. a field of a numpy structured array) is copied once.
+    """
+    try:
+        buffer = memoryview(values)
+    except TypeError:
+        return None
+
+    if buffer.ndim != 1 or buffer.itemsize != 1 or buffer.format not in ('B', '<B', '>B', '=B', 'c'):
+        return None
+    if not buffer.c_contiguous:
+        buffer = memoryview(buffer.tobytes())
+    return buffer.cast('B') if buffer.format != 'B' else buffer
+
+
+def _unpickleMessage(message: Union[MasterMessage, DeviceMessage]) -> Union[MasterMessage, DeviceMessage]:
+    return message
+
+
+def _checksum(octets: memoryview, seed: int) -> int:
+    checksum = 0x52 ^ seed
+    for octet in octets:
+        checksum ^= octet
+    return lookup_8to6_compression[checksum]
+
+
+class MessageViewFrames:
+    """
+    M-sequences of one batch (see OctetStreamDecoder messageViews) in compact arrays shared by all views of the
+    batch: offset in the octet buffer, frame lengths, timestamps and checksum results (one row per M-sequence).
+    """
+    __slots__ = ('buffer', 'begins', 'lengths', 'times', 'validity')
+
+    # validity: per message (master, device) of a row
+    _UNKNOWN, _VALID, _INVALID = 0, 1, 2
+
+    def __init__(self, buffer: memoryview):
+        self.buffer: memoryview = buffer
+        self.begins: array = array('q')  # first octet (MC) of the M-sequence
+        self.lengths: bytearray = bytearray()  # pdOut, master od, device od, pdIn
+        self.times: array = array('q')  # master start/end, device start/end (integer timestamps only)
+        self.validity: bytearray = bytearray()  # master, device (checksums are verified on first access)
+
+    def append(self, begin: int, framePlan: FramePlan, startTimes: Sequence[int], endTimes: Sequence[int]) -> int:
+        """:return: row of the M-sequence starting at begin"""
+        deviceBegin = begin + framePlan.masterLength
+        self.begins.append(begin)
+        self.lengths += bytes((framePlan.pdOut, framePlan.masterOd, framePlan.deviceOd, framePlan.pdIn))
+        self.times.extend((startTimes[begin], endTimes[deviceBegin - 1],
+                           startTimes[deviceBegin], endTimes[deviceBegin + framePlan.deviceLength - 1]))
+        self.validity += b'\x00\x00'
+        return len(self.begins) - 1
+
+    def pop(self) -> None:
+        """Removes the last row (its views must not be used anymore)."""
+        self.begins.pop()
+        del self.lengths[-4:], self.times[-4:], self.validity[-2:]
+
+    def __len__(self) -> int:
+        return len(self.begins)
+
+
+class MasterMessageView:
+    """
+    Master message referencing its octets in the capture buffer (no copies), isinstance of MasterMessage.
+
+    A view only holds its row in the MessageViewFrames of its batch, all other attributes are read-only properties:
+    mc/ckt are interned decoded octets (see IntOctetDecoderBase.decode), the checksum is verified on first access,
+    pdOut/od are memoryview slices of the capture buffer (read-only if the buffer is read-only).
+    """
+    __slots__ = ('_frames', '_row')
+
+    def __init__(self, frames: MessageViewFrames, row: int):
+        self._frames: MessageViewFrames = frames
+        self._row: int = row
+
+    @property
+    def startTime(self) -> int:
+        return self._frames.times[4 * self._row]
+
+    @property
+    def endTime(self) -> int:
+        return self._frames.times[4 * self._row + 1]
+
+    @property
+    def mc(self) -> MC:
+        return MC.decode(self._frames.buffer[self._frames.begins[self._row]])
+
+    @property
+    def ckt(self) -> CKT:
+        return CKT.decode(self._frames.buffer[self._frames.begins[self._row] + 1])
+
+    @property
+    def pdOut(self) -> memoryview:
+        begin = self._frames.begins[self._row] + 2
+        return self._frames.buffer[begin:begin + self._frames.lengths[4 * self._row]]
+
+    @property
+    def od(self) -> memoryview:
+        lengths = self._frames.lengths
+        begin = self._frames.begins[self._row] + 2 + lengths[4 * self._row]
+        return self._frames.buffer[begin:begin + lengths[4 * self._row + 1]]
+
+    @property
+    def isValid(self) -> bool:
+        frames, position = self._frames, 2 * self._row
+        if frames.validity[position] == MessageViewFrames._UNKNOWN:
+            begin = frames.begins[self._row]
+            mc, ckt = frames.buffer[begin], frames.buffer[begin + 1]
+            frameEnd = begin + 2 + frames.lengths[4 * self._row] + frames.lengths[4 * self._row + 1]
+            isValid = (ckt & 0x3F) == _checksum(frames.buffer[begin + 2:frameEnd], mc ^ (ckt & 0xC0))
+            frames.validity[position] = MessageViewFrames._VALID if isValid else MessageViewFrames._INVALID
+        return frames.validity[position] == MessageViewFrames._VALID
+
+    dispatch = MasterMessage.dispatch
+    channel = MasterMessage.channel
+    __repr__ = MasterMessage.__repr__
+
+    def toMessage(self) -> MasterMessage:
+        """Creates an independent MasterMessage (copy of all octets)."""
+        msg = MasterMessage()
+        msg.startTime, msg.endTime = self.startTime, self.endTime
+        msg.mc, msg.ckt = self.mc.copy(), self.ckt.copy()
+        msg.pdOut, msg.od = bytearray(self.pdOut), bytearray(self.od)
+        msg.isValid = self.isValid
+        return msg
+
+    def __reduce__(self):  # memoryview can't be pickled -> pickled as MasterMessage
+        return _unpickleMessage, (self.toMessage(),)
+
+
+class DeviceMessageView:
+    """
+    Device message referencing its octets in the capture buffer (no copies), isinstance of DeviceMessage.
+
+    cks is an interned decoded octet (see IntOctetDecoderBase.decode), the checksum is verified on first access.
+    od/pdIn are memoryview slices of the capture buffer (read-only if the buffer is read-only, see MasterMessageView).
+    """
+    __slots__ = ('_frames', '_row')
+
+    def __init__(self, frames: MessageViewFrames, row: int):
+        self._frames: MessageViewFrames = frames
+        self._row: int = row
+
+    def _begin(self) -> int:
+        lengths, row = self._frames.lengths, self._row
+        return self._frames.begins[row] + 2 + lengths[4 * row] + lengths[4 * row + 1]
+
+    @property
+    def startTime(self) -> int:
+        return self._frames.times[4 * self._row + 2]
+
+    @property
+    def endTime(self) -> int:
+        return self._frames.times[4 * self._row + 3]
+
+    @property
+    def od(self) -> memoryview:
+        begin = self._begin()
+        return self._frames.buffer[begin:begin + self._frames.lengths[4 * self._row + 2]]
+
+    @property
+    def pdIn(self) -> memoryview:
+        begin = self._begin() + self._frames.lengths[4 * self._row + 2]
+        return self._frames.buffer[begin:begin + self._frames.lengths[4 * self._row + 3]]
+
+    @property
+    def cks(self) -> CKS:
+        lengths = self._frames.lengths
+        return CKS.decode(self._frames.buffer[self._begin() + lengths[4 * self._row + 2] + lengths[4 * self._row + 3]])
+
+    @property
+    def isValid(self) -> bool:
+        frames, position = self._frames, 2 * self._row + 1
+        if frames.validity[position] == MessageViewFrames._UNKNOWN:
+            begin = self._begin()
+            pos = begin + frames.lengths[4 * self._row + 2] + frames.lengths[4 * self._row + 3]
+            cks = frames.buffer[pos]
+            isValid = (cks & 0x3F) == _checksum(frames.buffer[begin:pos], cks & 0xC0)
+            frames.validity[position] = MessageViewFrames._VALID if isValid else MessageViewFrames._INVALID
+        return frames.validity[position] == MessageViewFrames._VALID
+
+    dispatch = DeviceMessage.dispatch
+    channel = DeviceMessage.channel
+    __repr__ = DeviceMessage.__repr__
+
+    def toMessage(self) -> DeviceMessage:
+        """Creates an independent DeviceMessage (copy of all octets)."""
+        msg = DeviceMessage()
+        msg.startTime, msg.endTime = self.startTime, self.endTime
+        msg.od, msg.pdIn = bytearray(self.od), bytearray(self.pdIn)
+        msg.cks = self.cks.copy()
+        msg.isValid = self.isValid
+        return msg
+
+    def __reduce__(self):  # memoryview can't be pickled -> pickled as DeviceMessage
+        return _unpickleMessage, (self.toMessage(),)
+
+
+# virtual subclasses: views don't inherit the slots of the messages (only two references per view)
+MasterMessage.register(MasterMessageView)
+DeviceMessage.register(DeviceMessageView)
+
+
+def createMessageViews(frames: MessageViewFrames, begin: int, framePlan: FramePlan, startTimes: Sequence[int],
+                       endTimes: Sequence[int]) -> Tuple[MasterMessageView, DeviceMessageView]:
+    """Same as createMasterMessage/createDeviceMessage for a complete M-sequence, but returns views into frames."""
+    row = frames.append(begin, framePlan, startTimes, endTimes)
+    return MasterMessageView(frames, row), DeviceMessageView(frames, row)
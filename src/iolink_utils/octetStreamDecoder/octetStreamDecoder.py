@@ -1,78 +1,374 @@
-from typing import Union, Optional
+from typing import Union, Optional, List, Sequence, Tuple
 import copy
-from datetime import datetime as dt, timedelta
+import warnings
+from datetime import timedelta
 
+from iolink_utils.exceptions import InvalidMSeqCode
 from iolink_utils.definitions.timing import getMaxFrameTransmissionDelay_master, getMaxResponseTime, \
     getMaxFrameTransmissionDelay_device
-from ._octetStreamDecoderInternal import DecodingState, MessageState, DeviceMessageDecoder, MasterMessageDecoder
-from .octetStreamDecoderSettings import DecoderSettings
+from ._octetStreamDecoderInternal import DecodingState, MessageState, DeviceMessageDecoder, MasterMessageDecoder, \
+    createMasterMessage, createDeviceMessage
+from .octetStreamDecoderSettings import DecoderSettings, FramePlan, Timestamp, TimestampMode, getFramePlanIndex
+from .frameSegmentation import FrameSegmentation, isFrameSegmentationAvailable, segmentFrames
 from .octetStreamDecoderMessages import DeviceMessage, MasterMessage
+from .messageViews import MessageViewFrames, asOctetBuffer, createMessageViews
+
+
+def _asSequence(values) -> Sequence:
+    # array.array, memoryview and numpy arrays are converted into a list of python objects in one go
+    # (iterating them element-wise would create a new (numpy) scalar for every single octet)
+    toList = getattr(values, 'tolist', None)
+    return toList() if toList is not None else values
+
+
+# decoding state (everything else is derived from the settings or only holds return values)
+_SNAPSHOT_ATTRIBUTES = ('_settings', '_state', '_messageDecoder', '_lastProcessedOctetEndTime',
+                        '_useMessageViews', '_resync', '_maxResyncLookahead',
+                        '_resyncOctets', '_resyncShift', '_skippedOctets')
 
 
 class OctetStreamDecoder:
-    def __init__(self, settings: DecoderSettings):
+    def __init__(self, settings: DecoderSettings, messageViews: bool = False,
+                 resync: bool = False, maxResyncLookahead: int = 8):
+        """
+        :param settings: decoder settings
+        :param messageViews: processOctets() returns complete M-sequences as MasterMessageView/DeviceMessageView
+                             (zero-copy views into the octet buffer, offsets and timestamps are shared per batch,
+                             see MessageViewFrames: less than half the memory of messages). Views are only created
+                             by the frame segmentation (numpy and integer timestamps) for M-sequences completely
+                             within one batch of values supporting the buffer protocol, all other messages (e.g.
+                             processOctet(), M-sequences spanning two batches, resynchronized frames) are regular
+                             messages.
+                             A RuntimeWarning is issued if views can't be created at all (no numpy, DateTime).
+        :param resync: if a master frame has an invalid checksum or M-sequence type, search a valid master frame
+                       starting at one of the following octets instead of returning the invalid message
+                       (see skippedOctets)
+        :param maxResyncLookahead: max number of octets skipped while searching a valid master frame
+        """
         self._settings: DecoderSettings = copy.deepcopy(settings)
 
         self._state: DecodingState = DecodingState.Idle
         self._messageDecoder: Union[None, MasterMessageDecoder, DeviceMessageDecoder] = None
         self._lastMasterMessage: Optional[MasterMessage] = None
         self._lastDeviceMessage: Optional[DeviceMessage] = None
+        self._useFrameSegmentation: bool = isFrameSegmentationAvailable()
+        self._useMessageViews: bool = messageViews
 
-        self._lastProcessedOctetEndTime: dt = dt(1970, 1, 1)
+        self._resync: bool = resync
+        self._maxResyncLookahead: int = maxResyncLookahead
+        self._resyncOctets: List[Tuple[int, Timestamp, Timestamp]] = []  # octets of the current master frame
+        self._resyncShift: int = 0  # index of the current master frame candidate in _resyncOctets
+        self._skippedOctets: int = 0
 
-        self._timingConstraints = {
-            DecodingState.Idle: 0,
-            DecodingState.MasterMessage: getMaxFrameTransmissionDelay_master(self._settings.transmissionRate),
-            DecodingState.DeviceResponseDelay: getMaxResponseTime(self._settings.transmissionRate),
-            DecodingState.DeviceMessage: getMaxFrameTransmissionDelay_device(self._settings.transmissionRate),
-        }
-        self._maxFrameTransmissionDelay: float = self._timingConstraints[DecodingState.Idle]
+        self._lastProcessedOctetEndTime: Timestamp = self._settings.getTimestampOrigin()
+        self._applySettings()
+        self._checkMessageViews()
 
     @property
     def settings(self) -> DecoderSettings:
         return self._settings
 
+    @property
+    def skippedOctets(self) -> int:
+        """
+        Number of octets not being part of any message (resync mode, or the rest of an M-sequence with invalid
+        M-sequence type in processOctets).
+        """
+        return self._skippedOctets
+
     def setSettings(self, settings: DecoderSettings):
+        timestampModeChanged = settings.timestampMode != self._settings.timestampMode
         self._settings = copy.deepcopy(settings)
+        if timestampModeChanged:
+            self._lastProcessedOctetEndTime = self._settings.getTimestampOrigin()
+            self._state = DecodingState.Idle
+            self._checkMessageViews()
+        self._applySettings()
+
+    def _checkMessageViews(self):
+        if self._useMessageViews and not self._isFrameSegmentationUsed():
+            warnings.warn("messageViews requires numpy and integer timestamps (TimestampMode.Nanoseconds/Samples), "
+                          "regular messages are returned instead", RuntimeWarning, stacklevel=3)
+
+    def _isFrameSegmentationUsed(self) -> bool:
+        return self._useFrameSegmentation and self._settings.timestampMode != TimestampMode.DateTime
+
+    def _applySettings(self):
+        # timing constraints are converted once into the unit of the octet timestamps
+        # (timedelta or int), so that checking an octet is a single subtraction and comparison
+        transmissionRate = self._settings.transmissionRate
+        self._timingConstraints = {
+            DecodingState.Idle: self._settings.getTimingThreshold(0),
+            DecodingState.MasterMessage: self._settings.getTimingThreshold(
+                getMaxFrameTransmissionDelay_master(transmissionRate)),
+            DecodingState.DeviceResponseDelay: self._settings.getTimingThreshold(
+                getMaxResponseTime(transmissionRate)),
+            DecodingState.DeviceMessage: self._settings.getTimingThreshold(
+                getMaxFrameTransmissionDelay_device(transmissionRate)),
+        }
+        self._timingConstraints[DecodingState.Resync] = self._timingConstraints[DecodingState.MasterMessage]
+        self._timingConstraints[DecodingState.Discard] = self._timingConstraints[DecodingState.DeviceResponseDelay]
+        self._maxFrameTransmissionDelay: Union[timedelta, int] = self._timingConstraints[self._state]
+        self._framePlans: List[Optional[FramePlan]] = self._settings.compileFramePlans()
 
     def _updateTimingConstraint(self, state: DecodingState):
         self._maxFrameTransmissionDelay = self._timingConstraints[state]
 
-    def _isWithinTimingConstraints(self, octetStartTime: dt) -> bool:
-        return (octetStartTime - self._lastProcessedOctetEndTime) < timedelta(
-            microseconds=self._maxFrameTransmissionDelay)
+    def _isWithinTimingConstraints(self, octetStartTime: Timestamp) -> bool:
+        return (octetStartTime - self._lastProcessedOctetEndTime) < self._maxFrameTransmissionDelay
 
     def _gotoState(self, state: DecodingState):
         self._state = state
         self._updateTimingConstraint(self._state)
 
+    def _startMasterMessage(self):
+        self._messageDecoder = MasterMessageDecoder(self._framePlans)
+        self._gotoState(DecodingState.MasterMessage)
+        self._lastMasterMessage = None
+        self._lastDeviceMessage = None
+        self._resyncOctets = []
+
+    def _finishMessage(self) -> Union[MasterMessage, DeviceMessage]:
+        if self._state == DecodingState.MasterMessage:
+            self._lastMasterMessage = self._messageDecoder.msg
+            self._messageDecoder = DeviceMessageDecoder(self._messageDecoder.framePlan)
+            self._gotoState(DecodingState.DeviceResponseDelay)
+            return self._lastMasterMessage
+
+        self._lastDeviceMessage = self._messageDecoder.msg
+        self._gotoState(DecodingState.Idle)
+        return self._lastDeviceMessage
+
     def reset(self):
         self._state: DecodingState = DecodingState.Idle
+        self._resyncOctets = []
 
-    def processOctet(self, octet, startTime: dt, endTime: dt) -> Union[None, MasterMessage, DeviceMessage]:
-        if self._state == DecodingState.Idle or not self._isWithinTimingConstraints(startTime):
-            self._messageDecoder = MasterMessageDecoder(self._settings)
-            self._gotoState(DecodingState.MasterMessage)
-            self._lastMasterMessage = None
-            self._lastDeviceMessage = None
-        self._lastProcessedOctetEndTime = endTime
+    def snapshot(self) -> dict:
+        """
+        Snapshot of the complete decoding state (settings, partially decoded message, timing, resync),
+        e.g. to resume decoding a capture later (picklable, see restore()).
+        """
+        return copy.deepcopy({name: getattr(self, name) for name in _SNAPSHOT_ATTRIBUTES})
 
-        if self._state == DecodingState.MasterMessage:
-            if self._messageDecoder.processOctet(octet, startTime, endTime) == MessageState.Finished:
-                self._gotoState(DecodingState.DeviceResponseDelay)
-                self._lastMasterMessage = self._messageDecoder.msg
-                return self._lastMasterMessage
-
-        if self._state == DecodingState.DeviceResponseDelay:
-            self._lastMasterMessage: MasterMessage  # type hint
-            self._messageDecoder = DeviceMessageDecoder(self._settings, self._lastMasterMessage.mc.read,
-                                                        self._lastMasterMessage.ckt.mSeqType)
+    def restore(self, snapshot: dict):
+        """
+        Continues decoding from a snapshot (the snapshot is not modified and can be restored several times).
+        """
+        for name, value in copy.deepcopy(snapshot).items():
+            setattr(self, name, value)
+        self._lastMasterMessage = None
+        self._lastDeviceMessage = None
+        self._applySettings()
+
+    def _startResync(self) -> Optional[MasterMessage]:
+        self._gotoState(DecodingState.Resync)
+        self._resyncShift = 1
+        return self._searchMasterFrame()
+
+    def _searchMasterFrame(self) -> Optional[MasterMessage]:
+        # slides over the octets of the invalid master frame (and the octets following it within master timing)
+        # until M-sequence type and checksum fit (bounded by maxResyncLookahead)
+        octets = self._resyncOctets
+        while self._resyncShift <= self._maxResyncLookahead:
+            shift = self._resyncShift
+            if len(octets) - shift < 2:
+                return None  # wait for more octets
+
+            framePlan = self._framePlans[getFramePlanIndex(octets[shift + 1][0] >> 6, octets[shift][0] >> 7)]
+            if framePlan is not None:
+                if len(octets) - shift < framePlan.masterLength:
+                    return None  # wait for more octets
+
+                values, startTimes, endTimes = (list(column) for column in zip(*octets))
+                msg = createMasterMessage(values, startTimes, endTimes, shift, framePlan.pdOut, framePlan.masterOd)
+                if msg.isValid:
+                    self._skippedOctets += len(octets) - framePlan.masterLength
+                    self._resyncOctets = []
+                    self._lastMasterMessage = msg
+                    self._messageDecoder = DeviceMessageDecoder(framePlan)
+                    self._gotoState(DecodingState.DeviceResponseDelay)
+                    return msg
+
+            self._resyncShift += 1
+
+        self._abortResync()
+        return None
+
+    def _abortResync(self):
+        # incomplete master frame (resync mode only) or no valid master frame found
+        self._skippedOctets += len(self._resyncOctets)
+        self._resyncOctets = []
+        if self._state == DecodingState.Resync:
+            self._gotoState(DecodingState.Discard)
+
+    def processOctet(self, octet, startTime: Timestamp, endTime: Timestamp) -> Union[None, MasterMessage, DeviceMessage]:
+        if self._resyncOctets and not self._isWithinTimingConstraints(startTime):
+            self._abortResync()  # end of master frame -> skip octets until next M-sequence
+
+        if self._state == DecodingState.Idle or not self._isWithinTimingConstraints(startTime):
+            self._startMasterMessage()
+        elif self._state == DecodingState.DeviceResponseDelay:
             self._gotoState(DecodingState.DeviceMessage)
+        elif self._state == DecodingState.Resync:
+            self._lastProcessedOctetEndTime = endTime
+            self._resyncOctets.append((octet, startTime, endTime))
+            return self._searchMasterFrame()
+        elif self._state == DecodingState.Discard:
+            self._lastProcessedOctetEndTime = endTime
+            self._skippedOctets += 1
+            return None
+        self._lastProcessedOctetEndTime = endTime
 
-        if self._state == DecodingState.DeviceMessage:
-            if self._messageDecoder.processOctet(octet, startTime, endTime) == MessageState.Finished:
-                self._gotoState(DecodingState.Idle)
-                self._lastDeviceMessage = self._messageDecoder.msg
-                return self._lastDeviceMessage
+        if self._resync and self._state == DecodingState.MasterMessage:
+            self._resyncOctets.append((octet, startTime, endTime))
+        try:
+            messageState = self._messageDecoder.processOctet(octet, startTime, endTime)
+        except InvalidMSeqCode:
+            if not self._resyncOctets:
+                raise
+            return self._startResync()  # same as an invalid checksum
 
+        if messageState == MessageState.Finished:
+            if self._resyncOctets:
+                if not self._messageDecoder.msg.isValid:
+                    return self._startResync()
+                self._resyncOctets = []
+            return self._finishMessage()
         return None
+
+    def _discardInvalidMSeqType(self, endTime: Timestamp) -> MasterMessage:
+        # invalid M-sequence type (processOctets): the frame length is unknown -> invalid message (MC, CKT),
+        # the remaining octets of the M-sequence are skipped
+        msg = self._messageDecoder.msg
+        msg.endTime = endTime
+        self._lastMasterMessage = msg
+        self._gotoState(DecodingState.Discard)
+        return msg
+
+    def processOctets(self, values, startTimes, endTimes) -> List[Union[MasterMessage, DeviceMessage]]:
+        """
+        Decodes a batch of octets (e.g. a chunk of a capture) in a single call.
+
+        Decoding state is kept between calls, so a capture can be fed in chunks of any size.
+        The result is identical to calling processOctet() for every octet, except for master frames with an
+        invalid M-sequence type (resync off): instead of raising InvalidMSeqCode, an invalid MasterMessage
+        (MC and CKT only) is returned and the remaining octets of the M-sequence are skipped (see skippedOctets).
+
+        :param values: octet values (sequence of ints, bytes, bytearray, array.array or numpy array)
+        :param startTimes: start time of each octet (same length as values, see DecoderSettings.timestampMode)
+        :param endTimes: end time of each octet (same length as values)
+        :return: all messages (MasterMessage/DeviceMessage) finished within this batch
+        """
+        messages: List[Union[MasterMessage, DeviceMessage]] = []
+
+        if self._isFrameSegmentationUsed():
+            self._processFrames(values, startTimes, endTimes, messages)
+        else:
+            self._processOctetRange(_asSequence(values), _asSequence(startTimes), _asSequence(endTimes),
+                                    0, len(values), messages)
+
+        return messages
+
+    def _processOctetRange(self, values: Sequence[int], startTimes: Sequence[Timestamp], endTimes: Sequence[Timestamp],
+                           begin: int, end: int, messages: List[Union[MasterMessage, DeviceMessage]]):
+        appendMessage = messages.append
+        if self._resync:
+            for octet, startTime, endTime in zip(values[begin:end], startTimes[begin:end], endTimes[begin:end]):
+                message = self.processOctet(octet, startTime, endTime)
+                if message is not None:
+                    appendMessage(message)
+            return
+
+        idle = DecodingState.Idle
+        deviceResponseDelay = DecodingState.DeviceResponseDelay
+        discard = DecodingState.Discard
+        finished = MessageState.Finished
+
+        for octet, startTime, endTime in zip(values[begin:end], startTimes[begin:end], endTimes[begin:end]):
+            state = self._state
+            if state == idle or not (startTime - self._lastProcessedOctetEndTime) < self._maxFrameTransmissionDelay:
+                self._startMasterMessage()
+            elif state == deviceResponseDelay:
+                self._gotoState(DecodingState.DeviceMessage)
+            elif state == discard:
+                self._lastProcessedOctetEndTime = endTime
+                self._skippedOctets += 1
+                continue
+            self._lastProcessedOctetEndTime = endTime
+
+            try:
+                if self._messageDecoder.processOctet(octet, startTime, endTime) == finished:
+                    appendMessage(self._finishMessage())
+            except InvalidMSeqCode:
+                appendMessage(self._discardInvalidMSeqType(endTime))
+
+    def _processFrames(self, values, startTimes, endTimes, messages: List[Union[MasterMessage, DeviceMessage]]):
+        # numpy pre-pass: find the gaps that always start a new M-sequence, then decode whole frames
+        # (per-octet decoding is only used for anything that does not form a complete, well-timed M-sequence)
+        segmentation = segmentFrames(startTimes, endTimes, self._lastProcessedOctetEndTime,
+                                     self._timingConstraints[DecodingState.MasterMessage],
+                                     self._timingConstraints[DecodingState.DeviceResponseDelay],
+                                     self._timingConstraints[DecodingState.DeviceMessage])
+        octetBuffer = asOctetBuffer(values) if self._useMessageViews else None
+        frames = MessageViewFrames(octetBuffer) if octetBuffer is not None else None
+        values, startTimes, endTimes = _asSequence(values), _asSequence(startTimes), _asSequence(endTimes)
+
+        segmentStarts = segmentation.boundaries
+        if self._state == DecodingState.Idle and (not segmentStarts or segmentStarts[0] != 0):
+            segmentStarts = [0] + segmentStarts
+        segmentEnds = segmentStarts[1:] + [len(values)]
+
+        if segmentStarts and segmentStarts[0] > 0:  # continuation of an M-sequence of the previous call
+            self._processOctetRange(values, startTimes, endTimes, 0, segmentStarts[0], messages)
+        elif not segmentStarts:
+            self._processOctetRange(values, startTimes, endTimes, 0, len(values), messages)
+
+        for begin, end in zip(segmentStarts, segmentEnds):
+            self._processSegment(values, startTimes, endTimes, begin, end, segmentation, frames, messages)
+
+    def _processSegment(self, values: Sequence[int], startTimes: Sequence[int], endTimes: Sequence[int],
+                        begin: int, end: int, segmentation: FrameSegmentation, frames: Optional[MessageViewFrames],
+                        messages: List[Union[MasterMessage, DeviceMessage]]):
+        masterGapViolations = segmentation.masterGapViolations
+        deviceGapViolations = segmentation.deviceGapViolations
+        framePlans = self._framePlans
+
+        self._abortResync()  # segments start after a gap >= max response time (or in idle state)
+
+        pos = begin
+        while end - pos >= 2:
+            framePlan = framePlans[((values[pos + 1] >> 6) << 1) | (values[pos] >> 7)]  # see getFramePlanIndex
+            if framePlan is None:
+                break  # invalid M-sequence type -> handled (invalid message or resynchronized) by octet decoding
+
+            deviceBegin = pos + framePlan.masterLength
+            frameEnd = deviceBegin + framePlan.deviceLength
+
+            if (frameEnd > end or
+                    masterGapViolations[deviceBegin - 1] != masterGapViolations[pos] or
+                    deviceGapViolations[frameEnd - 1] != deviceGapViolations[deviceBegin]):
+                break  # incomplete or invalid timing -> handled by octet decoding
+
+            if frames is None:
+                masterMessage = createMasterMessage(values, startTimes, endTimes, pos,
+                                                    framePlan.pdOut, framePlan.masterOd)
+                if self._resync and not masterMessage.isValid:
+                    break  # resynchronization -> handled by octet decoding
+                deviceMessage = createDeviceMessage(values, startTimes, endTimes, deviceBegin,
+                                                    framePlan.deviceOd, framePlan.pdIn)
+            else:
+                masterMessage, deviceMessage = createMessageViews(frames, pos, framePlan, startTimes, endTimes)
+                if self._resync and not masterMessage.isValid:
+                    frames.pop()
+                    break  # resynchronization -> handled by octet decoding
+
+            self._lastMasterMessage = masterMessage
+            self._lastDeviceMessage = deviceMessage
+            messages.append(self._lastMasterMessage)
+            messages.append(self._lastDeviceMessage)
+            self._lastProcessedOctetEndTime = endTimes[frameEnd - 1]
+            self._gotoState(DecodingState.Idle)
+            pos = frameEnd
+
+        if pos < end:
+            self._processOctetRange(values, startTimes, endTimes, pos, end, messages)
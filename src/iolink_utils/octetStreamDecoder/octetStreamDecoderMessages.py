@@ -3,13 +3,16 @@ from typing import Union
 from abc import ABC, abstractmethod
 
 from iolink_utils.definitions.communicationChannel import CommChannel
-from iolink_utils.octetDecoder.octetDecoder import MC, CKT, CKS
+from iolink_utils.octetDecoder.intOctetDecoder import MC, CKT, CKS
+from .octetStreamDecoderSettings import Timestamp
 
 
 class Message(ABC):
+    __slots__ = ('startTime', 'endTime', 'isValid')
+
     def __init__(self):
-        self.startTime: dt = dt(1970, 1, 1)
-        self.endTime: dt = dt(1970, 1, 1)
+        self.startTime: Timestamp = dt(1970, 1, 1)
+        self.endTime: Timestamp = dt(1970, 1, 1)
         self.isValid: bool = False
 
     @abstractmethod
@@ -22,6 +25,13 @@ class Message(ABC):
 
 
 class MasterMessage(Message):
+    """
+    Master message. Messages created by OctetStreamDecoder hold interned, immutable octets in mc/ckt (DecodedOctet,
+    see OctetDecoderBase.decode), messages created directly hold mutable octets (MC, CKT). Both have the same
+    fields, int() and comparison. To change an octet of a decoded message, assign a new one (e.g. msg.mc = MC(0x70)).
+    """
+    __slots__ = ('mc', 'ckt', 'pdOut', 'od')
+
     def __init__(self):
         super().__init__()
 
@@ -49,6 +59,9 @@ class MasterMessage(Message):
 
 
 class DeviceMessage(Message):
+    """Device message. cks is immutable in messages created by OctetStreamDecoder (see MasterMessage)."""
+    __slots__ = ('od', 'pdIn', 'cks')
+
     def __init__(self):
         super().__init__()
 
@@ -1,12 +1,25 @@
-from typing import Union
+from typing import List, NamedTuple, Optional, Union
+from math import ceil
+from enum import IntEnum
+from datetime import datetime as dt, timedelta
 from dataclasses import dataclass, field
 
-from iolink_utils.exceptions import InvalidMSeqCode
+from iolink_utils.exceptions import InvalidMSeqCode, InvalidSampleRate
 from iolink_utils.definitions.bitRate import BitRate
 from iolink_utils.definitions.mSequenceType import MSeqType
+from iolink_utils.definitions.timing import getMaxMSequenceTime
 from iolink_utils.iodd.iodd import Iodd
 
 
+class TimestampMode(IntEnum):
+    DateTime = 0  # octet times are datetime objects
+    Nanoseconds = 1  # octet times are integers (nanoseconds)
+    Samples = 2  # octet times are integers (sample counts, see DecoderSettings.sampleRate)
+
+
+Timestamp = Union[dt, int]
+
+
 @dataclass(frozen=True)
 class MSeqPayloadLength:
     pdOut: int = 0
@@ -14,12 +27,30 @@ class MSeqPayloadLength:
     pdIn: int = 0
 
 
+class FramePlan(NamedTuple):
+    """Octet layout of one M-sequence (M-sequence type + read/write), see DecoderSettings.compileFramePlans"""
+    pdOut: int
+    masterOd: int  # on-request data sent by master (write)
+    deviceOd: int  # on-request data sent by device (read)
+    pdIn: int
+    masterLength: int  # MC + CKT + pdOut + od
+    deviceLength: int  # od + pdIn + CKS
+    maxMSequenceTime: Union[None, timedelta, int]  # see A.3.6 (in unit of TimestampMode, None if bit rate undefined)
+
+
+def getFramePlanIndex(mSeqType: int, read: int) -> int:
+    """Index into the frame plan table: raw M-sequence type bits of CKT and read bit of MC."""
+    return (mSeqType << 1) | read
+
+
 @dataclass
 class DecoderSettings:
     transmissionRate: BitRate = field(default_factory=lambda: BitRate('Undefined'))
     startup: MSeqPayloadLength = field(default_factory=MSeqPayloadLength)
     preoperate: MSeqPayloadLength = field(default_factory=MSeqPayloadLength)
     operate: MSeqPayloadLength = field(default_factory=MSeqPayloadLength)
+    timestampMode: TimestampMode = TimestampMode.DateTime
+    sampleRate: int = 0  # in Hz (only used with TimestampMode.Samples)
 
     def getPayloadLength(self, mSeqType: Union[int, MSeqType]) -> MSeqPayloadLength:
         try:
@@ -33,6 +64,52 @@ class DecoderSettings:
             MSeqType.Type_2_OPERATE: self.operate,
         }[mst]
 
+    def compileFramePlans(self) -> List[Optional[FramePlan]]:
+        """
+        Compiles the payload lengths into a lookup table of all 8 combinations of M-sequence type (2 bits)
+        and read bit (see getFramePlanIndex). Invalid M-sequence types (3) are None.
+        """
+        framePlans: List[Optional[FramePlan]] = [None] * 8
+        for mSeqType in MSeqType:
+            payloadLength = self.getPayloadLength(mSeqType)
+            for read in (0, 1):
+                masterOd = 0 if read else payloadLength.od
+                deviceOd = payloadLength.od if read else 0
+                masterLength = 2 + payloadLength.pdOut + masterOd
+                deviceLength = deviceOd + payloadLength.pdIn + 1
+
+                maxMSequenceTime = None
+                if self.transmissionRate != BitRate.Undefined:
+                    maxMSequenceTime = self.getTimingThreshold(
+                        getMaxMSequenceTime(self.transmissionRate, masterLength, deviceLength))
+
+                framePlans[getFramePlanIndex(mSeqType, read)] = FramePlan(
+                    payloadLength.pdOut, masterOd, deviceOd, payloadLength.pdIn,
+                    masterLength, deviceLength, maxMSequenceTime)
+        return framePlans
+
+    def getTimestampOrigin(self) -> Timestamp:
+        """Returns the 'zero' timestamp of the configured timestamp mode."""
+        return dt(1970, 1, 1) if self.timestampMode == TimestampMode.DateTime else 0
+
+    def getTimingThreshold(self, microseconds: float) -> Union[timedelta, int]:
+        """
+        Converts a duration into the unit of the configured timestamp mode, so that it can
+        directly be compared to the difference of two octet timestamps.
+        Integer thresholds are rounded up: for integer timestamps, 'gap < threshold' then gives the
+        same result as comparing the exact durations.
+        :param microseconds: duration in microseconds
+        :return: timedelta (TimestampMode.DateTime) or int (nanoseconds or samples)
+        """
+        if self.timestampMode == TimestampMode.DateTime:
+            return timedelta(microseconds=microseconds)
+        if self.timestampMode == TimestampMode.Nanoseconds:
+            return ceil(round(microseconds * 1000, 6))
+
+        if self.sampleRate <= 0:
+            raise InvalidSampleRate(f"Invalid sample rate: {self.sampleRate} (required for TimestampMode.Samples)")
+        return ceil(round(microseconds * self.sampleRate / 1_000_000, 6))
+
     @staticmethod
     def fromIODD(iodd: Iodd) -> "DecoderSettings":
         return DecoderSettings(
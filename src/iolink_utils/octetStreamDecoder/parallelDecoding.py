@@ -0,0 +1,93 @@
+from typing import List, Optional, Union
+from bisect import bisect_left
+from concurrent.futures import Executor, ProcessPoolExecutor
+import os
+
+from iolink_utils.definitions.timing import getMaxFrameTransmissionDelay_master, getMaxResponseTime, \
+    getMaxFrameTransmissionDelay_device
+from .octetStreamDecoder import OctetStreamDecoder
+from .octetStreamDecoderSettings import DecoderSettings
+from .octetStreamDecoderMessages import MasterMessage, DeviceMessage
+from .frameSegmentation import isFrameSegmentationAvailable, calculateGaps
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def getSplitGap(settings: DecoderSettings):
+    """
+    Minimum gap in front of an octet that restarts the OctetStreamDecoder with a new master message,
+    no matter in which state it is (longest timing constraint, in the unit of the timestamps).
+    """
+    transmissionRate = settings.transmissionRate
+    return max(settings.getTimingThreshold(getMaxFrameTransmissionDelay_master(transmissionRate)),
+               settings.getTimingThreshold(getMaxResponseTime(transmissionRate)),
+               settings.getTimingThreshold(getMaxFrameTransmissionDelay_device(transmissionRate)))
+
+
+def findSplitPoints(startTimes, endTimes, minGap) -> List[int]:
+    """
+    Finds all octets (index) with a gap of at least minGap in front of them. Decoding can be split at these
+    points: a decoder started at such an octet produces the same messages as a decoder that saw all octets before.
+    """
+    if isFrameSegmentationAvailable() and isinstance(minGap, int):  # integer timestamps (see TimestampMode)
+        if len(startTimes) < 2:
+            return []
+        gaps = calculateGaps(startTimes, endTimes, startTimes[0])  # first gap is 0 (never a split point)
+        return np.flatnonzero(gaps >= minGap).tolist()
+
+    return [index for index in range(1, len(startTimes)) if startTimes[index] - endTimes[index - 1] >= minGap]
+
+
+def _decodeRange(settings: DecoderSettings, values, startTimes, endTimes) -> List[Union[MasterMessage, DeviceMessage]]:
+    return OctetStreamDecoder(settings).processOctets(values, startTimes, endTimes)
+
+
+def decodeParallel(settings: DecoderSettings, values, startTimes, endTimes,
+                   maxWorkers: Optional[int] = None, minChunkSize: int = 100_000,
+                   executor: Optional[Executor] = None) -> List[Union[MasterMessage, DeviceMessage]]:
+    """
+    Decodes a whole capture in parallel (same result as OctetStreamDecoder(settings).processOctets(...)).
+
+    The capture is split at long idle gaps (see getSplitGap) into chunks of at least minChunkSize octets,
+    which are decoded in separate processes. Messages are returned in capture (timestamp) order.
+
+    :param settings: decoder settings
+    :param values: octet values (sequence of ints, bytes, array.array or numpy array)
+    :param startTimes: start time of each octet
+    :param endTimes: end time of each octet
+    :param maxWorkers: number of worker processes (default: number of CPUs)
+    :param minChunkSize: minimum number of octets per chunk (smaller chunks are not worth the overhead)
+    :param executor: executor to use instead of a new ProcessPoolExecutor
+    :return: all decoded messages (MasterMessage/DeviceMessage)
+    """
+    workerCount = maxWorkers or os.cpu_count() or 1
+
+    chunkSize = max(minChunkSize, -(-len(values) // (workerCount * 4)), 1)  # a few chunks per worker (load balancing)
+    splitPoints = findSplitPoints(startTimes, endTimes, getSplitGap(settings)) if len(values) > chunkSize else []
+
+    chunkBegins = [0]
+    while True:
+        pos = bisect_left(splitPoints, chunkBegins[-1] + chunkSize)
+        if pos >= len(splitPoints):
+            break
+        chunkBegins.append(splitPoints[pos])
+    chunkEnds = chunkBegins[1:] + [len(values)]
+
+    if len(chunkBegins) == 1:
+        return _decodeRange(settings, values, startTimes, endTimes)
+
+    def decodeChunks(pool: Executor) -> List[Union[MasterMessage, DeviceMessage]]:
+        futures = [pool.submit(_decodeRange, settings, values[begin:end], startTimes[begin:end], endTimes[begin:end])
+                   for begin, end in zip(chunkBegins, chunkEnds)]
+        messages: List[Union[MasterMessage, DeviceMessage]] = []
+        for future in futures:  # in capture order (first decoding error is raised, as in sequential decoding)
+            messages.extend(future.result())
+        return messages
+
+    if executor is not None:
+        return decodeChunks(executor)
+    with ProcessPoolExecutor(max_workers=workerCount) as pool:
+        return decodeChunks(pool)
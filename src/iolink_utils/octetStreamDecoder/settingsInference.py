@@ -0,0 +1,210 @@
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+from functools import lru_cache
+from itertools import accumulate
+from operator import xor
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from iolink_utils.exceptions import SettingsInferenceFailed, InvalidMSeqCodePDSizeCombination
+from iolink_utils.definitions.bitRate import BitRate
+from iolink_utils.definitions.mSequenceType import MSeqType
+from iolink_utils.definitions.onRequestDataOctetCount import ODOctetCount
+from iolink_utils.definitions.timing import getBitTimeInUs
+from .octetStreamDecoderSettings import DecoderSettings, MSeqPayloadLength, TimestampMode
+from .parallelDecoding import getSplitGap, findSplitPoints
+from ._compressChecksum import lookup_8to6_compression
+
+
+_lookupTable = np.array(lookup_8to6_compression, dtype=np.uint8) if np is not None else None
+
+
+class _Segments(NamedTuple):
+    # candidate M-sequences of one M-sequence type (numpy arrays if available)
+    begins: Sequence[int]
+    lengths: Sequence[int]
+    reads: Sequence[int]
+
+
+class _Hypothesis:
+    __slots__ = ('payloadLength', 'frameLength', 'frames', 'hits')
+
+    def __init__(self, payloadLength: MSeqPayloadLength):
+        self.payloadLength: MSeqPayloadLength = payloadLength
+        self.frameLength: int = 3 + payloadLength.pdOut + payloadLength.od + payloadLength.pdIn  # MC, CKT, CKS
+        self.frames: int = 0
+        self.hits: int = 0
+
+    @property
+    def hitRate(self) -> float:
+        return self.hits / self.frames if self.frames else 0.0
+
+
+@lru_cache(maxsize=None)
+def getPayloadLengthCandidates(mSeqType: MSeqType) -> List[MSeqPayloadLength]:
+    """
+    All payload lengths allowed by the spec for an M-sequence type (see ODOctetCount):
+    PREOPERATE m-sequence codes (Table A.8) and OPERATE m-sequence codes with all PD sizes (Table A.10).
+    """
+    if mSeqType == MSeqType.Type_0_STARTUP:
+        return [MSeqPayloadLength(pdOut=0, od=1, pdIn=0)]
+    if mSeqType == MSeqType.Type_1_PREOPERATE:
+        return list(dict.fromkeys(MSeqPayloadLength(pdOut=0, od=ODOctetCount.in_preoperate(code)[0], pdIn=0)
+                                  for code in range(4)))
+
+    candidates = {}
+    for code in range(8):
+        for pdIn in range(33):
+            for pdOut in range(33):
+                try:
+                    od = ODOctetCount.in_operate(code, pdIn, pdOut)[0]
+                except InvalidMSeqCodePDSizeCombination:
+                    continue
+                candidates.setdefault(MSeqPayloadLength(pdOut=pdOut, od=od, pdIn=pdIn), None)
+    return list(candidates)
+
+
+def inferTransmissionRate(startTimes, endTimes, settings: DecoderSettings) -> BitRate:
+    """Bit rate with an octet duration (11 bits) closest to the median octet duration."""
+    durations = sorted(end - start for start, end in zip(startTimes, endTimes))
+    if not durations:
+        raise SettingsInferenceFailed("No octets to infer the bit rate from")
+    median = durations[len(durations) // 2]
+    return min((rate for rate in BitRate if rate != BitRate.Undefined),
+               key=lambda rate: abs(median - settings.getTimingThreshold(getBitTimeInUs(rate) * 11)))
+
+
+def _findSegments(values, startTimes, endTimes, settings: DecoderSettings) -> Dict[int, _Segments]:
+    # candidate M-sequences (split at gaps that always start a new M-sequence) grouped by M-sequence type
+    segmentBegins = [0] + findSplitPoints(startTimes, endTimes, getSplitGap(settings))
+    segmentEnds = segmentBegins[1:] + [len(values)]
+
+    segments: Dict[int, List[Tuple[int, int, int]]] = {mSeqType: [] for mSeqType in MSeqType}
+    for begin, end in zip(segmentBegins, segmentEnds):
+        if end - begin >= 3 and (values[begin + 1] >> 6) in segments:
+            segments[values[begin + 1] >> 6].append((begin, end - begin, values[begin] >> 7))
+
+    asArray = (lambda column: np.array(column, dtype=np.intp)) if np is not None else list
+    return {mSeqType: _Segments(*(asArray(column) for column in zip(*typeSegments))) if typeSegments else
+            _Segments([], [], []) for mSeqType, typeSegments in segments.items()}
+
+
+def _calculatePrefixXor(values):
+    # XOR of octets [begin, end) = prefixXor[end] ^ prefixXor[begin]
+    if np is not None:
+        prefixXor = np.zeros(len(values) + 1, dtype=np.uint8)
+        if isinstance(values, (bytes, bytearray, memoryview)):
+            values = np.frombuffer(values, dtype=np.uint8)
+        np.bitwise_xor.accumulate(np.asarray(values, dtype=np.uint8), out=prefixXor[1:])
+        return prefixXor
+    return list(accumulate(values, xor, initial=0))
+
+
+def _isChecksumValid(frameXor: int, checksumOctet: int) -> bool:
+    # frameXor includes the 6 checksum bits of CKT/CKS (XORed out again)
+    return lookup_8to6_compression[frameXor ^ (checksumOctet & 0x3F) ^ 0x52] == checksumOctet & 0x3F
+
+
+def _scoreHypothesis(values, prefixXor, segments: _Segments, hypothesis: _Hypothesis):
+    # first M-sequence of every segment: master and device checksum must be valid
+    payload = hypothesis.payloadLength
+    hypothesis.frames += len(segments.begins)
+
+    if np is None:
+        for begin, length, read in zip(*segments):
+            if length >= hypothesis.frameLength:
+                masterEnd = begin + 2 + payload.pdOut + (0 if read else payload.od)
+                deviceEnd = begin + hypothesis.frameLength
+                if (_isChecksumValid(prefixXor[masterEnd] ^ prefixXor[begin], values[begin + 1]) and
+                        _isChecksumValid(prefixXor[deviceEnd] ^ prefixXor[masterEnd], values[deviceEnd - 1])):
+                    hypothesis.hits += 1
+        return
+
+    complete = segments.lengths >= hypothesis.frameLength
+    begins, reads = segments.begins[complete], segments.reads[complete]
+    masterEnds = begins + (2 + payload.pdOut) + np.where(reads, 0, payload.od)
+    deviceEnds = begins + hypothesis.frameLength
+
+    ckt = prefixXor[begins + 2] ^ prefixXor[begins + 1]  # octet i = prefixXor[i + 1] ^ prefixXor[i]
+    cks = prefixXor[deviceEnds] ^ prefixXor[deviceEnds - 1]
+    masterValid = _lookupTable[prefixXor[masterEnds] ^ prefixXor[begins] ^ (ckt & 0x3F) ^ 0x52] == (ckt & 0x3F)
+    deviceValid = _lookupTable[prefixXor[deviceEnds] ^ prefixXor[masterEnds] ^ (cks & 0x3F) ^ 0x52] == (cks & 0x3F)
+    hypothesis.hits += int(np.count_nonzero(masterValid & deviceValid))
+
+
+def _selectPayloadLength(values, prefixXor, segments: _Segments, mSeqType: MSeqType,
+                         minHitRate: float, pruneMargin: float, batchSize: int) -> MSeqPayloadLength:
+    # length prefilter: too many segments shorter than the M-sequence -> min hit rate can't be reached
+    segmentLengths = sorted(segments.lengths)
+    maxFrameLength = segmentLengths[int(len(segmentLengths) * (1.0 - minHitRate))] \
+        if minHitRate > 0.0 else segmentLengths[-1]
+    hypotheses = [_Hypothesis(payloadLength) for payloadLength in getPayloadLengthCandidates(mSeqType)]
+    hypotheses = [hypothesis for hypothesis in hypotheses if hypothesis.frameLength <= maxFrameLength]
+
+    # checksum hit rate on growing batches of segments, losers are pruned after every batch
+    begin = 0
+    while hypotheses and begin < len(segmentLengths):
+        end = begin + batchSize
+        batch = _Segments(*(column[begin:end] for column in segments))
+        for hypothesis in hypotheses:
+            _scoreHypothesis(values, prefixXor, batch, hypothesis)
+        bestHitRate = max(hypothesis.hitRate for hypothesis in hypotheses)
+        hypotheses = [hypothesis for hypothesis in hypotheses if hypothesis.hitRate >= bestHitRate - pruneMargin]
+        if len(hypotheses) == 1:
+            break
+        begin, batchSize = end, batchSize * 2
+
+    if not hypotheses or max(hypothesis.hitRate for hypothesis in hypotheses) < minHitRate:
+        raise SettingsInferenceFailed(f"No payload length of M-sequence type {mSeqType.value} "
+                                      f"reaches a checksum hit rate of {minHitRate}")
+    # on a tie, the first candidate wins (e.g. od/pdIn can't be told apart if only read M-sequences were found)
+    return max(hypotheses, key=lambda hypothesis: hypothesis.hitRate).payloadLength
+
+
+def inferDecoderSettings(values, startTimes, endTimes,
+                         timestampMode: TimestampMode = TimestampMode.DateTime, sampleRate: int = 0,
+                         transmissionRate: BitRate = BitRate.Undefined, maxOctets: int = 20_000,
+                         minHitRate: float = 0.5, pruneMargin: float = 0.25, batchSize: int = 16) -> DecoderSettings:
+    """
+    Infers decoder settings from the beginning of a capture (if no IODD is available).
+    M-sequences must be separated by idle gaps (at least max response time, see getSplitGap).
+
+    The payload lengths of each M-sequence type found in the capture are tried in the order of ODOctetCount.
+    Each hypothesis is scored by the rate of M-sequences with valid master and device checksums. Hypotheses
+    which don't fit the M-sequence lengths are skipped and losers are pruned after every batch of M-sequences.
+
+    :param values: octet values (sequence of ints, bytes or numpy array)
+    :param startTimes: start time of each octet
+    :param endTimes: end time of each octet
+    :param timestampMode: unit of the timestamps (also used for the returned settings)
+    :param sampleRate: sample rate (TimestampMode.Samples only)
+    :param transmissionRate: bit rate (inferred from the octet durations if undefined)
+    :param maxOctets: number of octets used for inference (from the beginning)
+    :param minHitRate: min rate of valid M-sequences for the winning hypothesis
+    :param pruneMargin: hypotheses with a hit rate below best hit rate - pruneMargin are pruned
+    :param batchSize: number of M-sequences of the first scoring batch (doubled for every following batch)
+    :return: settings with the best payload length for each M-sequence type (types not found keep the default)
+    """
+    values, startTimes, endTimes = values[:maxOctets], startTimes[:maxOctets], endTimes[:maxOctets]
+
+    settings = DecoderSettings(timestampMode=timestampMode, sampleRate=sampleRate)
+    settings.transmissionRate = transmissionRate if transmissionRate != BitRate.Undefined else \
+        inferTransmissionRate(startTimes, endTimes, settings)
+    settings.startup = MSeqPayloadLength(pdOut=0, od=1, pdIn=0)
+
+    segmentsByType = _findSegments(values, startTimes, endTimes, settings)
+    if not any(len(segments.begins) for segments in segmentsByType.values()):
+        raise SettingsInferenceFailed("No M-sequences found")
+
+    prefixXor = _calculatePrefixXor(values)
+    for mSeqType in (MSeqType.Type_1_PREOPERATE, MSeqType.Type_2_OPERATE):
+        if len(segmentsByType[mSeqType].begins):
+            payloadLength = _selectPayloadLength(values, prefixXor, segmentsByType[mSeqType], mSeqType,
+                                                 minHitRate, pruneMargin, batchSize)
+            if mSeqType == MSeqType.Type_1_PREOPERATE:
+                settings.preoperate = payloadLength
+            else:
+                settings.operate = payloadLength
+    return settings
@@ -0,0 +1,132 @@
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional
+import asyncio
+import time
+
+from iolink_utils.capture.binaryCapture import RECORD_SIZE, unpackRecords
+from iolink_utils.capture.octetChunk import OctetChunk
+from iolink_utils.exceptions import InvalidCaptureFile
+from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder
+from iolink_utils.octetStreamDecoder.octetStreamDecoderSettings import DecoderSettings
+from iolink_utils.messageInterpreter.messageInterpreter import MessageInterpreter
+from .multiPortDriver import PortResult, PortStatistics, _PortFinished
+
+
+async def readOctetChunks(reader: asyncio.StreamReader, maxRecords: int = 4096) -> AsyncIterator[OctetChunk]:
+    """
+    Reads binary capture records (see binaryCapture, no file header) from a stream as soon as they arrive.
+
+    :param reader: stream of records (e.g. local socket or pipe of a sniffer)
+    :param maxRecords: max number of records per chunk
+    :return: chunks of decodable octets (may contain less than maxRecords records)
+    """
+    pending = b''
+    while True:
+        data = await reader.read(maxRecords * RECORD_SIZE - len(pending))
+        if not data:
+            if pending:
+                raise InvalidCaptureFile(f"Stream ended within a record ({len(pending)} bytes left)")
+            return
+
+        data = pending + data if pending else data
+        end = len(data) - len(data) % RECORD_SIZE
+        pending = data[end:]
+        if end > 0:
+            chunk = unpackRecords(data[:end])
+            if len(chunk.values) > 0:
+                yield chunk
+
+
+class AsyncPortSource(NamedTuple):
+    """
+    Live source of a single port.
+
+    :param portId: id the results of this port are tagged with
+    :param settings: decoder settings of this port (TimestampMode.Nanoseconds, see binaryCapture)
+    :param reader: stream of binary capture records
+    """
+    portId: int
+    settings: DecoderSettings
+    reader: asyncio.StreamReader
+
+
+class AsyncPipeline:
+    """
+    Decodes and interprets live octet streams of several ports in one event loop (one OctetStreamDecoder
+    and MessageInterpreter per port). Results are available as soon as an M-sequence has been received:
+
+        reader, writer = await asyncio.open_connection('localhost', 5000)
+        pipeline = AsyncPipeline([AsyncPortSource(1, settings, reader)])
+        async for portId, transaction in pipeline:
+            ...
+
+    Results of all ports are passed through a bounded queue: if the consumer is slower than the sources,
+    ports stop reading their streams until there is space again (backpressure to the sender).
+    """
+
+    def __init__(self, ports: List[AsyncPortSource], queueSize: int = 64, maxRecords: int = 4096):
+        """
+        :param ports: live source per port
+        :param queueSize: max number of results waiting to be consumed
+        :param maxRecords: max number of records decoded at once (see readOctetChunks)
+        """
+        self._ports: List[AsyncPortSource] = list(ports)
+        self._queueSize: int = queueSize
+        self._maxRecords: int = maxRecords
+        self._statistics: Dict[int, PortStatistics] = {}
+
+    @property
+    def statistics(self) -> Dict[int, PortStatistics]:
+        """Statistics of all finished ports (port id -> PortStatistics)."""
+        return self._statistics
+
+    def __aiter__(self) -> AsyncIterator[PortResult]:
+        return self.run()
+
+    async def _runPort(self, port: AsyncPortSource, resultQueue: asyncio.Queue):
+        statistics = PortStatistics()
+        startTime = time.perf_counter()
+        error = None
+        try:
+            decoder = OctetStreamDecoder(port.settings)
+            interpreter = MessageInterpreter()
+
+            async for chunk in readOctetChunks(port.reader, self._maxRecords):
+                messages = decoder.processOctets(*chunk)
+                statistics.octets += len(chunk.values)
+                statistics.messages += len(messages)
+                for message in messages:
+                    result = interpreter.processMessage(message)
+                    if result is not None:
+                        statistics.results += 1
+                        await resultQueue.put(PortResult(port.portId, result))  # waits if consumer is too slow
+        except Exception as e:
+            error = e
+
+        statistics.seconds = time.perf_counter() - startTime
+        await resultQueue.put(_PortFinished(port.portId, statistics, error))
+
+    async def run(self) -> AsyncIterator[PortResult]:
+        self._statistics = {}
+        resultQueue: asyncio.Queue = asyncio.Queue(maxsize=self._queueSize)
+        tasks = [asyncio.ensure_future(self._runPort(port, resultQueue)) for port in self._ports]
+
+        try:
+            error: Optional[BaseException] = None
+            pending = len(tasks)
+            while pending > 0:
+                item = await resultQueue.get()
+                if isinstance(item, _PortFinished):
+                    pending -= 1
+                    self._statistics[item.portId] = item.statistics
+                    if item.error is not None:
+                        error = item.error
+                        break  # stop all ports (pending results of other ports are dropped)
+                    continue
+                yield item
+
+            if error is not None:
+                raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,152 @@
+from typing import Iterator, List, Optional, Tuple
+import os
+import time
+
+from iolink_utils.capture.binaryCapture import HEADER_SIZE, RECORD_SIZE, unpackHeader, unpackRecords
+from iolink_utils.capture.csvCaptureReader import CsvCaptureReader
+from iolink_utils.capture.octetChunk import OctetChunk
+from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder
+from iolink_utils.octetStreamDecoder.octetStreamDecoderSettings import DecoderSettings
+from iolink_utils.messageInterpreter.messageInterpreter import MessageInterpreter
+from .checkpoint import Checkpoint, createCheckpoint, restoreCheckpoint, saveCheckpoint, loadCheckpoint
+
+
+class CaptureFollower:
+    """
+    Decodes a capture file while it is still being written (like 'tail -f'). Every poll only reads the
+    bytes appended since the previous poll; incomplete CSV lines and binary records at the end of the file
+    are left for the next poll.
+
+    With a state file, the byte offset is saved together with a checkpoint of decoder and interpreter
+    once the results of a poll have been processed (see commit), so a restarted process continues where the
+    previous one stopped:
+
+        follower = CaptureFollower('capture.iolcap', settings, stateFilename='capture.iolcap.state')
+        for transaction in follower.follow(interval=0.5):
+            ...
+
+    Delivery is at-least-once: results of a poll that has not been committed (e.g. the process stopped while
+    processing them) are returned again after a restart.
+
+    The file format is selected by the file extension ('.csv' or binary capture, see binaryCapture).
+    Timestamps are integer nanoseconds (settings must use TimestampMode.Nanoseconds).
+    """
+
+    def __init__(self, filename: str, settings: DecoderSettings, stateFilename: Optional[str] = None,
+                 interpret: bool = True, chunkSize: int = 65536):
+        """
+        :param filename: capture file (may not exist yet)
+        :param settings: decoder settings
+        :param stateFilename: file the state is saved to by commit() (None: state is not persisted)
+        :param interpret: return transactions of a MessageInterpreter (otherwise decoded messages)
+        :param chunkSize: max number of octets decoded at once
+        """
+        self._filename: str = filename
+        self._settings: DecoderSettings = settings
+        self._stateFilename: Optional[str] = stateFilename
+        self._interpret: bool = interpret
+        self._chunkSize: int = chunkSize
+        self._isCsv: bool = filename.lower().endswith('.csv')
+
+        self._decoder: OctetStreamDecoder = OctetStreamDecoder(settings)
+        self._interpreter: Optional[MessageInterpreter] = MessageInterpreter() if interpret else None
+        self._csvReader: CsvCaptureReader = CsvCaptureReader(filename, chunkSize)
+        self._offset: int = 0
+        self._pendingCheckpoint: Optional[Checkpoint] = None  # state after the last poll, not yet committed
+
+        if stateFilename is not None and os.path.exists(stateFilename):
+            self._offset = restoreCheckpoint(loadCheckpoint(stateFilename), self._decoder, self._interpreter)
+
+    @property
+    def filename(self) -> str:
+        return self._filename
+
+    @property
+    def offset(self) -> int:
+        """Byte offset in the capture file up to which all data has been decoded."""
+        return self._offset
+
+    def reset(self):
+        """Starts again at the beginning of the file (e.g. after the file has been replaced)."""
+        self._decoder = OctetStreamDecoder(self._settings)
+        self._interpreter = MessageInterpreter() if self._interpret else None
+        self._csvReader = CsvCaptureReader(self._filename, self._chunkSize)
+        self._offset = 0
+        self._pendingCheckpoint = None
+
+    def poll(self) -> List:
+        """
+        Decodes all data appended since the last poll (the state is saved by commit()).
+        If decoding raises an exception, the state is left as before the poll (the data is decoded again by the
+        next poll).
+
+        :return: new transactions (or messages if interpret is False)
+        """
+        if not os.path.exists(self._filename):
+            return []
+        if os.path.getsize(self._filename) < self._offset:  # truncated: a new capture has been started
+            self.reset()
+
+        results = []
+        previousState = createCheckpoint(self._offset, self._decoder, self._interpreter)
+        try:
+            with open(self._filename, 'rb') as file:
+                while True:
+                    chunks, offset = self._readCsv(file) if self._isCsv else self._readBinary(file)
+                    if offset == self._offset:
+                        break
+                    for chunk in chunks:
+                        results += self._process(chunk)
+                    self._offset = offset  # only once all chunks in front of offset have been processed
+        except Exception:
+            # the results of this poll are lost: the next poll decodes the same data again
+            self._offset = restoreCheckpoint(previousState, self._decoder, self._interpreter)
+            raise
+
+        if self._stateFilename is not None and self._offset != previousState.position:
+            self._pendingCheckpoint = createCheckpoint(self._offset, self._decoder, self._interpreter)
+        return results
+
+    def commit(self):
+        """Saves the state after the last poll (call once all results returned by poll have been processed)."""
+        if self._pendingCheckpoint is not None:
+            saveCheckpoint(self._stateFilename, self._pendingCheckpoint)
+            self._pendingCheckpoint = None
+
+    def follow(self, interval: float = 1.0) -> Iterator:
+        """
+        Polls forever (sleeps for interval seconds whenever there is no new data).
+        The results of a poll are committed when the next result is requested after the last one of the poll.
+        """
+        while True:
+            results = self.poll()
+            yield from results
+            self.commit()
+            if not results:
+                time.sleep(interval)
+
+    def _process(self, chunk: OctetChunk) -> List:
+        messages = self._decoder.processOctets(*chunk)
+        if self._interpreter is None:
+            return messages
+        return [result for result in map(self._interpreter.processMessage, messages) if result is not None]
+
+    def _readBinary(self, file) -> Tuple[List[OctetChunk], int]:
+        if self._offset == 0:
+            header = file.read(HEADER_SIZE)
+            if len(header) < HEADER_SIZE:
+                return [], 0
+            unpackHeader(header, self._filename)
+            return [], HEADER_SIZE
+
+        file.seek(self._offset)
+        data = file.read(self._chunkSize * RECORD_SIZE)
+        end = len(data) - len(data) % RECORD_SIZE
+        return ([unpackRecords(data[:end])] if end > 0 else []), self._offset + end
+
+    def _readCsv(self, file) -> Tuple[List[OctetChunk], int]:
+        file.seek(self._offset)
+        data = file.read(self._chunkSize * 64)
+        end = data.rfind(b'\n') + 1  # only complete lines
+        lines = data[:end].decode('utf-8').splitlines()
+        return list(self._csvReader.readChunks(lines)), self._offset + end
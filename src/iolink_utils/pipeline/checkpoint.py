@@ -0,0 +1,54 @@
+from typing import NamedTuple, Optional
+import os
+import pickle
+
+from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder
+from iolink_utils.messageInterpreter.messageInterpreter import MessageInterpreter
+
+
+class Checkpoint(NamedTuple):
+    """
+    State of a decoding job at a position of its capture source.
+
+    :param position: position in the capture source (e.g. index of the next record, see BinaryCaptureReader.chunks)
+    :param decoder: OctetStreamDecoder.snapshot()
+    :param interpreter: MessageInterpreter.snapshot() (None if no interpreter is used)
+    """
+    position: int
+    decoder: dict
+    interpreter: Optional[dict] = None
+
+
+def createCheckpoint(position: int, decoder: OctetStreamDecoder,
+                     interpreter: Optional[MessageInterpreter] = None) -> Checkpoint:
+    """
+    Snapshot of decoder (and interpreter) after all octets in front of position have been processed.
+    """
+    return Checkpoint(position, decoder.snapshot(), interpreter.snapshot() if interpreter is not None else None)
+
+
+def restoreCheckpoint(checkpoint: Checkpoint, decoder: OctetStreamDecoder,
+                      interpreter: Optional[MessageInterpreter] = None) -> int:
+    """
+    Restores decoder (and interpreter) from a checkpoint.
+
+    :return: position in the capture source to continue at
+    """
+    decoder.restore(checkpoint.decoder)
+    if interpreter is not None and checkpoint.interpreter is not None:
+        interpreter.restore(checkpoint.interpreter)
+    return checkpoint.position
+
+
+def saveCheckpoint(filename: str, checkpoint: Checkpoint):
+    """Writes a checkpoint (atomically: an interrupted write keeps the previous checkpoint file)."""
+    tempFilename = filename + '.tmp'
+    with open(tempFilename, 'wb') as file:
+        pickle.dump(checkpoint, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tempFilename, filename)
+
+
+def loadCheckpoint(filename: str) -> Checkpoint:
+    """Reads a checkpoint written by saveCheckpoint (only load trusted files: pickle format)."""
+    with open(filename, 'rb') as file:
+        return pickle.load(file)
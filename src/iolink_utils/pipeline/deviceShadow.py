@@ -0,0 +1,135 @@
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from array import array
+from bisect import bisect_right
+
+from iolink_utils.exceptions import InvalidVariableData
+from iolink_utils.iodd.iodd_variableDecoder import VariableDecoders
+from iolink_utils.messageInterpreter.isdu.ISDUexchange import ISDUExchange
+from iolink_utils.octetStreamDecoder.octetStreamDecoderSettings import Timestamp
+
+ShadowKey = Tuple[int, int]  # index, subindex
+
+
+class ShadowValue(NamedTuple):
+    time: Timestamp  # end of the exchange the value was first seen in
+    data: bytes
+
+
+class _ValueHistory:
+    # values of one index/subindex: concatenated data (one buffer) and sorted change times
+    __slots__ = ('times', 'offsets', 'data')
+
+    def __init__(self):
+        self.times: List[Timestamp] = []
+        self.offsets: array = array('L', [0])  # value n: data[offsets[n]:offsets[n + 1]]
+        self.data: bytearray = bytearray()
+
+    def value(self, position: int) -> ShadowValue:
+        return ShadowValue(self.times[position], bytes(self.data[self.offsets[position]:self.offsets[position + 1]]))
+
+    def lastData(self) -> bytes:
+        return self.data[self.offsets[-2]:]
+
+    def add(self, time: Timestamp, data: bytes):
+        if self.times and time < self.times[-1]:  # out of order: rebuild (rare, e.g. merged traces)
+            values = [self.value(position) for position in range(len(self.times))]
+            values.insert(bisect_right(self.times, time), ShadowValue(time, data))
+            self.times, self.offsets, self.data = [], array('L', [0]), bytearray()
+            for value in values:
+                self._appendChange(*value)
+        else:
+            self._appendChange(time, data)
+
+    def _appendChange(self, time: Timestamp, data: bytes):
+        if self.times and data == self.lastData():  # only changes are stored
+            return
+        self.times.append(time)
+        self.data += data
+        self.offsets.append(len(self.data))
+
+
+class DeviceShadow:
+    """
+    Last known value of every index/subindex of a device, built from successful read responses and
+    confirmed writes (see ISDUExchange, MessageInterpreter isduExchanges). Only changes are stored (one buffer
+    and a list of change times per index/subindex), so the values at any point in time are found by bisection:
+
+        shadow = DeviceShadow()
+        shadow.update(interpretChunks(chunks, decoder, MessageInterpreter(isduExchanges=True)))
+        configuration = shadow.configurationAt(timestamp)
+
+    Values are stored per index/subindex as seen on the wire (e.g. writing subindex 0 of a record does not
+    update the values of its subindices).
+    """
+
+    def __init__(self):
+        self._histories: Dict[ShadowKey, _ValueHistory] = {}
+
+    def add(self, transaction) -> bool:
+        """
+        Adds the value of a successful exchange (see ISDUExchange.isSuccess, other transactions are ignored).
+
+        :return: True if the value has been added
+        """
+        if type(transaction) is not ISDUExchange or not transaction.isSuccess:
+            return False
+
+        key = (transaction.index, transaction.subIndex)
+        history = self._histories.get(key)
+        if history is None:
+            history = self._histories[key] = _ValueHistory()
+        history.add(transaction.endTime, transaction.payload)
+        return True
+
+    def update(self, transactions: Iterable):
+        """Adds all exchanges of transactions (e.g. a transaction stream, see interpretChunks)."""
+        for transaction in transactions:
+            self.add(transaction)
+
+    def keys(self) -> List[ShadowKey]:
+        return sorted(self._histories)
+
+    def value(self, index: int, subIndex: int = 0) -> Optional[ShadowValue]:
+        """:return: last known value (None: never seen)"""
+        history = self._histories.get((index, subIndex))
+        return None if history is None else history.value(len(history.times) - 1)
+
+    def valueAt(self, index: int, subIndex: int, time: Timestamp) -> Optional[ShadowValue]:
+        """:return: value known at time (None: not seen before time)"""
+        history = self._histories.get((index, subIndex))
+        if history is None:
+            return None
+        position = bisect_right(history.times, time) - 1
+        return history.value(position) if position >= 0 else None
+
+    def history(self, index: int, subIndex: int = 0) -> List[ShadowValue]:
+        """:return: all changes of the value (oldest first)"""
+        history = self._histories.get((index, subIndex))
+        return [] if history is None else [history.value(position) for position in range(len(history.times))]
+
+    def configurationAt(self, time: Timestamp, decoders: Optional[VariableDecoders] = None) -> Dict[ShadowKey, Any]:
+        """
+        Values of all indices/subindices known at time.
+
+        :param decoders: decode the values (e.g. Iodd.variableDecoders), values without decoder or with data
+            not matching the datatype are returned as raw data (bytes)
+        """
+        configuration = {}
+        for key in sorted(self._histories):
+            value = self.valueAt(*key, time)
+            if value is not None:
+                configuration[key] = value.data if decoders is None else self._decode(decoders, key, value.data)
+        return configuration
+
+    @staticmethod
+    def _decode(decoders: VariableDecoders, key: ShadowKey, data: bytes) -> Any:
+        decoder = decoders.decoder(*key)
+        if decoder is None:
+            return data
+        try:
+            return decoder(data)
+        except InvalidVariableData:
+            return data
+
+    def __len__(self) -> int:
+        return len(self._histories)
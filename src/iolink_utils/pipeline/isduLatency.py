@@ -0,0 +1,148 @@
+from typing import Dict, Iterable, List, Tuple
+from datetime import timedelta
+from math import ceil
+
+from iolink_utils.messageInterpreter.isdu.ISDUexchange import ISDUExchange, Latency
+
+
+class LatencyHistogram:
+    """
+    Histogram with log-linear buckets: exact below 16, above each power of two is split into 8 buckets.
+    Memory is bounded (max ~500 buckets for 64 bit values) and quantiles have a relative error of max 12.5%.
+    """
+    __slots__ = ('_counts', 'count', 'total', 'minimum', 'maximum')
+
+    _SUB_BITS = 3  # 8 buckets per power of two
+    _EXACT = 2 << _SUB_BITS  # values below are counted exactly
+
+    def __init__(self):
+        self._counts: List[int] = []
+        self.count: int = 0
+        self.total: int = 0
+        self.minimum: int = 0
+        self.maximum: int = 0
+
+    @classmethod
+    def _bucket(cls, value: int) -> int:
+        if value < cls._EXACT:
+            return value
+        shift = value.bit_length() - cls._SUB_BITS - 1
+        return (shift << cls._SUB_BITS) + (value >> shift)
+
+    @classmethod
+    def _bucketRange(cls, bucket: int) -> Tuple[int, int]:
+        # [lower, upper) of the values counted in bucket
+        if bucket < cls._EXACT:
+            return bucket, bucket + 1
+        shift = (bucket >> cls._SUB_BITS) - 1
+        mantissa = (bucket & ((1 << cls._SUB_BITS) - 1)) | (1 << cls._SUB_BITS)
+        return mantissa << shift, (mantissa + 1) << shift
+
+    def add(self, value: int):
+        """:param value: latency (negative values are counted as 0)"""
+        value = max(value, 0)
+        bucket = self._bucket(value)
+        if bucket >= len(self._counts):
+            self._counts.extend([0] * (bucket + 1 - len(self._counts)))
+        self._counts[bucket] += 1
+
+        if self.count == 0 or value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        self.count += 1
+        self.total += value
+
+    def merge(self, other: "LatencyHistogram"):
+        """Adds all values of other (e.g. histograms of several capture files)."""
+        if other.count == 0:
+            return
+        if len(other._counts) > len(self._counts):
+            self._counts.extend([0] * (len(other._counts) - len(self._counts)))
+        for bucket, count in enumerate(other._counts):
+            self._counts[bucket] += count
+
+        self.minimum = other.minimum if self.count == 0 else min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.count += other.count
+        self.total += other.total
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> int:
+        """
+        :param q: 0.0 .. 1.0 (e.g. 0.5: median, 0.99: 99th percentile)
+        :return: estimated value (upper end of its bucket, but within minimum and maximum)
+        """
+        if self.count == 0:
+            return 0
+        rank = max(1, ceil(q * self.count))
+        cumulative = 0
+        for bucket, count in enumerate(self._counts):
+            cumulative += count
+            if cumulative >= rank:
+                return min(max(self._bucketRange(bucket)[1] - 1, self.minimum), self.maximum)
+        return self.maximum  # pragma: no cover
+
+    def buckets(self) -> List[Tuple[int, int, int]]:
+        """:return: (lower, upper, count) of all buckets with values (values from lower up to upper - 1)"""
+        return [self._bucketRange(bucket) + (count,) for bucket, count in enumerate(self._counts) if count]
+
+
+class ISDULatencyAggregator:
+    """
+    Latency histograms per ISDU index, updated while the transactions stream by (see ISDUExchange):
+
+        aggregator = ISDULatencyAggregator()
+        for filename in captureFiles:
+            interpreter = MessageInterpreter(channels=[CommChannel.ISDU], isduExchanges=True)
+            aggregator.update(interpretChunks(CsvCaptureReader(filename), decoder, interpreter))
+        for index, histogram in aggregator.slowest(10):
+            ...
+
+    Latencies of datetime timestamps are counted in microseconds, integer timestamps in their unit.
+    Memory only depends on the number of different indices (max 65536).
+    """
+
+    def __init__(self):
+        self._histograms: Dict[int, LatencyHistogram] = {}
+
+    @staticmethod
+    def _toInt(latency: Latency) -> int:
+        return latency // timedelta(microseconds=1) if isinstance(latency, timedelta) else int(latency)
+
+    def add(self, transaction):
+        """Adds the latency of an ISDUExchange (other transactions are ignored)."""
+        if not isinstance(transaction, ISDUExchange):
+            return
+        histogram = self._histograms.get(transaction.index)
+        if histogram is None:
+            histogram = self._histograms[transaction.index] = LatencyHistogram()
+        histogram.add(self._toInt(transaction.latency))
+
+    def update(self, transactions: Iterable):
+        """Adds all ISDUExchanges of transactions (e.g. a transaction stream, see interpretChunks)."""
+        for transaction in transactions:
+            self.add(transaction)
+
+    def merge(self, other: "ISDULatencyAggregator"):
+        """Adds all histograms of other (e.g. aggregated in another process)."""
+        for index, histogram in other._histograms.items():
+            self._histograms.setdefault(index, LatencyHistogram()).merge(histogram)
+
+    def indices(self) -> List[int]:
+        return sorted(self._histograms)
+
+    def histogram(self, index: int) -> LatencyHistogram:
+        """:return: histogram of index (empty histogram if index was not seen)"""
+        return self._histograms.get(index, LatencyHistogram())
+
+    def slowest(self, count: int = 10, q: float = 0.95) -> List[Tuple[int, LatencyHistogram]]:
+        """:return: (index, histogram) of the count indices with the highest quantile q (slowest first)"""
+        ranking = sorted(self._histograms.items(), key=lambda item: (-item[1].quantile(q), item[0]))
+        return ranking[:count]
+
+    def __len__(self) -> int:
+        return len(self._histograms)
@@ -0,0 +1,196 @@
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import multiprocessing
+import queue
+import time
+
+from iolink_utils.capture.octetChunk import OctetChunk
+from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder
+from iolink_utils.octetStreamDecoder.octetStreamDecoderSettings import DecoderSettings
+from iolink_utils.messageInterpreter.messageInterpreter import MessageInterpreter
+
+
+CaptureSource = Union[str, Callable[[], Iterable[OctetChunk]]]
+
+
+def openCapture(filename: str) -> Iterable[OctetChunk]:
+    """Opens a CSV capture (*.csv) or a binary capture (any other extension)."""
+    if filename.lower().endswith('.csv'):
+        from iolink_utils.capture.csvCaptureReader import CsvCaptureReader
+        return CsvCaptureReader(filename)
+
+    from iolink_utils.capture.binaryCapture import BinaryCaptureReader
+    return BinaryCaptureReader(filename)
+
+
+class PortSource(NamedTuple):
+    """
+    Capture of a single port.
+
+    :param portId: id the results of this port are tagged with
+    :param settings: decoder settings of this port (timestamps of the capture source must match timestampMode)
+    :param source: capture filename (see openCapture) or picklable callable returning an iterable of OctetChunks
+    """
+    portId: int
+    settings: DecoderSettings
+    source: CaptureSource
+
+
+class PortResult(NamedTuple):
+    portId: int
+    result: Any  # transaction of the MessageInterpreter (e.g. TransactionPage, ISDU)
+
+
+@dataclass
+class PortStatistics:
+    octets: int = 0
+    messages: int = 0
+    results: int = 0
+    seconds: float = 0.0
+
+    @property
+    def octetsPerSecond(self) -> float:
+        return self.octets / self.seconds if self.seconds > 0 else 0.0
+
+
+_PUT_TIMEOUT = 0.1  # seconds
+
+
+class _PortFinished(NamedTuple):
+    portId: int
+    statistics: PortStatistics
+    error: Optional[BaseException]
+
+
+def _putResult(resultQueue, stopEvent, item) -> bool:
+    # blocks while the queue is full, but gives up as soon as the consumer stopped (see MultiPortDriver.run)
+    while not stopEvent.is_set():
+        try:
+            resultQueue.put(item, timeout=_PUT_TIMEOUT)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _runPort(port: PortSource, resultQueue, stopEvent, batchSize: int):
+    # runs in a worker process: decoding and interpreting happens here, only results (transactions)
+    # are sent back in batches (messages are never pickled)
+    statistics = PortStatistics()
+    startTime = time.perf_counter()
+    error = None
+    try:
+        source = openCapture(port.source) if isinstance(port.source, str) else port.source()
+        decoder = OctetStreamDecoder(port.settings)
+        interpreter = MessageInterpreter()
+
+        batch: List[Any] = []
+        for chunk in source:
+            messages = decoder.processOctets(*chunk)
+            statistics.octets += len(chunk.values)
+            statistics.messages += len(messages)
+            for message in messages:
+                result = interpreter.processMessage(message)
+                if result is not None:
+                    batch.append(result)
+
+            if len(batch) >= batchSize:
+                statistics.results += len(batch)
+                if not _putResult(resultQueue, stopEvent, (port.portId, batch)):
+                    break
+                batch = []
+
+        if batch and not stopEvent.is_set():
+            statistics.results += len(batch)
+            _putResult(resultQueue, stopEvent, (port.portId, batch))
+
+        close = getattr(source, 'close', None)
+        if close is not None:
+            close()
+    except Exception as e:
+        error = e
+
+    statistics.seconds = time.perf_counter() - startTime
+    _putResult(resultQueue, stopEvent, _PortFinished(port.portId, statistics, error))
+
+
+class MultiPortDriver:
+    """
+    Decodes and interprets the captures of several ports in parallel (one OctetStreamDecoder and
+    MessageInterpreter per port, each port in its own worker process).
+
+    Results are streamed back tagged with the port id (order is only kept per port):
+
+        driver = MultiPortDriver([PortSource(1, settings, 'port1.iolcap'), PortSource(2, settings, 'port2.iolcap')])
+        for portId, transaction in driver.run():
+            ...
+        print(driver.statistics[1].octetsPerSecond)
+    """
+
+    def __init__(self, ports: List[PortSource], maxWorkers: Optional[int] = None,
+                 queueSize: int = 64, batchSize: int = 256):
+        """
+        :param ports: capture source per port
+        :param maxWorkers: number of worker processes (default: one per port)
+        :param queueSize: max number of result batches waiting to be consumed (workers block if queue is full,
+                          until the results are consumed or run() is left, e.g. by breaking the loop)
+        :param batchSize: number of results sent back at once
+        """
+        self._ports: List[PortSource] = list(ports)
+        self._maxWorkers: int = maxWorkers or max(len(self._ports), 1)
+        self._queueSize: int = queueSize
+        self._batchSize: int = batchSize
+        self._statistics: Dict[int, PortStatistics] = {}
+
+    @property
+    def statistics(self) -> Dict[int, PortStatistics]:
+        """Statistics of all finished ports (port id -> PortStatistics)."""
+        return self._statistics
+
+    def run(self) -> Iterator[PortResult]:
+        self._statistics = {}
+        if not self._ports:
+            return
+
+        with multiprocessing.Manager() as manager, ProcessPoolExecutor(max_workers=self._maxWorkers) as pool:
+            resultQueue = manager.Queue(maxsize=self._queueSize)
+            stopEvent = manager.Event()
+            futures = [pool.submit(_runPort, port, resultQueue, stopEvent, self._batchSize) for port in self._ports]
+            try:
+                yield from self._receiveResults(resultQueue, futures)
+            finally:
+                # consumer stopped early (or a port failed): workers must not block on the full queue,
+                # otherwise shutting down the pool never returns
+                stopEvent.set()
+                while not all(future.done() for future in futures):
+                    try:
+                        resultQueue.get(timeout=_PUT_TIMEOUT)
+                    except queue.Empty:
+                        pass
+
+    def _receiveResults(self, resultQueue, futures) -> Iterator[PortResult]:
+        error: Optional[BaseException] = None
+        pending = len(futures)
+        while pending > 0:
+            try:
+                item = resultQueue.get(timeout=_PUT_TIMEOUT)
+            except queue.Empty:
+                failed = [future for future in futures if future.done() and future.exception() is not None]
+                if failed:  # worker died without reporting (e.g. source not picklable)
+                    raise failed[0].exception()
+                continue
+
+            if isinstance(item, _PortFinished):
+                pending -= 1
+                self._statistics[item.portId] = item.statistics
+                error = error or item.error
+                continue
+
+            if error is None:
+                portId, batch = item
+                for result in batch:
+                    yield PortResult(portId, result)
+
+        if error is not None:
+            raise error
@@ -0,0 +1,63 @@
+from typing import Iterable, Iterator, Optional
+
+from iolink_utils.capture.octetChunk import OctetChunk
+from iolink_utils.definitions.communicationChannel import CommChannel
+from iolink_utils.exceptions import InvalidVariableData
+from iolink_utils.iodd.iodd_variableDecoder import VariableDecoders
+from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder
+from iolink_utils.octetStreamDecoder.octetStreamDecoderSettings import DecoderSettings
+from iolink_utils.messageInterpreter.messageInterpreter import MessageInterpreter
+from iolink_utils.messageInterpreter.transaction import Transaction
+from iolink_utils.messageInterpreter.isdu.ISDUexchange import ISDUExchange
+
+
+def interpretChunks(chunks: Iterable[OctetChunk], decoder: OctetStreamDecoder,
+                    interpreter: MessageInterpreter) -> Iterator[Transaction]:
+    """
+    Decodes and interprets chunks of octets in one pass (decoder and interpreter keep their state, e.g. to
+    continue with the next capture file or to create a checkpoint in between).
+
+    :return: transactions of the channels requested by the interpreter (see MessageInterpreter channels)
+    """
+    processMessages = interpreter.processMessages
+    for chunk in chunks:
+        yield from processMessages(decoder.processOctets(*chunk))
+
+
+def iterTransactions(chunks: Iterable[OctetChunk], settings: DecoderSettings,
+                     channels: Optional[Iterable[CommChannel]] = None,
+                     messageViews: bool = False) -> Iterator[Transaction]:
+    """
+    Transactions of a capture, e.g. only ISDUs and diagnosis in OPERATE:
+
+        for transaction in iterTransactions(CsvCaptureReader('capture.csv'), settings,
+                                            channels=[CommChannel.ISDU, CommChannel.Diagnosis]):
+            ...
+
+    :param chunks: octets of the capture (e.g. CsvCaptureReader, BinaryCaptureReader)
+    :param settings: decoder settings (timestamps of the chunks must match timestampMode)
+    :param channels: channels to create transactions for (None: all channels)
+    :param messageViews: decode into message views (see OctetStreamDecoder), which avoids copying the octets
+    """
+    decoder = OctetStreamDecoder(settings, messageViews=messageViews)
+    yield from interpretChunks(chunks, decoder, MessageInterpreter(channels))
+
+
+def decodeISDUPayloads(transactions: Iterable[Transaction], decoders: VariableDecoders) -> Iterator[Transaction]:
+    """
+    Decodes the payload of every ISDUExchange (see MessageInterpreter isduExchanges) into its value, e.g.:
+
+        for transaction in decodeISDUPayloads(interpretChunks(chunks, decoder, interpreter), iodd.variableDecoders):
+            ...
+
+    value stays None for unsuccessful exchanges (see ISDUExchange.isSuccess), unknown variables and data that does not match the datatype.
+    Other transactions are passed through.
+    """
+    decode = decoders.decode
+    for transaction in transactions:
+        if type(transaction) is ISDUExchange and transaction.isSuccess:
+            try:
+                transaction.value = decode(transaction.index, transaction.subIndex, transaction.payload)
+            except InvalidVariableData:
+                pass
+        yield transaction
@@ -7,8 +7,8 @@ from iolink_utils.exceptions import InvalidOctetValue
 from iolink_utils.definitions.directParameterPage import DirectParameterPage1Index
 from iolink_utils.definitions.masterCommand import MasterCommand
 from iolink_utils.definitions.systemCommand import SystemCommand
-from iolink_utils.octetDecoder.octetDecoder import (
-    OctetDecoderBase,
+from iolink_utils.octetDecoder._octetDecoderBase import IntOctetDecoderBase
+from iolink_utils.octetDecoder.intOctetDecoder import (
     CycleTimeOctet,
     MSequenceCapability,
     RevisionId,
@@ -45,15 +45,15 @@ def _translateUnknownIndex(index: int, value: int) -> Translation:
 
 
 def _translateCycleTime(name: str, value: int):
-    cto = CycleTimeOctet.from_buffer_copy(bytes([value]), 0)
+    cto = CycleTimeOctet(value)
     try:
         return Translation(name=name, value=f"{CycleTime.decodeToTimeInMs(cto)}ms")
     except InvalidOctetValue:
         return Translation(name=name, value=f'0x{value:02X}', error='Invalid cycle time')
 
 
-def _translateOctet(octetDecoderClass: Type[OctetDecoderBase], value: int):
-    octetDecoder = octetDecoderClass.from_buffer_copy(bytes([value]), 0)
+def _translateOctet(octetDecoderClass: Type[IntOctetDecoderBase], value: int):
+    octetDecoder = octetDecoderClass(value)
     return Translation(name=octetDecoderClass.__name__, value=octetDecoder.valuesAsString())
 
 
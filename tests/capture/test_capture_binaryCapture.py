@@ -0,0 +1,130 @@
+import struct
+
+import pytest
+
+from iolink_utils.capture import binaryCapture
+from iolink_utils.capture.binaryCapture import BinaryCaptureReader, CaptureHeader, convertCsvToBinary, \
+    writeBinaryCapture, unpackRecords, FLAG_ERROR, FLAG_NO_DATA, HEADER_SIZE, RECORD_SIZE
+from iolink_utils.capture.csvCaptureReader import CsvCaptureReader
+from iolink_utils.capture.octetChunk import decodeChunks
+from iolink_utils.exceptions import InvalidCaptureFile
+from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder
+from iolink_utils.octetStreamDecoder.octetStreamDecoderSettings import MSeqPayloadLength
+from iolink_utils.definitions.bitRate import BitRate
+
+from ..octetStreamDecoder.testDataHelper import createSettings
+from .test_capture_csvCaptureReader import CAPTURE
+
+OPERATE = MSeqPayloadLength(pdOut=7, od=2, pdIn=10)  # payload of the M-sequences in OPERATE (see CAPTURE)
+
+
+@pytest.fixture
+def captureFiles(tmp_path):
+    csvFilename = tmp_path / "capture.csv"
+    csvFilename.write_text("value,error,start,end,type\n" + CAPTURE.strip() + "\n", encoding="utf-8")
+    binaryFilename = tmp_path / "capture.iolcap"
+
+    assert convertCsvToBinary(str(csvFilename), str(binaryFilename), CaptureHeader(BitRate.COM2, 3)) == 17
+    assert binaryFilename.stat().st_size == HEADER_SIZE + 17 * RECORD_SIZE
+    return str(csvFilename), str(binaryFilename)
+
+
+def flatten(chunks):
+    return ([value for chunk in chunks for value in chunk.values],
+            [int(start) for chunk in chunks for start in chunk.startTimes],
+            [int(end) for chunk in chunks for end in chunk.endTimes])
+
+
+def test_binaryCapture_header(captureFiles):
+    _, binaryFilename = captureFiles
+    with BinaryCaptureReader(binaryFilename) as reader:
+        assert reader.header == CaptureHeader(BitRate.COM2, 3)
+        assert len(reader) == 17
+
+
+def test_binaryCapture_records(captureFiles):
+    pytest.importorskip("numpy")
+    _, binaryFilename = captureFiles
+    with BinaryCaptureReader(binaryFilename) as reader:
+        records = reader.records()
+        assert len(records) == 17
+        assert [flags for flags in records['flags']].count(FLAG_ERROR) == 1
+        assert [flags for flags in records['flags']].count(FLAG_NO_DATA) == 1
+
+
+def test_binaryCapture_withoutNumpy(captureFiles, monkeypatch):
+    csvFilename, binaryFilename = captureFiles
+    monkeypatch.setattr(binaryCapture, 'np', None)
+
+    with BinaryCaptureReader(binaryFilename, chunkSize=4) as reader:
+        records = reader.records()
+        assert len(records) == 17
+        assert [record[1] for record in records].count(FLAG_ERROR) == 1
+        assert [record[1] for record in records].count(FLAG_NO_DATA) == 1
+
+        chunks = list(reader)
+        assert all(isinstance(chunk.values, list) for chunk in chunks)
+        assert flatten(chunks) == flatten(list(CsvCaptureReader(csvFilename)))
+
+    chunk = unpackRecords(struct.pack('<BBqq', 0x12, 0, 10, 20) + struct.pack('<BBqq', 0x34, FLAG_ERROR, 30, 40))
+    assert chunk == ([0x12], [10], [20])
+
+
+@pytest.mark.parametrize("chunkSize", [1, 4, 17, 100])
+def test_binaryCapture_sameChunksAsCsv(captureFiles, chunkSize):
+    csvFilename, binaryFilename = captureFiles
+    expected = flatten(list(CsvCaptureReader(csvFilename)))
+
+    with BinaryCaptureReader(binaryFilename, chunkSize=chunkSize) as reader:
+        chunks = list(reader)
+        assert all(len(chunk.values) <= chunkSize for chunk in chunks)
+        assert flatten(chunks) == expected
+
+    with BinaryCaptureReader(binaryFilename, chunkSize=chunkSize) as reader:
+        chunks = list(reader._structChunks())  # fallback without numpy
+        assert flatten(chunks) == expected
+
+
+def test_binaryCapture_decodeChunks(captureFiles):
+    csvFilename, binaryFilename = captureFiles
+    expected = list(decodeChunks(CsvCaptureReader(csvFilename), OctetStreamDecoder(createSettings(OPERATE, BitRate.COM2))))
+
+    with BinaryCaptureReader(binaryFilename, chunkSize=5) as reader:
+        messages = list(decodeChunks(reader, OctetStreamDecoder(createSettings(OPERATE, BitRate.COM2))))
+
+    assert len(messages) == 4
+    assert [repr(msg) for msg in messages] == [repr(msg) for msg in expected]
+    assert [(msg.startTime, msg.endTime) for msg in messages] == [(msg.startTime, msg.endTime) for msg in expected]
+
+
+def test_binaryCapture_writeRecords(tmp_path):
+    filename = str(tmp_path / "capture.iolcap")
+    assert writeBinaryCapture(filename, [(0xA2, 0, -5, 10), (0x00, FLAG_ERROR, 20, 30), (0x49, 0, 40, 2**40)]) == 3
+
+    with BinaryCaptureReader(filename) as reader:
+        assert reader.header == CaptureHeader()
+        assert flatten(list(reader)) == ([0xA2, 0x49], [-5, 40], [10, 2**40])
+
+
+def test_binaryCapture_invalidFile(tmp_path):
+    filename = tmp_path / "capture.iolcap"
+
+    for content in (b'', b'IOLCAP', b'NOTACAPTURE_FILE', b'IOLCAP\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00'):
+        filename.write_bytes(content)
+        with pytest.raises(InvalidCaptureFile):
+            BinaryCaptureReader(str(filename))
+
+    writeBinaryCapture(str(filename), [(1, 0, 2, 3)])
+    filename.write_bytes(filename.read_bytes()[:-1])
+    with pytest.raises(InvalidCaptureFile):
+        BinaryCaptureReader(str(filename))
+
+
+def test_binaryCapture_unpackRecords():
+    data = struct.pack('<BBqq', 0x12, 0, 10, 20) + struct.pack('<BBqq', 0x34, FLAG_ERROR, 30, 40)
+    chunk = unpackRecords(data)
+    assert list(chunk.values) == [0x12]
+    assert (list(chunk.startTimes), list(chunk.endTimes)) == ([10], [20])
+
+    with pytest.raises(InvalidCaptureFile):
+        unpackRecords(data[:-1])
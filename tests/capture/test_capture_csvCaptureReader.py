@@ -0,0 +1,86 @@
+import pytest
+
+from iolink_utils.capture.csvCaptureReader import CsvCaptureReader, TimestampParser
+from iolink_utils.capture.octetChunk import OctetChunk, decodeChunks
+from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder
+from iolink_utils.octetStreamDecoder.octetStreamDecoderSettings import DecoderSettings, MSeqPayloadLength, TimestampMode
+from iolink_utils.definitions.bitRate import BitRate
+
+from ..octetStreamDecoder.testDataHelper import convertToTestDataList, toNanoseconds
+
+
+CAPTURE = """
+32, , 2050-01-01 00:01:02.166137+00:00, 2050-01-01 00:01:02.166410+00:00, data
+54, , 2050-01-01 00:01:02.166424+00:00, 2050-01-01 00:01:02.166698+00:00, data
+154, , 2050-01-01 00:01:02.166711+00:00, 2050-01-01 00:01:02.166985+00:00, data
+45, , 2050-01-01 00:01:02.167081+00:00, 2050-01-01 00:01:02.167354+00:00, data
+0, framing, 2050-01-01 00:01:02.168000+00:00, 2050-01-01 00:01:02.168100+00:00, data
+0, , 2050-01-01 00:01:02.168500+00:00, 2050-01-01 00:01:02.168600+00:00, break
+241, , 2050-01-01 00:01:02.169004+00:00, 2050-01-01 00:01:02.169278+00:00, data
+100, , 2050-01-01 00:01:02.169291+00:00, 2050-01-01 00:01:02.169564+00:00, data
+0, , 2050-01-01 00:01:02.169667+00:00, 2050-01-01 00:01:02.169941+00:00, data
+0, , 2050-01-01 00:01:02.169954+00:00, 2050-01-01 00:01:02.170228+00:00, data
+0, , 2050-01-01 00:01:02.170240+00:00, 2050-01-01 00:01:02.170514+00:00, data
+0, , 2050-01-01 00:01:02.170527+00:00, 2050-01-01 00:01:02.170800+00:00, data
+0, , 2050-01-01 00:01:02.170814+00:00, 2050-01-01 00:01:02.171087+00:00, data
+0, , 2050-01-01 00:01:02.171100+00:00, 2050-01-01 00:01:02.171373+00:00, data
+0, , 2050-01-01 00:01:02.171386+00:00, 2050-01-01 00:01:02.171660+00:00, data
+0, , 2050-01-01 00:01:02.171673+00:00, 2050-01-01 00:01:02.171946+00:00, data
+133, , 2050-01-01 00:01:02.171959+00:00, 2050-01-01 00:01:02.172233+00:00, data
+"""
+
+
+@pytest.fixture
+def captureFile(tmp_path):
+    filename = tmp_path / "capture.csv"
+    filename.write_text("value,error,start,end,type\n" + CAPTURE.strip() + "\n", encoding="utf-8")
+    return str(filename)
+
+
+def test_timestampParser():
+    parse = TimestampParser()
+
+    assert parse("1970-01-01 00:00:00+00:00") == 0
+    assert parse("1970-01-01 00:00:01.5+00:00") == 1_500_000_000
+    assert parse("1970-01-01 00:00:01.000000001Z") == 1_000_000_001
+    assert parse("1970-01-01T00:00:01.123456789123") == 1_123_456_789  # no time zone -> UTC, ns resolution
+    assert parse("1970-01-01 01:00:01.25+01:00") == 1_250_000_000
+    assert parse("1970-01-01 00:00:01.25-01:00") == 3_601_250_000_000
+
+    for line in convertToTestDataList(CAPTURE):
+        start = line['start'].isoformat(sep=' ')
+        assert parse(start) == toNanoseconds(line['start'])
+
+
+def test_csvCaptureReader_chunks(captureFile):
+    expected = convertToTestDataList(CAPTURE)
+    assert len(expected) == 15
+
+    for chunkSize in (1, 4, 15, 100):
+        reader = CsvCaptureReader(captureFile, chunkSize=chunkSize)
+        chunks = list(reader)
+
+        assert all(isinstance(chunk, OctetChunk) for chunk in chunks)
+        assert all(len(chunk.values) <= chunkSize for chunk in chunks)
+        assert reader.skippedRows == 3  # header, error, break
+
+        assert [value for chunk in chunks for value in chunk.values] == [line['value'] for line in expected]
+        assert ([start for chunk in chunks for start in chunk.startTimes] ==
+                [toNanoseconds(line['start']) for line in expected])
+        assert ([end for chunk in chunks for end in chunk.endTimes] ==
+                [toNanoseconds(line['end']) for line in expected])
+
+
+def test_csvCaptureReader_decodeChunks(captureFile):
+    settings = DecoderSettings(
+        transmissionRate=BitRate.COM2,
+        startup=MSeqPayloadLength(pdOut=0, od=1, pdIn=0),
+        preoperate=MSeqPayloadLength(pdOut=0, od=8, pdIn=0),
+        operate=MSeqPayloadLength(pdOut=7, od=2, pdIn=10),
+        timestampMode=TimestampMode.Nanoseconds
+    )
+
+    messages = list(decodeChunks(CsvCaptureReader(captureFile, chunkSize=5), OctetStreamDecoder(settings)))
+    assert len(messages) == 4
+    assert all(message.isValid for message in messages)
+    assert messages[0].startTime == toNanoseconds(convertToTestDataList(CAPTURE)[0]['start'])
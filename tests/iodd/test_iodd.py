@@ -139,3 +139,48 @@ def test_iodd_noPDIn_noPDOut():
     my_iodd.physicalLayer.mSequenceCapability = None  # like in IODD V1.0.1
     with pytest.raises(MSequenceCapabilityMissing):
         size_OnRequestData = my_iodd.size_OnRequestData
+
+
+def test_iodd_variableDatatypes():
+    test_dir = Path(__file__).parent
+    my_iodd = Iodd(str(test_dir.joinpath(
+        'IODDViewer1.4_Examples/IO-Link-12-DatatypeComplexDtDevice-20211215-IODD1.1.xml')))
+
+    functionTag = my_iodd.variableCollection[25].datatype
+    assert (functionTag.xsiType, functionTag.bitLength, functionTag.encoding) == ('StringT', 256, 'UTF-8')
+
+    channel = my_iodd.variableCollection[64].datatype  # record items reference datatypes of DatatypeCollection
+    assert (channel.xsiType, channel.bitLength) == ('RecordT', 32)
+    assert [(item.subIndex, item.bitOffset, item.name, item.datatype.xsiType, item.datatype.bitLength)
+            for item in channel.items] == [(1, 16, 'Adjustment Value 1', 'IntegerT', 16),
+                                           (2, 0, 'Adjustment Value 2', 'IntegerT', 16)]
+
+
+@pytest.mark.parametrize("original, replacement, unresolvedIndices", [
+    # variable references an unknown datatype
+    ('<Variable index="65" id="V_X_ParamChannel2" accessRights="rw" excludedFromDataStorage="false">\n'
+     '          <DatatypeRef datatypeId="D_X_ParamChannel"/>',
+     '<Variable index="65" id="V_X_ParamChannel2" accessRights="rw" excludedFromDataStorage="false">\n'
+     '          <DatatypeRef datatypeId="D_X_Unknown"/>', [65]),
+    # record item references an unknown datatype
+    ('<DatatypeRef datatypeId="D_X_AdjustValue2"/>', '<DatatypeRef datatypeId="D_X_Unknown"/>', [64, 65]),
+    # record without bit length
+    ('<Datatype id="D_X_ParamChannel" xsi:type="RecordT" bitLength="32">',
+     '<Datatype id="D_X_ParamChannel" xsi:type="RecordT">', [64, 65])
+], ids=['variable', 'recordItem', 'missingBitLength'])
+def test_iodd_unresolvedVariableDatatype(tmp_path, original, replacement, unresolvedIndices):
+    test_dir = Path(__file__).parent
+    xml = test_dir.joinpath('IODDViewer1.4_Examples/IO-Link-12-DatatypeComplexDtDevice-20211215-IODD1.1.xml') \
+        .read_text(encoding='utf-8')
+    assert original in xml
+    filename = tmp_path / 'IO-Link-12-DatatypeComplexDtDevice-20211215-IODD1.1.xml'
+    filename.write_text(xml.replace(original, replacement), encoding='utf-8')
+
+    my_iodd = Iodd(str(filename))  # variables are loaded without datatype
+
+    for index in (25, 26, 64, 65):
+        assert (my_iodd.variableCollection[index].datatype is None) == (index in unresolvedIndices)
+    decoders = my_iodd.variableDecoders
+    assert decoders.decode(25, 0, b'Tag') == 'Tag'
+    for index in unresolvedIndices:
+        assert decoders.decoder(index) is None
@@ -0,0 +1,80 @@
+import struct
+from pathlib import Path
+
+import pytest
+
+from iolink_utils.exceptions import InvalidVariableData
+from iolink_utils.iodd.iodd import Iodd
+from iolink_utils.iodd.iodd_variableDecoder import VariableDecoders, createVariableDecoders
+from iolink_utils.iodd._internal.iodd_variableCollection import Variable, Datatype, DatatypeItem
+
+
+def loadIodd(name: str) -> Iodd:
+    return Iodd(str(Path(__file__).parent.joinpath(f'IODDViewer1.4_Examples/IO-Link-{name}-20211215-IODD1.1.xml')))
+
+
+def test_variableDecoders_simpleDatatypes():
+    iodd = loadIodd('09-AllSimpleDatatypesDevice')
+    decoders = iodd.variableDecoders
+    assert decoders is iodd.variableDecoders  # created once
+
+    assert decoders.decode(25, 0, b'Tag\x00\x00') == 'Tag'
+    assert decoders.decode(25, 0, 'Füße'.encode('utf-8')) == 'Füße'
+    assert decoders.decode(64, 0, b'\xFF') is True
+    assert decoders.decode(64, 0, b'\x00') is False
+    assert decoders.decode(66, 0, b'\xFE') == 254
+    assert decoders.decode(67, 0, b'\x01\xF4') == 500
+    assert decoders.decode(68, 0, (-500000).to_bytes(4, 'big', signed=True)) == -500000
+    assert decoders.decode(69, 0, struct.pack('>f', -1.5)) == -1.5
+    assert decoders.decode(70, 0, b'\x55\xAA') == b'\x55\xAA'
+    assert decoders.decode(71, 0, bytes(8)) == bytes(8)  # TimeT: no decoder, raw octets
+
+    assert decoders.decoder(1000) is None
+    assert decoders.decode(1000, 0, b'\x00') is None
+    assert decoders.decode(67, 1, b'\x00') is None
+
+
+def test_variableDecoders_invalidLength():
+    decoders = loadIodd('09-AllSimpleDatatypesDevice').variableDecoders
+    for index, data in [(67, b'\x01'), (68, bytes(5)), (25, bytes(33)), (70, bytes(9))]:
+        with pytest.raises(InvalidVariableData):
+            decoders.decode(index, 0, data)
+
+
+def test_variableDecoders_complexDatatypes():
+    decoders = loadIodd('10-AllComplexDatatypesDevice').variableDecoders
+
+    # ArrayT: subindex 1 is the first (most significant) element
+    assert decoders.decode(64, 0, b'\x0A') == [True, False, True, False]
+    assert decoders.decode(64, 2, b'\xFF') is True
+    assert decoders.decode(66, 0, b'\x00\x01\xFF\xFE\x01\xF4') == [1, -2, 500]
+    assert decoders.decode(66, 2, b'\xFF\xFE') == -2
+
+    # RecordT: items at their bit offsets
+    assert decoders.decode(65, 0, b'\x05') == {1: True, 2: False, 3: True, 4: False}
+    assert decoders.decode(67, 0, b'\x00\x01\xFF\xFE\x01\xF4') == {1: 1, 2: -2, 3: 500}
+    assert decoders.decode(67, 3, b'\x80\x00') == -32768
+    assert decoders.decode(68, 0, b'\x07\x00\xFF\xF6' + struct.pack('>f', 2.5)) == {1: 7, 3: -10, 4: 2.5}
+    assert decoders.decode(68, 4, struct.pack('>f', 2.5)) == 2.5
+
+    with pytest.raises(InvalidVariableData):
+        decoders.decode(67, 0, bytes(5))
+
+
+def test_variableDecoders_datatypeRef():
+    decoders = loadIodd('12-DatatypeComplexDtDevice').variableDecoders
+    assert decoders.decode(64, 0, b'\x00\x10\xFF\xF0') == {1: 16, 2: -16}
+    assert decoders.decode(65, 1, b'\x00\x10') == 16
+
+
+def test_variableDecoders_octetItems():
+    record = Datatype(xsiType='RecordT', bitLength=48, items=[
+        DatatypeItem(subIndex=1, bitOffset=40, datatype=Datatype(xsiType='UIntegerT', bitLength=8)),
+        DatatypeItem(subIndex=2, bitOffset=16, datatype=Datatype(xsiType='StringT', bitLength=24, encoding='US-ASCII')),
+        DatatypeItem(subIndex=3, bitOffset=0, datatype=Datatype(xsiType='OctetStringT', bitLength=16)),
+    ])
+    decoders = VariableDecoders({100: Variable(index=100, datatype=record), 101: Variable(index=101)})
+    assert len(decoders) == 4  # record and 3 items, no decoder without datatype
+    assert decoders.decode(100, 0, b'\x2AAB\x00\x12\x34') == {1: 42, 2: 'AB', 3: b'\x12\x34'}
+    assert decoders.decode(100, 2, b'XYZ') == 'XYZ'
+    assert createVariableDecoders(Variable(index=101)) == {}
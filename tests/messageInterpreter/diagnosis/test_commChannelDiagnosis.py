@@ -126,3 +126,26 @@ def test_commChannelDiagnosis_invalidMasterMessage():
 
     with pytest.raises(UnexpectedMasterMessageReceived):
         channel.handleMasterMessage(msg)
+
+
+def test_commChannelDiagnosis_track(mocker):
+    createdMemory = mocker.spy(TransactionDiagEventMemory, '__init__')
+    createdReset = mocker.spy(TransactionDiagEventReset, '__init__')
+    channel = CommChannelDiagnosis()
+
+    # read event memory, unexpected write (no error) and reset event flag
+    for address, data in zip((0, 4, 5, 6), (0x82, 0xF4, 0xAA, 0xBB)):
+        assert channel.trackMasterMessage(_createMasterMessage(1, address, 1)) is None
+        assert channel.trackDeviceMessage(_createDeviceMessage(data, 2)) is None
+    assert channel._eventMemory.isComplete()
+    assert channel._state == CommChannelDiagnosis.State.Idle
+
+    channel.trackMasterMessage(_createMasterMessage(0, 1, 3))
+    assert channel._state == CommChannelDiagnosis.State.Idle
+    channel.trackMasterMessage(_createMasterMessage(0, 0, 3))
+    assert channel._state == CommChannelDiagnosis.State.ResetEventFlag
+    channel.trackDeviceMessage(_createDeviceMessage(0x00, 4))
+    assert channel._state == CommChannelDiagnosis.State.Idle
+    assert channel._endTime == dt(2000, 4, 1)
+
+    assert createdMemory.call_count == createdReset.call_count == 0
@@ -1,7 +1,12 @@
+import copy
+import pickle
+
 import pytest
 from typing import List
 
-from iolink_utils.messageInterpreter.isdu.commChannelISDU import CommChannelISDU
+from iolink_utils.messageInterpreter.isdu.commChannelISDU import CommChannelISDU, ISDULength
+from iolink_utils.messageInterpreter.isdu.ISDU import ISDU
+from iolink_utils.messageInterpreter.isdu.ISDUexchange import ISDUExchange
 from iolink_utils.messageInterpreter.isdu.ISDUrequests import (
     ISDURequest_Read8bitIdxSub,
     ISDURequest_Read16bitIdxSub,
@@ -68,8 +73,8 @@ def test_commChannelDiagnosis_read():
 
 
 # See "Example sequence of an ISDU transmission"
-def test_commChannelDiagnosis_exampleFigureJ1():
-    messages = [
+def createExampleFigureJ1Messages():
+    return [
         # Idle_1 / 0
         (createMasterMessage(0b11110001, 0b10000000, 1, []),
          createDeviceMessage([0b00000000], 1, 0b00000000), None),
@@ -274,9 +279,11 @@ def test_commChannelDiagnosis_exampleFigureJ1():
          createDeviceMessage([0b00000000], 1, 0b00000000), None),
     ]
 
+
+def test_commChannelDiagnosis_exampleFigureJ1():
     channel = CommChannelISDU()
 
-    for masterMessage, deviceMessage, resultType in messages:
+    for masterMessage, deviceMessage, resultType in createExampleFigureJ1Messages():
         transaction = None
 
         if masterMessage:
@@ -288,3 +295,74 @@ def test_commChannelDiagnosis_exampleFigureJ1():
             assert type(transaction) == resultType
             assert transaction.isComplete
             assert transaction.isValid
+
+
+def processMessages(channel: CommChannelISDU, messages, trackedCount: int = 0) -> dict:
+    """:return: transactions by message index (the first trackedCount messages are tracked)"""
+    results = {}
+    for index, (masterMessage, deviceMessage, _) in enumerate(messages):
+        track = index < trackedCount
+        (channel.trackMasterMessage if track else channel.handleMasterMessage)(masterMessage)
+        if deviceMessage:
+            result = (channel.trackDeviceMessage if track else channel.handleDeviceMessage)(deviceMessage)
+            if result is not None:
+                results[index] = result
+    return results
+
+
+@pytest.mark.parametrize("exchanges", [False, True])
+def test_commChannelISDU_trackWithoutTransactions(mocker, exchanges):
+    createdISDUs = mocker.spy(ISDU, '__init__')
+    createdExchanges = mocker.spy(ISDUExchange, '__init__')
+
+    tracked, handled = CommChannelISDU(exchanges=exchanges), CommChannelISDU(exchanges=exchanges)
+    for message in createExampleFigureJ1Messages() * 2:
+        created = (createdISDUs.call_count, createdExchanges.call_count)
+        assert processMessages(tracked, [message], trackedCount=1) == {}
+        assert (createdISDUs.call_count, createdExchanges.call_count) == created
+
+        # same state as the full handler
+        processMessages(handled, [message])
+        assert tracked._state == handled._state
+        assert (tracked._flowControl, tracked._previousFlowControl) == \
+            (handled._flowControl, handled._previousFlowControl)
+        for trackedISDU, handledISDU in ((tracked._isduRequest, handled._isduRequest),
+                                         (tracked._isduResponse, handled._isduResponse)):
+            assert trackedISDU is None or isinstance(trackedISDU, ISDULength)
+            if trackedISDU is not None:
+                assert (trackedISDU._length, trackedISDU.isComplete) == (handledISDU._length, handledISDU.isComplete)
+    assert createdISDUs.call_count > 0
+
+
+def test_commChannelISDU_trackThenHandle():
+    messages = createExampleFigureJ1Messages()
+    expected = processMessages(CommChannelISDU(), messages)
+    assert list(expected) == [5, 31, 47, 50, 57]
+
+    # request received while tracked (messages 0..4), response handled: only the response is returned
+    results = processMessages(CommChannelISDU(), messages, trackedCount=5)
+    assert list(results) == [31, 47, 50, 57]
+    assert all(results[index].data() == expected[index].data() for index in results)
+
+    # ... an exchange can't be created without the request
+    expected = processMessages(CommChannelISDU(exchanges=True), messages)
+    assert list(expected) == [31, 50]
+    results = processMessages(CommChannelISDU(exchanges=True), messages, trackedCount=5)
+    assert list(results) == [50]
+    assert results[50].data() == expected[50].data()
+
+
+@pytest.mark.parametrize("copyChannel", [copy.deepcopy, lambda channel: pickle.loads(pickle.dumps(channel))])
+def test_commChannelISDU_copyKeepsHandlerTables(copyChannel):
+    channel = CommChannelISDU()
+    assert channel.handleMasterMessage(createMasterMessage(0x70, 0x83, 7, [0xA4, 0x03])) is None
+    channel.handleDeviceMessage(createDeviceMessage([], 10, 0x2D))
+
+    copied = copyChannel(channel)
+    assert copied._masterHandler[CommChannelISDU.State.Request].__self__ is copied
+    assert copied._deviceHandler[CommChannelISDU.State.Response].__self__ is copied
+
+    # the copy continues the request, the original channel is not modified
+    assert copied.handleMasterMessage(createMasterMessage(0x61, 0x86, 7, [0x01, 0xA6])) is None
+    assert type(copied.handleDeviceMessage(createDeviceMessage([], 10, 0x2D))) == ISDURequest_Read8bitIdxSub
+    assert channel._state == CommChannelISDU.State.Request
@@ -114,3 +114,66 @@ def test_ISDU_dispatch(mocker):
     req.dispatch(handler)
 
     handler.handleISDU.assert_called_once_with(req)
+
+
+def createExtendedISDU(dataLength: int) -> bytearray:
+    octets = bytearray([int(IService(service=IServiceNibble.NoService, length=1)), dataLength + 3])
+    octets += bytearray(value & 0xFF for value in range(7, 7 + dataLength))
+    chkpdu = 0
+    for octet in octets:
+        chkpdu ^= octet
+    return octets + bytearray([chkpdu])
+
+
+@pytest.mark.parametrize("segmentSize", [1, 2, 8])
+def test_ISDU_extendedLength_segments(segmentSize):
+    octets = createExtendedISDU(235)
+    assert len(octets) == 238
+
+    isdu = MyISDU()
+    for begin in range(0, len(octets), segmentSize):
+        assert not isdu.isComplete
+        isdu.appendOctets(octets[begin:begin + segmentSize])
+        if begin > 0:  # buffer has its final size as soon as the header is known
+            assert len(isdu._buffer) == 238
+    assert isdu.isComplete
+    assert isdu.isValid
+    assert isdu._rawData == octets
+    assert isdu._rawData is isdu._buffer
+    assert isdu._chkpdu == octets[-1] == isdu._calculateCheckByte()
+
+
+def test_ISDU_checkByte_replacedSegment():
+    octets = createExtendedISDU(10)
+
+    isdu = MyISDU()
+    isdu.appendOctets(octets[:4])
+    isdu.appendOctets(bytearray([0xFF, 0xFF]))  # wrong segment, repeated with correct content
+    isdu.replaceTrailingOctets(octets[4:6])
+    isdu.appendOctets(octets[6:])
+    assert isdu.isComplete
+    assert isdu.isValid
+    assert isdu._rawData == octets
+
+    isdu = MyISDU()
+    isdu.appendOctets(octets[:-1] + bytearray([octets[-1] ^ 0x01]))
+    assert isdu.isComplete
+    assert not isdu.isValid
+
+
+def test_ISDU_octetsBeyondLengthDropped():
+    service = IService(service=IServiceNibble.NoService, length=3)
+    chkpdu = int(service) ^ 0x11 ^ 0x22
+    isdu = MyISDU()
+    isdu.appendOctets(bytearray([int(service), 0x11, 0x22, chkpdu, 0x55, 0x66]))  # segment longer than ISDU
+    assert isdu.isComplete
+    assert not isdu.isValid  # last octet is not the check byte
+    assert isdu._rawData == bytearray([int(service), 0x11, 0x22])
+
+    isdu = MyISDU()
+    service = IService(service=IServiceNibble.NoService, length=4)
+    isdu.appendOctets(bytearray([int(service), 0x11]))
+    isdu.appendOctets(bytearray([0x22, int(service) ^ 0x11 ^ 0x22, 0x55, 0x66]))
+    assert isdu.isComplete
+    assert isdu.isValid
+    assert len(isdu._rawData) == 4
@@ -0,0 +1,151 @@
+from datetime import datetime as dt, timedelta
+
+from iolink_utils.definitions.communicationChannel import CommChannel
+from iolink_utils.definitions.transmissionDirection import TransmissionDirection
+from iolink_utils.messageInterpreter.messageInterpreter import MessageInterpreter
+from iolink_utils.messageInterpreter.isdu.ISDUerrors import IsduError
+from iolink_utils.messageInterpreter.isdu.ISDUexchange import ISDUExchange
+from iolink_utils.messageInterpreter.isdu.ISDUpool import ISDUPool
+from iolink_utils.messageInterpreter.isdu.ISDUrequests import ISDURequest_Read8bitIdxSub
+from iolink_utils.messageInterpreter.isdu.ISDUresponses import ISDUResponse_ReadResp_P
+
+from .test_commChannelISDU import createMasterMessage, createDeviceMessage
+
+
+def withTimes(mSequences, busyCycles: int = 0):
+    # M-sequence n starts at n * 100 and ends at n * 100 + 50, the device is busy for busyCycles M-sequences
+    messages = []
+    for masterOd, deviceOd, mc in mSequences:
+        repeat = busyCycles + 1 if mc == 0xF0 else 1
+        for cycle in range(repeat):
+            busy = cycle < repeat - 1
+            messages.append(createMasterMessage(mc, 0x80, 0, masterOd))
+            messages.append(createDeviceMessage([0x01, 0x00] if busy else deviceOd, 0, 0x00))
+    for position in range(0, len(messages), 2):
+        start = position * 50
+        messages[position].startTime, messages[position].endTime = start, start + 40
+        messages[position + 1].startTime, messages[position + 1].endTime = start + 40, start + 50
+    return messages
+
+
+def readMessages(index: int, subIndex: int, value: int, busyCycles: int = 0):
+    return withTimes([
+        ([0xA4, index], [], 0x70),
+        ([subIndex, 0xA4 ^ index ^ subIndex], [], 0x61),
+        ([], [0xD3, value], 0xF0),
+        ([], [0xD3 ^ value, 0x00], 0xE1),
+    ], busyCycles)
+
+
+def writeErrorMessages(index: int, errorCode: int = 0x80, additionalCode: int = 0x11):
+    # write one octet (0xAB), negative response (default: IDX_NOTAVAIL)
+    return withTimes([
+        ([0x14, index], [], 0x70),
+        ([0xAB, 0x14 ^ index ^ 0xAB], [], 0x61),
+        ([], [0x44, errorCode], 0xF0),
+        ([], [additionalCode, 0x44 ^ errorCode ^ additionalCode], 0xE1),
+    ])
+
+
+def writeReadRespMessages(index: int):
+    # write one octet (0xAB), answered by a positive read response (service does not match the request)
+    return withTimes([
+        ([0x14, index], [], 0x70),
+        ([0xAB, 0x14 ^ index ^ 0xAB], [], 0x61),
+        ([], [0xD3, 0x20], 0xF0),
+        ([], [0xD3 ^ 0x20, 0x00], 0xE1),
+    ])
+
+
+def test_ISDUExchange_read():
+    interpreter = MessageInterpreter(isduExchanges=True)
+    exchange, = interpreter.processMessages(readMessages(0x12, 0x03, 0x77, busyCycles=2))
+
+    assert type(exchange) is ISDUExchange
+    assert exchange.direction == TransmissionDirection.Read
+    assert (exchange.index, exchange.subIndex, exchange.payload) == (0x12, 0x03, b'\x77')
+    assert exchange.isValid
+    assert exchange.isduError == IsduError.UNDEFINED
+    assert (exchange.startTime, exchange.endTime) == (0, 550)
+    assert exchange.latency == 400 - 150  # request ends with M-sequence 1, response starts after 2 busy cycles
+    assert exchange.isSuccess
+    assert exchange.data() == {'valid': True, 'success': True, 'direction': 'Read', 'index': 0x12, 'subIndex': 0x03, 'data': b'\x77',
+                               'error': 'UNDEFINED', 'latency': 250, 'value': None}
+
+
+def test_ISDUExchange_writeError():
+    exchange, = MessageInterpreter(isduExchanges=True).processMessages(writeErrorMessages(0x40))
+
+    assert exchange.direction == TransmissionDirection.Write
+    assert (exchange.index, exchange.subIndex, exchange.payload) == (0x40, 0, b'\xAB')
+    assert exchange.isValid
+    assert not exchange.isSuccess
+    assert exchange.isduError == IsduError.IDX_NOTAVAIL
+
+
+def test_ISDUExchange_negativeResponseWithoutErrorCode():
+    exchange, = MessageInterpreter(isduExchanges=True).processMessages(writeErrorMessages(0x40, 0x00, 0x00))
+
+    assert exchange.isValid
+    assert exchange.isduError == IsduError.UNDEFINED
+    assert not exchange.isSuccess
+
+
+def test_ISDUExchange_responseServiceMismatch():
+    exchange, = MessageInterpreter(isduExchanges=True).processMessages(writeReadRespMessages(0x40))
+
+    assert exchange.direction == TransmissionDirection.Write
+    assert exchange.isValid
+    assert exchange.isduError == IsduError.UNDEFINED
+    assert not exchange.isSuccess
+
+
+def test_ISDUExchange_datetime():
+    messages = readMessages(0x12, 0x03, 0x77)
+    for message in messages:
+        message.startTime = dt(2025, 1, 1) + timedelta(microseconds=message.startTime)
+        message.endTime = dt(2025, 1, 1) + timedelta(microseconds=message.endTime)
+
+    exchange, = MessageInterpreter(isduExchanges=True).processMessages(messages)
+    assert exchange.latency == timedelta(microseconds=50)
+
+
+def test_ISDUExchange_sameAsTransactions():
+    messages = readMessages(0x12, 0x03, 0x77)
+    request, response = MessageInterpreter().processMessages(messages)
+    assert (type(request), type(response)) == (ISDURequest_Read8bitIdxSub, ISDUResponse_ReadResp_P)
+
+    exchange, = MessageInterpreter(isduExchanges=True).processMessages(messages)
+    assert (exchange.index, exchange.subIndex) == (request.index, request.subIndex)
+    assert exchange.payload == response.data()['data']
+    assert exchange.latency == response.startTime - request.endTime
+
+
+def test_ISDUExchange_pool():
+    pool = ISDUPool()
+    interpreter = MessageInterpreter(channels=[CommChannel.ISDU], isduPool=pool, isduExchanges=True)
+    assert len(list(interpreter.processMessages(readMessages(0x12, 0x03, 0x77)))) == 1
+    assert len(pool) == 2  # request and response are released by the channel
+
+    exchanges = list(interpreter.processMessages(readMessages(0x13, 0x04, 0x55) + writeErrorMessages(0x40)))
+    assert [(exchange.index, exchange.payload) for exchange in exchanges] == [(0x13, b'\x55'), (0x40, b'\xAB')]
+    assert len(pool) == 4
+
+
+def test_ISDUExchange_restoreKeepsConfiguration():
+    messages = readMessages(0x12, 0x03, 0x77)
+
+    interpreter = MessageInterpreter()
+    request, = interpreter.processMessages(messages[:4])
+    exchangeInterpreter = MessageInterpreter(isduExchanges=True)
+    exchangeInterpreter.restore(interpreter.snapshot())
+    assert exchangeInterpreter.isduExchanges
+    exchange, = exchangeInterpreter.processMessages(messages[4:])
+    assert type(exchange) is ISDUExchange
+    assert (exchange.index, exchange.subIndex, exchange.payload) == (0x12, 0x03, b'\x77')
+
+    assert list(exchangeInterpreter.processMessages(messages[:4])) == []
+    interpreter.restore(exchangeInterpreter.snapshot())
+    assert not interpreter.isduExchanges
+    response, = interpreter.processMessages(messages[4:])
+    assert type(response) is ISDUResponse_ReadResp_P
@@ -0,0 +1,97 @@
+from iolink_utils.definitions.communicationChannel import CommChannel
+from iolink_utils.messageInterpreter.messageInterpreter import MessageInterpreter
+from iolink_utils.messageInterpreter.isdu.ISDUpool import ISDUPool
+from iolink_utils.messageInterpreter.isdu.ISDUrequests import ISDURequest_Read8bitIdx, ISDURequest_Read8bitIdxSub, \
+    ISDURequest_Write8bitIdx, createISDURequest
+from iolink_utils.messageInterpreter.isdu.ISDUresponses import ISDUResponse_ReadResp_P
+from iolink_utils.messageInterpreter.page.commChannelPage import TransactionPage
+from iolink_utils.octetDecoder.octetDecoder import IService
+
+from .test_commChannelISDU import createMasterMessage, createDeviceMessage
+
+
+def createReadMessages(index: int):
+    # read index / subIndex 0x01, response with one data octet
+    data = 0x30 + index
+    return [
+        createMasterMessage(0x70, 0x83, 7, [0xA4, index]), createDeviceMessage([], 10, 0x2D),
+        createMasterMessage(0x61, 0x86, 7, [0x01, 0xA4 ^ index ^ 0x01]), createDeviceMessage([], 10, 0x2D),
+        createMasterMessage(0xF0, 0x85, 7, []), createDeviceMessage([0xD3, data], 10, 0x39),
+        createMasterMessage(0xE1, 0x80, 7, []), createDeviceMessage([0xD3 ^ data, 0x00], 10, 0x39),
+    ]
+
+
+def test_ISDUPool_recycle():
+    pool = ISDUPool()
+    request = createISDURequest(IService(0x93), pool)
+    request.appendOctets(bytearray([0x93, 0x12, 0x81]))
+    assert request.isComplete
+
+    pool.release(request)
+    assert len(pool) == 1
+    pool.release(request)  # released twice: only pooled once
+    assert len(pool) == 1
+
+    recycled = createISDURequest(IService(0x93), pool)
+    assert recycled is request
+    assert len(pool) == 0
+    assert not recycled.isComplete and not recycled.isValid
+    assert recycled.data() == ISDURequest_Read8bitIdx().data()
+    assert recycled._rawData == bytearray()
+
+    recycled.appendOctets(bytearray([0x93, 0x34]))
+    recycled.appendOctets(bytearray([0xA7]))
+    assert recycled.data() == {'valid': True, 'index': 0x34}
+
+
+def test_ISDUPool_acquireOtherClass():
+    pool = ISDUPool()
+    pool.release(ISDURequest_Write8bitIdx())
+    assert type(pool.acquire(ISDUResponse_ReadResp_P)) is ISDUResponse_ReadResp_P
+    assert len(pool) == 1
+
+
+def test_ISDUPool_releaseIgnored():
+    pool = ISDUPool(maxSize=2)
+    pool.release(TransactionPage(0, 0, 0))
+    assert len(pool) == 0
+
+    for _ in range(3):
+        pool.release(ISDURequest_Write8bitIdx())
+    assert len(pool) == 2
+
+
+def test_ISDUPool_messageInterpreter():
+    pool = ISDUPool()
+    interpreter = MessageInterpreter(channels=[CommChannel.ISDU], isduPool=pool)
+    assert interpreter.isduPool is pool
+
+    results, objects = [], set()
+    for index in range(5):
+        for transaction in interpreter.processMessages(createReadMessages(index)):
+            results.append((type(transaction), transaction.data()))
+            objects.add(id(transaction))
+            pool.release(transaction)
+
+    unpooled = MessageInterpreter(channels=[CommChannel.ISDU])
+    assert results == [(type(transaction), transaction.data())
+                       for index in range(5) for transaction in unpooled.processMessages(createReadMessages(index))]
+    assert [result[0] for result in results[:2]] == [ISDURequest_Read8bitIdxSub, ISDUResponse_ReadResp_P]
+    assert all(data['valid'] for _, data in results)
+    assert len(objects) == 2  # one request and one response object for all ISDUs
+
+
+def test_ISDUPool_snapshotRestore():
+    pool = ISDUPool()
+    interpreter = MessageInterpreter(isduPool=pool)
+    messages = createReadMessages(1)
+    list(interpreter.processMessages(messages[:3]))
+
+    snapshot = interpreter.snapshot()
+    assert snapshot['channelHandler'][CommChannel.ISDU].isduPool is None  # pool is not part of the state
+
+    interpreter.restore(snapshot)
+    assert interpreter._channelHandler[CommChannel.ISDU].isduPool is pool
+    request, response = interpreter.processMessages(messages[3:])
+    assert request.data() == {'valid': True, 'index': 1, 'subIndex': 1}
+    assert response.data() == {'valid': True, 'data': bytearray([0x31])}
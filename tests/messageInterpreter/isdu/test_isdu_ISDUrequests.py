@@ -1,7 +1,10 @@
 import pytest
 
+from iolink_utils.messageInterpreter.isdu import ISDUrequests
+from iolink_utils.messageInterpreter.isdu.ISDU import ISDU
 from iolink_utils.messageInterpreter.isdu.ISDUrequests import (
     createISDURequest,
+    registerISDURequest,
     ISDURequest_Write8bitIdx,
     ISDURequest_Write8bitIdxSub,
     ISDURequest_Write16bitIdxSub,
@@ -28,6 +31,7 @@ def test_ISDURequest_createISDURequest():
         assert type(req) is _map_serviceValueToClass[serviceValue]
         assert req.__class__.__name__.endswith(req.name())
         assert req._SERVICE_NIBBLE == IServiceNibble(serviceValue)
+        assert not hasattr(req, '__dict__')
 
 
 def test_ISDURequest_createISDURequest_InvalidISDUService():
@@ -273,3 +277,38 @@ def test_ISDURequest_Read16bitIdxSub():
     assert d['valid'] == False
     assert d['index'] == 0
     assert d['subIndex'] == 0
+
+
+class VendorRequest(ISDU):
+    _SERVICE_NIBBLE = 0b0110  # reserved I-Service used by a vendor
+    __slots__ = ()
+
+    def _onFinished(self):
+        pass
+
+    def data(self) -> dict:
+        return {'valid': self.isValid, 'data': self._rawData[1:-1]}
+
+
+def test_ISDURequest_registerISDURequest(monkeypatch):
+    monkeypatch.setattr(ISDUrequests, '_requestClasses', list(ISDUrequests._requestClasses))
+    with pytest.raises(InvalidISDUService):
+        createISDURequest(IService(service=0b0110, length=3))
+
+    assert registerISDURequest(VendorRequest) is VendorRequest
+    req = createISDURequest(IService(service=0b0110, length=3))
+    assert type(req) is VendorRequest
+    req.appendOctets(bytearray([0x63, 0xAA, 0x63 ^ 0xAA]))
+    assert req.isComplete
+    assert req.data() == {'valid': True, 'data': bytearray([0xAA])}
+
+    # predefined services are not affected
+    assert type(createISDURequest(IService(service=IServiceNibble.M_ReadReq_8bitIdx))) is ISDURequest_Read8bitIdx
+
+
+def test_ISDURequest_registerISDURequest_InvalidISDUService(monkeypatch):
+    monkeypatch.setattr(ISDUrequests, '_requestClasses', list(ISDUrequests._requestClasses))
+    for nibble in [0, 16]:
+        monkeypatch.setattr(VendorRequest, '_SERVICE_NIBBLE', nibble)
+        with pytest.raises(InvalidISDUService):
+            registerISDURequest(VendorRequest)
@@ -1,7 +1,9 @@
 import pytest
 
+from iolink_utils.messageInterpreter.isdu import ISDUresponses
 from iolink_utils.messageInterpreter.isdu.ISDUresponses import (
     createISDUResponse,
+    registerISDUResponse,
     ISDUResponse_WriteResp_M,
     ISDUResponse_WriteResp_P,
     ISDUResponse_ReadResp_M,
@@ -35,6 +37,26 @@ def test_ISDUResponse_createISDUResponse_InvalidISDUService():
         createISDUResponse(service)
 
 
+def test_ISDUResponse_registerISDUResponse(monkeypatch):
+    class VendorResponse(ISDUResponse_ReadResp_P):
+        _SERVICE_NIBBLE = 0b1110  # reserved I-Service used by a vendor
+        __slots__ = ()
+
+    monkeypatch.setattr(ISDUresponses, '_responseClasses', list(ISDUresponses._responseClasses))
+    with pytest.raises(InvalidISDUService):
+        createISDUResponse(IService(service=0b1110, length=2))
+
+    registerISDUResponse(VendorResponse)
+    res = createISDUResponse(IService(service=0b1110, length=2))
+    res.appendOctets(bytearray([0xE2, 0xE2]))
+    assert type(res) is VendorResponse
+    assert res.data() == {'valid': True, 'data': bytearray()}
+
+    VendorResponse._SERVICE_NIBBLE = IServiceNibble.NoService
+    with pytest.raises(InvalidISDUService):
+        registerISDUResponse(VendorResponse)
+
+
 def test_ISDUResponse_WriteResp_M():
     service = IService(service=IServiceNibble.D_WriteResp_M, length=4)
     res = ISDUResponse_WriteResp_M()
@@ -23,3 +23,7 @@ def test_transactionPage_dispatch(mocker):
     tp = TransactionPage(TransmissionDirection.Read, 1, 2)
     tp.dispatch(handler)
     handler.handlePage.assert_called_once_with(tp)
+
+
+def test_transactionPage_slots():
+    assert not hasattr(TransactionPage(TransmissionDirection.Write, 1, 10), '__dict__')
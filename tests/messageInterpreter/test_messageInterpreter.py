@@ -1,12 +1,16 @@
 import pytest
 
 from iolink_utils.definitions.communicationChannel import CommChannel
+from iolink_utils.exceptions import UnexpectedMasterMessageReceived
 from iolink_utils.messageInterpreter.messageInterpreter import MessageInterpreter
 from iolink_utils.messageInterpreter.isdu.ISDU import ISDU
 from iolink_utils.messageInterpreter.page.transactionPage import TransactionPage
 from iolink_utils.messageInterpreter.process.transactionProcess import TransactionProcess
 from iolink_utils.messageInterpreter.diagnosis.transactionDiagnosis import TransactionDiagEventMemory
 
+from .isdu.test_commChannelISDU import createMasterMessage
+from .isdu.test_isdu_ISDUexchange import readMessages
+
 
 @pytest.fixture
 def interpreter():
@@ -105,3 +109,75 @@ def test_messageInterpreter_reset(interpreter, mocker):
     assert interpreter._activeChannel == CommChannel.Process
     for handler in interpreter._channelHandler.values():
         handler.reset.assert_called_once()
+
+
+def test_messageInterpreter_channelFilter(mocker):
+    interpreter = MessageInterpreter(channels=[CommChannel.ISDU, CommChannel.Diagnosis])
+    assert interpreter.channels == {CommChannel.ISDU, CommChannel.Diagnosis}
+
+    # filtered channels: only the state of the handler is updated, active channel is still tracked
+    for channel in (CommChannel.Process, CommChannel.Page):
+        message = mock_message(mocker, channel, mocker.Mock())
+        assert interpreter.processMessage(message) is None
+        tracker, = message.dispatch.call_args.args
+        assert tracker.handleMasterMessage == interpreter._channelHandler[channel].trackMasterMessage
+        assert interpreter._activeChannel == channel
+
+    result = mocker.Mock(spec=ISDU)
+    message = mock_message(mocker, CommChannel.ISDU, result)
+    assert interpreter.processMessage(message) is result
+    message.dispatch.assert_called_once_with(interpreter._channelHandler[CommChannel.ISDU])
+
+    # device messages (no channel) belong to the active channel
+    message = mock_message(mocker, None, result)
+    assert interpreter.processMessage(message) is result
+    interpreter.processMessage(mock_message(mocker, CommChannel.Page))
+    message = mock_message(mocker, None, result)
+    assert interpreter.processMessage(message) is None
+
+
+def test_messageInterpreter_processMessages(mocker):
+    results = [mocker.Mock(spec=TransactionPage), mocker.Mock(spec=ISDU)]
+    messages = [mock_message(mocker, CommChannel.Page, results[0]),
+                mock_message(mocker, CommChannel.Process, mocker.Mock(spec=TransactionProcess)),
+                mock_message(mocker, None, mocker.Mock(spec=TransactionProcess)),
+                mock_message(mocker, CommChannel.ISDU, None),
+                mock_message(mocker, None, results[1])]
+
+    assert list(MessageInterpreter(channels=[CommChannel.Page, CommChannel.ISDU]).processMessages(messages)) == results
+    assert len(list(MessageInterpreter().processMessages(messages))) == 4
+
+
+def test_messageInterpreter_channelFilterRestore(mocker):
+    interpreter = MessageInterpreter(channels=[CommChannel.ISDU])
+    interpreter.restore(MessageInterpreter().snapshot())
+    message = mock_message(mocker, CommChannel.Process, mocker.Mock())
+    assert interpreter.processMessage(message) is None
+    message = mock_message(mocker, CommChannel.ISDU, mocker.Mock())
+    interpreter.processMessage(message)
+    message.dispatch.assert_called_once_with(interpreter._channelHandler[CommChannel.ISDU])
+
+
+def test_messageInterpreter_channelFilterChanged():
+    messages = readMessages(0x12, 0x03, 0x77)
+    expected = [result.data() for result in MessageInterpreter().processMessages(messages)]
+
+    # ISDU request is interpreted while the channel is filtered out: the response is still complete
+    interpreter = MessageInterpreter(channels=[CommChannel.Page])
+    assert list(interpreter.processMessages(messages[:4])) == []
+    interpreter.channels = None
+    assert interpreter.channels == frozenset(CommChannel)
+    assert [result.data() for result in interpreter.processMessages(messages[4:])] == expected[1:]
+
+    interpreter.channels = [CommChannel.Process]
+    assert list(interpreter.processMessages(messages)) == []
+    interpreter.channels = [CommChannel.ISDU]
+    assert [result.data() for result in interpreter.processMessages(messages)] == expected
+
+
+def test_messageInterpreter_channelFilterErrors():
+    # write to event memory address 1 (unexpected): raised for a requested channel only
+    message = createMasterMessage(0x41, 0x00, 0, [0x00])
+    with pytest.raises(UnexpectedMasterMessageReceived):
+        MessageInterpreter().processMessage(message)
+    assert MessageInterpreter(channels=[CommChannel.ISDU]).processMessage(message) is None
@@ -0,0 +1,93 @@
+import copy
+import pickle
+
+import pytest
+
+from iolink_utils.octetDecoder._octetDecoderBase import OctetDecoderBase, DecodedOctet, ctypes
+from iolink_utils.octetDecoder.octetDecoder import MC, CKT, CKS, IService, EventQualifier, StatusCodeType2, \
+    DataStorage_StateProperty
+from iolink_utils.exceptions import InvalidOctetValue
+
+
+@pytest.mark.parametrize("decoderClass", [MC, CKT, CKS, IService, EventQualifier, StatusCodeType2,
+                                          DataStorage_StateProperty])
+def test_decodedOctet_sameFieldsAsDecoder(decoderClass):
+    fieldNames = [name for name, *_ in decoderClass._fields_]
+    for value in range(256):
+        decoded = decoderClass.decode(value)
+        decoder = decoderClass(value)
+        assert isinstance(decoded, DecodedOctet)
+        assert decoded.value == int(decoded) == decoded.get() == value
+        assert all(getattr(decoded, name) == getattr(decoder, name) for name in fieldNames)
+        assert type(getattr(decoded, fieldNames[0])) is int
+        assert decoded.valuesAsString() == decoder.valuesAsString()
+
+
+def test_decodedOctet_interned():
+    assert MC.decode(0x70) is MC.decode(0x70)
+    assert MC.decode(0x70) is not CKT.decode(0x70)
+    assert MC.decode(0x70).copy() is MC.decode(0x70)
+    assert copy.deepcopy(MC.decode(0x70)) is MC.decode(0x70)
+    assert pickle.loads(pickle.dumps(CKS.decode(0xC5))) is CKS.decode(0xC5)
+
+
+def test_decodedOctet_eq():
+    assert MC.decode(0x70) == MC(0x70) == 0x70
+    assert MC(0x70) == MC.decode(0x70)
+    assert MC.decode(0x70) != MC.decode(0x71)
+    assert MC.decode(0x70) != 0x71
+    assert MC.decode(0x70) != "0x70"
+    assert len({MC.decode(0x70), MC.decode(0x70), MC.decode(0x71)}) == 2
+
+
+@pytest.mark.parametrize("decoderClass", [MC, CKT, CKS, IService])
+def test_decodedOctet_sameOctetAsDecoder(decoderClass):
+    for value in range(256):
+        decoded, decoder = decoderClass.decode(value), decoderClass(value)
+        assert bytes(decoded) == bytes(decoder) == bytes((value,))
+        fieldValues = tuple(getattr(decoded, name) for name, *_ in decoderClass._fields_)
+        assert decoded != (value,) + fieldValues and decoded != (value,)
+        for function in (len, iter):  # an octet, not a sequence of fields
+            with pytest.raises(TypeError):
+                function(decoder)
+            with pytest.raises(TypeError):
+                function(decoded)
+
+
+def test_decodedOctet_immutable():
+    decoded = MC.decode(0x70)
+    with pytest.raises(AttributeError):
+        decoded.read = 1
+    with pytest.raises(AttributeError):
+        del decoded.read
+    with pytest.raises(AttributeError):
+        decoded.unknown = 1
+    assert MC.decode(0x70).read == 0
+
+
+def test_decodedOctet_methods():
+    assert CKT.decode(0b10110101).getWithoutChecksum() == 0b10000000
+    assert CKS.decode(0b11110101).getWithoutChecksum() == 0b11000000
+
+
+def test_decodedOctet_invalidValue():
+    for value in (-1, 256):
+        with pytest.raises(InvalidOctetValue):
+            MC.decode(value)
+
+
+def test_decodedOctet_customDecoder():
+    class MyOctet(OctetDecoderBase):
+        _fields_ = [
+            ("field_1", ctypes.c_uint8, 1),
+            ("unused", ctypes.c_uint8, 3),
+            ("field_2", ctypes.c_uint8, 4)
+        ]
+
+        def isSet(self) -> bool:
+            return self.field_1 == 1
+
+    decoded = MyOctet.decode(0b10001010)
+    assert (decoded.field_1, decoded.unused, decoded.field_2) == (1, 0, 0b1010)
+    assert decoded.valuesAsString() == "field_1=1, field_2=10"
+    assert decoded.isSet()
@@ -0,0 +1,90 @@
+import copy
+import pickle
+
+import pytest
+
+from iolink_utils.octetDecoder import octetDecoder, intOctetDecoder
+from iolink_utils.octetDecoder._octetDecoderBase import IntOctetDecoderBase, OctetDecoderBase, ctypes
+from iolink_utils.exceptions import InvalidOctetValue
+
+
+DECODER_NAMES = [name for name, attr in vars(octetDecoder).items()
+                 if isinstance(attr, type) and issubclass(attr, OctetDecoderBase) and attr is not OctetDecoderBase]
+
+
+def test_intOctetDecoder_allDecodersAvailable():
+    assert len(DECODER_NAMES) == 13
+    for name in DECODER_NAMES:
+        intClass = getattr(intOctetDecoder, name)
+        assert issubclass(intClass, IntOctetDecoderBase)
+        assert intClass.__name__ == name
+
+
+@pytest.mark.parametrize("name", DECODER_NAMES)
+def test_intOctetDecoder_sameAsCtypes(name):
+    ctypesClass, intClass = getattr(octetDecoder, name), getattr(intOctetDecoder, name)
+    for value in range(256):
+        ctypesOctet, intOctet = ctypesClass(value), intClass(value)
+        assert int(intOctet) == intOctet.get() == value
+        assert intOctet.valuesAsString() == ctypesOctet.valuesAsString()
+        assert intOctet == ctypesOctet and ctypesOctet == intOctet
+        assert bytes(intOctet) == bytes(ctypesOctet)
+
+        for fieldName, *_ in ctypesClass._fields_:  # setting a field changes the same bits
+            fieldValue = getattr(ctypesOctet, fieldName) ^ 0xFF
+            setattr(ctypesOctet, fieldName, fieldValue)
+            setattr(intOctet, fieldName, fieldValue)
+            assert int(intOctet) == int(ctypesOctet)
+
+
+def test_intOctetDecoder_api():
+    mc = intOctetDecoder.MC(read=1, channel=3, address=0x10)
+    assert int(mc) == 0xF0
+    assert (mc.read, mc.channel, mc.address) == (1, 3, 0x10)
+    assert mc == 0xF0 and mc != 0xF1 and mc != "0xF0"
+    assert hash(mc) == hash(intOctetDecoder.MC(0xF0))
+    assert intOctetDecoder.MC.from_buffer_copy(b'\x00\xF0', 1) == mc
+    assert intOctetDecoder.CKT(0xC5).getWithoutChecksum() == 0xC0
+
+    mc.set(0x01)
+    assert mc.address == 1
+    with pytest.raises(InvalidOctetValue):
+        mc.set(256)
+    with pytest.raises(InvalidOctetValue):
+        intOctetDecoder.MC(-1)
+    with pytest.raises(TypeError):
+        intOctetDecoder.MC(unknown=1)
+
+
+def test_intOctetDecoder_copy():
+    mc = intOctetDecoder.MC(0x70)
+    for copied in (mc.copy(), copy.copy(mc), copy.deepcopy(mc), pickle.loads(pickle.dumps(mc))):
+        assert copied is not mc
+        assert type(copied) is intOctetDecoder.MC
+        assert copied == mc
+        copied.address = 0
+        assert mc.address == 0x10
+
+
+def test_intOctetDecoder_decode():
+    decoded = intOctetDecoder.MC.decode(0x70)
+    assert decoded is intOctetDecoder.MC.decode(0x70)
+    assert decoded == intOctetDecoder.MC(0x70)
+    assert (decoded.read, decoded.channel, decoded.address) == (0, 3, 0x10)
+    assert intOctetDecoder.CKS.decode(0xC5).getWithoutChecksum() == 0xC0
+
+
+def test_intOctetDecoder_customDecoder():
+    class MyOctet(IntOctetDecoderBase):
+        __slots__ = ()
+        _fields_ = [
+            ("field_1", ctypes.c_uint8, 1),
+            ("field_2", ctypes.c_uint8, 2),
+            ("unused", ctypes.c_uint8, 1),
+            ("field_3", ctypes.c_uint8, 4)
+        ]
+
+    myOctet = MyOctet(0b10011111)
+    assert myOctet.valuesAsString() == "field_1=1, field_2=0, field_3=15"
+    myOctet.field_2 = 0b111  # cut off like a ctypes bitfield
+    assert int(myOctet) == 0b11111111
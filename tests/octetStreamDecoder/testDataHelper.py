@@ -1,5 +1,9 @@
 import csv
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+
+from iolink_utils.octetStreamDecoder._compressChecksum import lookup_8to6_compression
+from iolink_utils.octetStreamDecoder.octetStreamDecoderSettings import DecoderSettings, MSeqPayloadLength, TimestampMode
+from iolink_utils.definitions.bitRate import BitRate
 
 
 def convertToTestDataList(testDataAsString: str) -> []:
@@ -37,3 +41,64 @@ def getTestDataListFromFile(filename: str):
             })
 
     return data_list
+
+
+def createSettings(operate: MSeqPayloadLength = MSeqPayloadLength(pdOut=2, od=2, pdIn=4),
+                   transmissionRate: BitRate = BitRate.COM3,
+                   timestampMode: TimestampMode = TimestampMode.Nanoseconds) -> DecoderSettings:
+    """Decoder settings for captures created by createCapture (default timing fits COM3)."""
+    return DecoderSettings(
+        transmissionRate=transmissionRate,
+        startup=MSeqPayloadLength(pdOut=0, od=1, pdIn=0),
+        preoperate=MSeqPayloadLength(pdOut=0, od=8, pdIn=0),
+        operate=operate,
+        timestampMode=timestampMode
+    )
+
+
+def toNanoseconds(timestamp: datetime) -> int:
+    return (timestamp - datetime(1970, 1, 1, tzinfo=timezone.utc)) // timedelta(microseconds=1) * 1000
+
+
+def _compressedChecksum(octets) -> int:
+    checksum = 0x52
+    for octet in octets:
+        checksum ^= octet
+    return lookup_8to6_compression[checksum]
+
+
+def createMasterFrame(mc: int, mSeqType: int, pdOut: bytes = b'', od: bytes = b'') -> bytes:
+    ckt = mSeqType << 6
+    return bytes([mc, ckt | _compressedChecksum(bytes([mc, ckt]) + pdOut + od)]) + pdOut + od
+
+
+def createDeviceFrame(od: bytes = b'', pdIn: bytes = b'', eventFlag: int = 0, pdValid: int = 0) -> bytes:
+    cks = (eventFlag << 7) | (pdValid << 6)
+    return od + pdIn + bytes([cks | _compressedChecksum(od + pdIn + bytes([cks]))])
+
+
+def createCapture(mSequences, octetTime: int = 47_740, masterGap: int = 1_000, responseTime: int = 20_000,
+                  deviceGap: int = 5_000, cycleTime: int = 1_000_000, startTime: int = 1_000_000_000):
+    """
+    Creates octet values and integer (nanosecond) start/end times for a list of (master frame, device frame).
+    Default timing fits COM3 (a cycle time of 0 places the M-sequences directly after each other).
+    """
+    values, startTimes, endTimes = [], [], []
+    time = startTime
+    for masterFrame, deviceFrame in mSequences:
+        cycleStart = time
+        for num, octet in enumerate(masterFrame):
+            time += masterGap if num > 0 else 0
+            values.append(octet)
+            startTimes.append(time)
+            time += octetTime
+            endTimes.append(time)
+        time += responseTime
+        for num, octet in enumerate(deviceFrame):
+            time += deviceGap if num > 0 else 0
+            values.append(octet)
+            startTimes.append(time)
+            time += octetTime
+            endTimes.append(time)
+        time = max(time + responseTime, cycleStart + cycleTime)
+    return values, startTimes, endTimes
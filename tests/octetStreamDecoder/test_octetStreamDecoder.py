@@ -1,5 +1,9 @@
+import pytest
+from datetime import timedelta
+
+from iolink_utils.exceptions import InvalidMSeqCode
 from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder, DecoderSettings, DecodingState
-from iolink_utils.octetStreamDecoder.octetStreamDecoderSettings import MSeqPayloadLength
+from iolink_utils.octetStreamDecoder.octetStreamDecoderSettings import MSeqPayloadLength, TimestampMode
 from iolink_utils.octetStreamDecoder.octetStreamDecoderMessages import Message, MasterMessage, DeviceMessage
 from iolink_utils.definitions.bitRate import BitRate
 from iolink_utils.definitions.transmissionDirection import TransmissionDirection
@@ -7,7 +11,8 @@ from iolink_utils.definitions.communicationChannel import CommChannel
 from iolink_utils.definitions.mSequenceType import MSeqType
 from iolink_utils.definitions.masterCommand import MasterCommand
 
-from .testDataHelper import convertToTestDataList
+from .testDataHelper import convertToTestDataList, toNanoseconds, createSettings, createMasterFrame, \
+    createDeviceFrame, createCapture
 
 
 def test_octetStreamDecoder_ctor():
@@ -321,3 +326,196 @@ def test_octetStreamDecoder_MSequence_operate():
 
     assert len(message.pdIn) == decoder._settings.operate.pdIn
     assert len(message.od) == 0 # when writing
+
+
+def _createStartupToPreoperateSettingsAndData():
+    settings: DecoderSettings = DecoderSettings()
+    settings.transmissionRate = BitRate.COM2
+    settings.startup = MSeqPayloadLength(pdOut=0, od=1, pdIn=0)
+    settings.preoperate = MSeqPayloadLength(pdOut=0, od=8, pdIn=0)
+    settings.operate = MSeqPayloadLength(pdOut=7, od=2, pdIn=10)
+
+    testData = convertToTestDataList(
+        """
+        32, , 2050-01-01 00:01:02.166137+00:00, 2050-01-01 00:01:02.166410+00:00, data
+        54, , 2050-01-01 00:01:02.166424+00:00, 2050-01-01 00:01:02.166698+00:00, data
+        154, , 2050-01-01 00:01:02.166711+00:00, 2050-01-01 00:01:02.166985+00:00, data
+        45, , 2050-01-01 00:01:02.167081+00:00, 2050-01-01 00:01:02.167354+00:00, data
+        241, , 2050-01-01 00:01:02.169004+00:00, 2050-01-01 00:01:02.169278+00:00, data
+        100, , 2050-01-01 00:01:02.169291+00:00, 2050-01-01 00:01:02.169564+00:00, data
+        0, , 2050-01-01 00:01:02.169667+00:00, 2050-01-01 00:01:02.169941+00:00, data
+        0, , 2050-01-01 00:01:02.169954+00:00, 2050-01-01 00:01:02.170228+00:00, data
+        0, , 2050-01-01 00:01:02.170240+00:00, 2050-01-01 00:01:02.170514+00:00, data
+        0, , 2050-01-01 00:01:02.170527+00:00, 2050-01-01 00:01:02.170800+00:00, data
+        0, , 2050-01-01 00:01:02.170814+00:00, 2050-01-01 00:01:02.171087+00:00, data
+        0, , 2050-01-01 00:01:02.171100+00:00, 2050-01-01 00:01:02.171373+00:00, data
+        0, , 2050-01-01 00:01:02.171386+00:00, 2050-01-01 00:01:02.171660+00:00, data
+        0, , 2050-01-01 00:01:02.171673+00:00, 2050-01-01 00:01:02.171946+00:00, data
+        133, , 2050-01-01 00:01:02.171959+00:00, 2050-01-01 00:01:02.172233+00:00, data
+        """)
+    return settings, testData
+
+
+def _processOctetByOctet(decoder, testData):
+    messages = []
+    for octet in testData:
+        message = decoder.processOctet(octet['value'], octet['start'], octet['end'])
+        if message is not None:
+            messages.append(message)
+    return messages
+
+
+def _assertSameMessages(messages, expectedMessages):
+    assert [type(msg) for msg in messages] == [type(msg) for msg in expectedMessages]
+    for msg, expected in zip(messages, expectedMessages):
+        assert repr(msg) == repr(expected)
+        assert msg.isValid == expected.isValid
+        assert msg.startTime == expected.startTime
+        assert msg.endTime == expected.endTime
+
+
+def test_octetStreamDecoder_processOctets():
+    settings, testData = _createStartupToPreoperateSettingsAndData()
+    expectedMessages = _processOctetByOctet(OctetStreamDecoder(settings), testData)
+    assert len(expectedMessages) == 4
+
+    decoder = OctetStreamDecoder(settings)
+    messages = decoder.processOctets([octet['value'] for octet in testData],
+                                     [octet['start'] for octet in testData],
+                                     [octet['end'] for octet in testData])
+    _assertSameMessages(messages, expectedMessages)
+    assert decoder._state == DecodingState.Idle
+
+
+def test_octetStreamDecoder_processOctets_chunked():
+    settings, testData = _createStartupToPreoperateSettingsAndData()
+    expectedMessages = _processOctetByOctet(OctetStreamDecoder(settings), testData)
+
+    decoder = OctetStreamDecoder(settings)
+    messages = []
+    for chunkStart in range(0, len(testData), 4):  # chunk borders within messages
+        chunk = testData[chunkStart:chunkStart + 4]
+        messages.extend(decoder.processOctets(bytes(octet['value'] for octet in chunk),
+                                              [octet['start'] for octet in chunk],
+                                              [octet['end'] for octet in chunk]))
+    _assertSameMessages(messages, expectedMessages)
+
+
+def test_octetStreamDecoder_processOctets_bufferTypes():
+    from array import array
+
+    settings, testData = _createStartupToPreoperateSettingsAndData()
+    expectedMessages = _processOctetByOctet(OctetStreamDecoder(settings), testData)
+    values = [octet['value'] for octet in testData]
+    startTimes = [octet['start'] for octet in testData]
+    endTimes = [octet['end'] for octet in testData]
+
+    for buffer in (bytes(values), bytearray(values), memoryview(bytes(values)), array('B', values)):
+        messages = OctetStreamDecoder(settings).processOctets(buffer, startTimes, endTimes)
+        _assertSameMessages(messages, expectedMessages)
+
+
+def test_octetStreamDecoder_processOctets_numpy():
+    np = pytest.importorskip("numpy")
+
+    settings, testData = _createStartupToPreoperateSettingsAndData()
+    expectedMessages = _processOctetByOctet(OctetStreamDecoder(settings), testData)
+
+    values = np.array([octet['value'] for octet in testData], dtype=np.uint8)
+    messages = OctetStreamDecoder(settings).processOctets(values,
+                                                          [octet['start'] for octet in testData],
+                                                          [octet['end'] for octet in testData])
+    _assertSameMessages(messages, expectedMessages)
+
+
+@pytest.mark.parametrize("frameSegmentation", [True, False])
+@pytest.mark.parametrize("chunkSize", [0, 7])
+def test_octetStreamDecoder_processOctets_invalidMSeqType(frameSegmentation, chunkSize):
+    mSequence = (createMasterFrame(0x70, 2, pdOut=b'\x01\x02', od=b'\x10\x11'),
+                 createDeviceFrame(pdIn=b'\x0A\x0B\x0C\x0D'))
+    invalid = (createMasterFrame(0x70, 3, pdOut=b'\x01\x02', od=b'\x10\x11'), mSequence[1])  # M-sequence type 3
+    values, startTimes, endTimes = createCapture([mSequence] * 5 + [invalid] + [mSequence] * 3)
+
+    decoder = OctetStreamDecoder(createSettings())
+    decoder._useFrameSegmentation = decoder._useFrameSegmentation and frameSegmentation
+    chunkSize = chunkSize or len(values)
+    messages = []
+    for begin in range(0, len(values), chunkSize):  # no exception, the whole batch is decoded
+        end = begin + chunkSize
+        messages.extend(decoder.processOctets(values[begin:end], startTimes[begin:end], endTimes[begin:end]))
+
+    assert len(messages) == 5 * 2 + 1 + 3 * 2
+    assert all(msg.isValid for msg in messages[:10] + messages[11:])
+    assert [type(msg) for msg in messages[9:12]] == [DeviceMessage, MasterMessage, MasterMessage]
+
+    invalidMessage = messages[10]
+    assert not invalidMessage.isValid
+    assert (int(invalidMessage.mc), invalidMessage.ckt.mSeqType) == (0x70, 3)
+    frameBegin = 5 * len(invalid[0] + invalid[1])
+    assert (invalidMessage.startTime, invalidMessage.endTime) == (startTimes[frameBegin], endTimes[frameBegin + 1])
+    assert messages[11].startTime == startTimes[frameBegin + len(invalid[0] + invalid[1])]
+    assert decoder.skippedOctets == len(invalid[0] + invalid[1]) - 2
+    assert decoder._state == DecodingState.Idle
+
+    # octet by octet: the invalid M-sequence type is raised
+    decoder = OctetStreamDecoder(createSettings())
+    with pytest.raises(InvalidMSeqCode):
+        for octet in zip(values, startTimes, endTimes):
+            decoder.processOctet(*octet)
+
+
+def test_octetStreamDecoder_timestampMode_nanoseconds():
+    settings, testData = _createStartupToPreoperateSettingsAndData()
+    expectedMessages = _processOctetByOctet(OctetStreamDecoder(settings), testData)
+
+    settings.timestampMode = TimestampMode.Nanoseconds
+    decoder = OctetStreamDecoder(settings)
+    assert decoder._lastProcessedOctetEndTime == 0
+    assert decoder._timingConstraints[DecodingState.MasterMessage] == 26040
+
+    messages = decoder.processOctets([octet['value'] for octet in testData],
+                                     [toNanoseconds(octet['start']) for octet in testData],
+                                     [toNanoseconds(octet['end']) for octet in testData])
+
+    assert [repr(msg) for msg in messages] == [repr(msg) for msg in expectedMessages]
+    for msg, expected in zip(messages, expectedMessages):
+        assert isinstance(msg.startTime, int)
+        assert msg.startTime == toNanoseconds(expected.startTime)
+        assert msg.endTime == toNanoseconds(expected.endTime)
+
+
+def test_octetStreamDecoder_timestampMode_samples():
+    settings, testData = _createStartupToPreoperateSettingsAndData()
+    expectedMessages = _processOctetByOctet(OctetStreamDecoder(settings), testData)
+
+    settings.timestampMode = TimestampMode.Samples
+    settings.sampleRate = 1_000_000  # 1 sample per microsecond
+    firstTime = toNanoseconds(testData[0]['start'])
+
+    decoder = OctetStreamDecoder(settings)
+    messages = decoder.processOctets([octet['value'] for octet in testData],
+                                     [(toNanoseconds(octet['start']) - firstTime) // 1000 for octet in testData],
+                                     [(toNanoseconds(octet['end']) - firstTime) // 1000 for octet in testData])
+    assert [repr(msg) for msg in messages] == [repr(msg) for msg in expectedMessages]
+
+
+def test_octetStreamDecoder_timestampMode_gapResetsDecoding():
+    settings, testData = _createStartupToPreoperateSettingsAndData()
+    settings.timestampMode = TimestampMode.Nanoseconds
+    decoder = OctetStreamDecoder(settings)
+
+    # first octet of a master message followed by a gap > max frame transmission delay (26.04us)
+    decoder.processOctet(32, 1_000_000, 1_286_000)
+    assert decoder._state == DecodingState.MasterMessage
+    assert decoder.processOctet(54, 1_286_000 + 26_040, 1_600_000) is None  # gap too long -> restart
+    assert decoder._state == DecodingState.MasterMessage
+    assert decoder._messageDecoder._octetCount == 1
+
+
+def test_octetStreamDecoder_setSettings_updatesTimingConstraints():
+    decoder = OctetStreamDecoder(DecoderSettings(transmissionRate=BitRate.COM3))
+    assert decoder._timingConstraints[DecodingState.DeviceMessage] == timedelta(microseconds=3 * 4.34)
+
+    decoder.setSettings(DecoderSettings(transmissionRate=BitRate.COM1, timestampMode=TimestampMode.Nanoseconds))
+    assert decoder._timingConstraints[DecodingState.DeviceMessage] == 624990
+    assert decoder._lastProcessedOctetEndTime == 0
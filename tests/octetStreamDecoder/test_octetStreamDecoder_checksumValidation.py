@@ -0,0 +1,57 @@
+import pytest
+
+from iolink_utils.octetStreamDecoder import checksumValidation
+from iolink_utils.octetStreamDecoder.checksumValidation import validateMasterChecksums, validateDeviceChecksums
+
+from .testDataHelper import createMasterFrame, createDeviceFrame
+
+
+def createFrames():
+    masterFrames = [createMasterFrame(0xA2, 0), createMasterFrame(0x20, 0, od=b'\x9A'),
+                    createMasterFrame(0x70, 2, pdOut=b'\x01\x02', od=b'\x10\x11')]
+    deviceFrames = [createDeviceFrame(od=b'\x49'), createDeviceFrame(),
+                    createDeviceFrame(od=b'\xD3\x00', pdIn=b'\x01\x02\x03\x04', eventFlag=1, pdValid=1)]
+
+    values = bytearray()
+    masterBounds, deviceBounds = [], []
+    for masterFrame, deviceFrame in zip(masterFrames, deviceFrames):
+        masterBounds.append((len(values), len(values) + len(masterFrame)))
+        values += masterFrame
+        deviceBounds.append((len(values), len(values) + len(deviceFrame)))
+        values += deviceFrame
+    return values, masterBounds, deviceBounds
+
+
+@pytest.fixture(params=[True, False], ids=['numpy', 'python'])
+def useNumpy(request, monkeypatch):
+    if request.param:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(checksumValidation, 'np', None)
+    return request.param
+
+
+def test_checksumValidation_valid(useNumpy):
+    values, masterBounds, deviceBounds = createFrames()
+
+    assert validateMasterChecksums(values, *zip(*masterBounds)) == [True, True, True]
+    assert validateDeviceChecksums(values, *zip(*deviceBounds)) == [True, True, True]
+    assert validateMasterChecksums(values, [], []) == []
+
+
+def test_checksumValidation_invalid(useNumpy):
+    values, masterBounds, deviceBounds = createFrames()
+    values[masterBounds[1][0] + 2] ^= 0x01  # od of 2nd master frame
+    values[masterBounds[2][0] + 1] ^= 0x01  # checksum bits of 3rd master frame
+    values[deviceBounds[2][1] - 1] ^= 0x80  # event flag of last device frame (part of checksum)
+
+    assert validateMasterChecksums(list(values), *zip(*masterBounds)) == [True, False, False]
+    assert validateDeviceChecksums(bytes(values), *zip(*deviceBounds)) == [True, True, False]
+
+
+def test_checksumValidation_numpyInput():
+    np = pytest.importorskip("numpy")
+    values, masterBounds, deviceBounds = createFrames()
+    assert validateDeviceChecksums(np.frombuffer(bytes(values), dtype=np.uint8),
+                                   np.array([begin for begin, _ in deviceBounds]),
+                                   np.array([end for _, end in deviceBounds])) == [True, True, True]
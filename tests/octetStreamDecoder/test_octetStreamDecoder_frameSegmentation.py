@@ -0,0 +1,130 @@
+import pytest
+
+from iolink_utils.exceptions import IOLinkUtilsException
+from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder, DecodingState
+
+from .testDataHelper import createSettings, createMasterFrame, createDeviceFrame, createCapture
+
+np = pytest.importorskip("numpy")
+
+from iolink_utils.octetStreamDecoder.frameSegmentation import (  # noqa: E402
+    calculateGaps, segmentFrames, isFrameSegmentationAvailable)
+
+
+def createMSequences():
+    return [
+        (createMasterFrame(0xA2, 0), createDeviceFrame(od=b'\x49')),  # startup: read page
+        (createMasterFrame(0x20, 0, od=b'\x9A'), createDeviceFrame()),  # startup: write MasterCommand
+        (createMasterFrame(0xF1, 1), createDeviceFrame(od=bytes(range(8)), eventFlag=1)),  # preoperate: read ISDU
+        (createMasterFrame(0x70, 2, pdOut=b'\x01\x02', od=b'\x10\x11'), createDeviceFrame(pdIn=b'\x0A\x0B\x0C\x0D')),
+        (createMasterFrame(0xE1, 2, pdOut=b'\x03\x04'), createDeviceFrame(od=b'\xD3\x00', pdIn=b'\x01\x02\x03\x04')),
+    ]
+
+
+def decode(values, startTimes, endTimes, useFrameSegmentation: bool, chunkSize: int = 0):
+    decoder = OctetStreamDecoder(createSettings())
+    decoder._useFrameSegmentation = useFrameSegmentation
+
+    chunkSize = chunkSize or len(values)
+    messages = []
+    for begin in range(0, len(values), chunkSize):
+        end = begin + chunkSize
+        messages.extend(decoder.processOctets(values[begin:end], startTimes[begin:end], endTimes[begin:end]))
+    return messages, decoder
+
+
+def assertSameResult(values, startTimes, endTimes, chunkSize: int = 0):
+    try:
+        expectedMessages, expectedDecoder = decode(values, startTimes, endTimes, False, chunkSize)
+    except IOLinkUtilsException as expectedException:  # e.g. invalid M-sequence type after a timing violation
+        with pytest.raises(type(expectedException)):
+            decode(values, startTimes, endTimes, True, chunkSize)
+        return []
+
+    messages, decoder = decode(values, startTimes, endTimes, True, chunkSize)
+
+    assert [type(msg) for msg in messages] == [type(msg) for msg in expectedMessages]
+    for msg, expected in zip(messages, expectedMessages):
+        assert repr(msg) == repr(expected)
+        assert msg.isValid == expected.isValid
+        assert (msg.startTime, msg.endTime) == (expected.startTime, expected.endTime)
+
+    assert decoder._state == expectedDecoder._state
+    assert decoder._lastProcessedOctetEndTime == expectedDecoder._lastProcessedOctetEndTime
+    assert decoder.skippedOctets == expectedDecoder.skippedOctets
+    return messages
+
+
+def test_frameSegmentation_isAvailable():
+    assert isFrameSegmentationAvailable()
+
+
+def test_frameSegmentation_calculateGaps():
+    gaps = calculateGaps([10, 20, 35], [15, 30, 40], 4)
+    assert gaps.tolist() == [6, 5, 5]
+    assert calculateGaps([], [], 0).tolist() == []
+
+
+def test_frameSegmentation_segmentFrames():
+    startTimes = [100, 111, 122, 150, 160]
+    endTimes = [110, 120, 130, 155, 170]
+    segmentation = segmentFrames(startTimes, endTimes, 0, maxMasterGap=2, maxResponseTime=15, maxDeviceGap=5)
+
+    # gaps: 100, 1, 2, 20, 5
+    assert segmentation.boundaries == [0, 3]
+    assert segmentation.masterGapViolations == [1, 1, 2, 3, 4]
+    assert segmentation.deviceGapViolations == [1, 1, 1, 2, 3]
+
+
+@pytest.mark.parametrize("cycleTime", [1_000_000, 0])
+def test_frameSegmentation_decodeSameAsOctetDecoding(cycleTime):
+    values, startTimes, endTimes = createCapture(createMSequences() * 3, cycleTime=cycleTime)
+
+    messages = assertSameResult(values, startTimes, endTimes)
+    assert len(messages) == 30
+    assert all(msg.isValid for msg in messages)
+
+    for chunkSize in (1, 3, 7, 16):
+        assertSameResult(values, startTimes, endTimes, chunkSize)
+
+
+def test_frameSegmentation_decodeWithNumpyInput():
+    values, startTimes, endTimes = createCapture(createMSequences())
+    expectedMessages = assertSameResult(values, startTimes, endTimes)
+
+    messages, _ = decode(np.array(values, dtype=np.uint8), np.array(startTimes, dtype=np.int64),
+                         np.array(endTimes, dtype=np.int64), True)
+    assert [repr(msg) for msg in messages] == [repr(msg) for msg in expectedMessages]
+
+
+def test_frameSegmentation_invalidChecksum():
+    values, startTimes, endTimes = createCapture(createMSequences())
+    values[4] ^= 0x01  # master message 2: od
+    values[-1] ^= 0x02  # last device message: cks
+
+    messages = assertSameResult(values, startTimes, endTimes)
+    assert [msg.isValid for msg in messages] == [True, True, False, True, True, True, True, True, True, False]
+
+
+@pytest.mark.parametrize("cycleTime", [1_000_000, 0])
+def test_frameSegmentation_timingViolations(cycleTime):
+    values, startTimes, endTimes = createCapture(createMSequences(), cycleTime=cycleTime)
+
+    for index, delay in ((1, 10_000), (7, 30_000), (12, 10_000), (20, 60_000)):
+        delayedStartTimes = list(startTimes)
+        delayedEndTimes = list(endTimes)
+        delayedStartTimes[index] += delay
+        delayedEndTimes[index] += delay
+
+        assertSameResult(values, delayedStartTimes, delayedEndTimes)
+        assertSameResult(values, delayedStartTimes, delayedEndTimes, 5)
+
+
+def test_frameSegmentation_incompleteMSequence():
+    values, startTimes, endTimes = createCapture(createMSequences())
+    del values[6], startTimes[6], endTimes[6]  # missing device octet in 3rd M-sequence
+
+    assertSameResult(values, startTimes, endTimes)
+
+    _, decoder = decode(values[:-3], startTimes[:-3], endTimes[:-3], True)
+    assert decoder._state == DecodingState.DeviceMessage
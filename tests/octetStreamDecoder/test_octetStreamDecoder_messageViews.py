@@ -0,0 +1,128 @@
+import array
+import pickle
+import tracemalloc
+
+import pytest
+
+from iolink_utils.messageInterpreter.messageInterpreter import MessageInterpreter
+from iolink_utils.octetStreamDecoder import octetStreamDecoder
+from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder
+from iolink_utils.octetStreamDecoder.octetStreamDecoderMessages import MasterMessage, DeviceMessage
+from iolink_utils.octetStreamDecoder.octetStreamDecoderSettings import TimestampMode
+from iolink_utils.octetStreamDecoder.messageViews import MasterMessageView, DeviceMessageView, asOctetBuffer
+
+from .testDataHelper import createSettings, createMasterFrame, createDeviceFrame, createCapture
+
+np = pytest.importorskip("numpy")  # message views are created by the frame segmentation (numpy) path
+
+
+def createMSequences():
+    return [
+        (createMasterFrame(0xA2, 0), createDeviceFrame(od=b'\x49')),
+        (createMasterFrame(0x20, 0, od=b'\x9A'), createDeviceFrame()),
+        (createMasterFrame(0xF1, 1), createDeviceFrame(od=bytes(range(8)), eventFlag=1)),
+        (createMasterFrame(0x70, 2, pdOut=b'\x01\x02', od=b'\x10\x11'), createDeviceFrame(pdIn=b'\x0A\x0B\x0C\x0D')),
+        (createMasterFrame(0xE1, 2, pdOut=b'\x03\x04'), createDeviceFrame(od=b'\xD3\x00', pdIn=b'\x01\x02\x03\x04')),
+    ]
+
+
+def decode(values, startTimes, endTimes, messageViews: bool):
+    return OctetStreamDecoder(createSettings(), messageViews=messageViews).processOctets(values, startTimes, endTimes)
+
+
+def assertSameMessages(messages, expected):
+    assert len(messages) == len(expected)
+    for msg, exp in zip(messages, expected):
+        assert repr(msg) == repr(exp)
+        assert (msg.startTime, msg.endTime, msg.isValid) == (exp.startTime, exp.endTime, exp.isValid)
+        assert bytes(msg.od) == bytes(exp.od)
+        if isinstance(exp, MasterMessage):
+            assert (msg.mc, msg.ckt, bytes(msg.pdOut)) == (exp.mc, exp.ckt, bytes(exp.pdOut))
+            assert msg.channel() == exp.channel()
+        else:
+            assert (msg.cks, bytes(msg.pdIn)) == (exp.cks, bytes(exp.pdIn))
+
+
+@pytest.mark.parametrize("bufferType", [bytes, bytearray, lambda v: array.array('B', v), lambda v: np.array(v, np.uint8)])
+def test_messageViews_sameAsMessages(bufferType):
+    values, startTimes, endTimes = createCapture(createMSequences() * 2)
+    values[4] ^= 0x01  # invalid master message
+    values[-1] ^= 0x02  # invalid device message
+    expected = decode(values, startTimes, endTimes, False)
+
+    messages = decode(bufferType(values), startTimes, endTimes, True)
+    assert all(isinstance(msg, (MasterMessageView, DeviceMessageView)) for msg in messages)
+    assert [isinstance(msg, MasterMessage) for msg in messages] == [isinstance(msg, MasterMessage) for msg in expected]
+    assert [isinstance(msg, DeviceMessage) for msg in messages] == [isinstance(msg, DeviceMessage) for msg in expected]
+    assertSameMessages(messages, expected)
+    assert [msg.isValid for msg in messages].count(False) == 2
+
+
+def test_messageViews_noBuffer():
+    values, startTimes, endTimes = createCapture(createMSequences())
+    messages = decode(values, startTimes, endTimes, True)  # list of ints -> regular messages
+    assert not any(isinstance(msg, (MasterMessageView, DeviceMessageView)) for msg in messages)
+
+
+def test_messageViews_notAvailable(monkeypatch):
+    values, startTimes, endTimes = createCapture(createMSequences())
+    expected = decode(values, startTimes, endTimes, False)
+
+    settings = createSettings()
+    settings.timestampMode = TimestampMode.DateTime
+    with pytest.warns(RuntimeWarning, match="messageViews"):
+        OctetStreamDecoder(settings, messageViews=True)
+    with pytest.warns(RuntimeWarning, match="messageViews"):
+        OctetStreamDecoder(createSettings(), messageViews=True).setSettings(settings)
+
+    # without numpy (frame segmentation not available): regular messages
+    monkeypatch.setattr(octetStreamDecoder, 'isFrameSegmentationAvailable', lambda: False)
+    with pytest.warns(RuntimeWarning, match="messageViews"):
+        decoder = OctetStreamDecoder(createSettings(), messageViews=True)
+    messages = decoder.processOctets(bytes(values), startTimes, endTimes)
+    assert not any(isinstance(msg, (MasterMessageView, DeviceMessageView)) for msg in messages)
+    assertSameMessages(messages, expected)
+
+
+def test_messageViews_asOctetBuffer():
+    assert asOctetBuffer([1, 2]) is None
+    assert asOctetBuffer(array.array('H', [1, 2])) is None
+    assert asOctetBuffer(b'\x01\x02').tolist() == [1, 2]
+
+    records = np.zeros(3, dtype=[('value', 'u1'), ('time', '<i8')])
+    records['value'] = [1, 2, 3]
+    assert asOctetBuffer(records['value']).tolist() == [1, 2, 3]  # strided -> copied once
+
+
+def test_messageViews_interpreterAndPickle():
+    values, startTimes, endTimes = createCapture(createMSequences()[:2] * 2)  # page channel
+    expected = decode(values, startTimes, endTimes, False)
+    messages = decode(bytes(values), startTimes, endTimes, True)
+
+    interpreter, expectedInterpreter = MessageInterpreter(), MessageInterpreter()
+    results = [interpreter.processMessage(msg) for msg in messages]
+    expectedResults = [expectedInterpreter.processMessage(msg) for msg in expected]
+    assert [result.data() if result else None for result in results] == \
+        [result.data() if result else None for result in expectedResults]
+    assert results.count(None) == 4
+
+    copies = pickle.loads(pickle.dumps(messages))
+    assert [type(msg) for msg in copies] == [type(msg) for msg in expected]
+    assertSameMessages(copies, expected)
+
+
+def test_messageViews_memory():
+    values, startTimes, endTimes = createCapture(createMSequences() * 200)
+    buffer = bytes(values)
+
+    def retainedMemory(messageViews: bool) -> int:
+        tracemalloc.start()
+        messages = decode(buffer, startTimes, endTimes, messageViews)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        assert len(messages) == 2000
+        return size
+
+    # messages share interned MC/CKT/CKS (OctetDecoderBase.decode), views additionally share the octets,
+    # offsets and timestamps (MessageViewFrames): less than half the memory
+    assert retainedMemory(True) * 2 < retainedMemory(False)
@@ -1,5 +1,11 @@
+import pytest
+
+from iolink_utils.octetDecoder.intOctetDecoder import MC, CKS
+from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder
 from iolink_utils.octetStreamDecoder.octetStreamDecoderMessages import MasterMessage, DeviceMessage
 
+from .testDataHelper import createSettings, createMasterFrame, createDeviceFrame, createCapture
+
 
 def test_octetStreamDecoderMessages_dispatch():
     class MasterMessageHandler:
@@ -15,3 +21,45 @@ def test_octetStreamDecoderMessages_dispatch():
 
     assert MasterMessage().dispatch(mstHandler) == True
     assert DeviceMessage().dispatch(mstHandler) == False
+
+
+def test_octetStreamDecoderMessages_slots():
+    for message in (MasterMessage(), DeviceMessage()):
+        assert not hasattr(message, '__dict__')
+        with pytest.raises(AttributeError):
+            message.unknownAttribute = 0
+
+
+def test_octetStreamDecoderMessages_decodedAndCreatedOctets():
+    values, startTimes, endTimes = createCapture([(createMasterFrame(0xA3, 0), createDeviceFrame(od=b'\x49'))])
+    decodedMaster, decodedDevice = OctetStreamDecoder(createSettings()).processOctets(values, startTimes, endTimes)
+
+    master, device = MasterMessage(), DeviceMessage()
+    master.mc.set(0xA3)
+    master.ckt.set(int(decodedMaster.ckt))
+    device.cks.set(int(decodedDevice.cks))
+
+    # same read API
+    assert (master.mc, master.ckt, device.cks) == (decodedMaster.mc, decodedMaster.ckt, decodedDevice.cks)
+    assert (master.mc.read, master.mc.channel, master.mc.address) == \
+        (decodedMaster.mc.read, decodedMaster.mc.channel, decodedMaster.mc.address) == (1, 1, 3)
+    assert master.mc.valuesAsString() == decodedMaster.mc.valuesAsString()
+    assert master.channel() == decodedMaster.channel()
+
+    # created messages: mutable octets
+    master.mc.address = 4
+    device.cks.eventFlag = 1
+    assert (int(master.mc), device.cks.eventFlag) == (0xA4, 1)
+
+    # decoded messages: immutable (interned) octets, replace them instead
+    with pytest.raises(AttributeError, match="immutable"):
+        decodedMaster.mc.address = 4
+    with pytest.raises(AttributeError, match="immutable"):
+        decodedDevice.cks.eventFlag = 1
+    assert MC.decode(0xA3).address == 3
+
+    decodedMaster.mc = MC(int(decodedMaster.mc))
+    decodedMaster.mc.address = 4
+    decodedDevice.cks = CKS(int(decodedDevice.cks))
+    decodedDevice.cks.eventFlag = 1
+    assert (decodedMaster.mc, decodedDevice.cks) == (master.mc, device.cks)
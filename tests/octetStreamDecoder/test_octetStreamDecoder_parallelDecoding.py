@@ -0,0 +1,91 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+
+from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder
+from iolink_utils.octetStreamDecoder.octetStreamDecoderSettings import TimestampMode
+from iolink_utils.octetStreamDecoder.parallelDecoding import decodeParallel, findSplitPoints, getSplitGap
+from iolink_utils.definitions.bitRate import BitRate
+from iolink_utils.definitions.timing import getMaxResponseTime
+
+from .testDataHelper import createSettings, createMasterFrame, createDeviceFrame, createCapture
+
+
+def createMSequences():
+    return [
+        (createMasterFrame(0xA2, 0), createDeviceFrame(od=b'\x49')),
+        (createMasterFrame(0xF1, 1), createDeviceFrame(od=bytes(range(8)), eventFlag=1)),
+        (createMasterFrame(0x70, 2, pdOut=b'\x01\x02', od=b'\x10\x11'), createDeviceFrame(pdIn=b'\x0A\x0B\x0C\x0D')),
+    ]
+
+
+def assertSameMessages(messages, expected):
+    assert [repr(msg) for msg in messages] == [repr(msg) for msg in expected]
+    assert [(msg.startTime, msg.endTime, msg.isValid) for msg in messages] == \
+        [(msg.startTime, msg.endTime, msg.isValid) for msg in expected]
+
+
+def test_parallelDecoding_findSplitPoints():
+    startTimes = [100, 111, 122, 150, 160]
+    endTimes = [110, 120, 130, 155, 170]
+
+    assert findSplitPoints(startTimes, endTimes, 5) == [3, 4]
+    assert findSplitPoints(startTimes, endTimes, 20) == [3]
+    assert findSplitPoints(startTimes[:1], endTimes[:1], 5) == []
+
+    toDateTime = [datetime(2050, 1, 1) + timedelta(microseconds=time) for time in range(5)]
+    assert findSplitPoints(toDateTime, toDateTime, timedelta(microseconds=1)) == [1, 2, 3, 4]
+
+
+def test_parallelDecoding_splitGap():
+    assert getSplitGap(createSettings()) == createSettings().getTimingThreshold(getMaxResponseTime(BitRate.COM3))
+
+
+@pytest.mark.parametrize("minChunkSize", [1, 10, 50, 1000])
+def test_parallelDecoding_sameAsSequential(minChunkSize):
+    values, startTimes, endTimes = createCapture(createMSequences() * 10)
+    values[25] ^= 0x01  # checksum error
+
+    expected = OctetStreamDecoder(createSettings()).processOctets(values, startTimes, endTimes)
+    assert len(expected) == 60
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        messages = decodeParallel(createSettings(), values, startTimes, endTimes,
+                                  minChunkSize=minChunkSize, executor=executor)
+    assertSameMessages(messages, expected)
+
+
+def test_parallelDecoding_processPool():
+    np = pytest.importorskip("numpy")
+    values, startTimes, endTimes = createCapture(createMSequences() * 20)
+    expected = OctetStreamDecoder(createSettings()).processOctets(values, startTimes, endTimes)
+
+    messages = decodeParallel(createSettings(), np.array(values, dtype=np.uint8), np.array(startTimes, dtype=np.int64),
+                              np.array(endTimes, dtype=np.int64), maxWorkers=2, minChunkSize=100)
+    assertSameMessages(messages, expected)
+
+
+def test_parallelDecoding_dateTime():
+    values, startTimes, endTimes = createCapture(createMSequences() * 4)
+    toDateTime = [datetime(2050, 1, 1) + timedelta(microseconds=time // 1000) for time in startTimes + endTimes]
+    startTimes, endTimes = toDateTime[:len(values)], toDateTime[len(values):]
+
+    settings = createSettings(timestampMode=TimestampMode.DateTime)
+    expected = OctetStreamDecoder(settings).processOctets(values, startTimes, endTimes)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        messages = decodeParallel(settings, values, startTimes, endTimes, minChunkSize=20, executor=executor)
+    assertSameMessages(messages, expected)
+
+
+def test_parallelDecoding_decodingError():
+    values, startTimes, endTimes = createCapture(createMSequences() * 10)
+    values[5 * 26 + 1] |= 0xC0  # invalid M-sequence type (CKT of 16th M-sequence)
+
+    expected = OctetStreamDecoder(createSettings()).processOctets(values, startTimes, endTimes)
+    assert [msg.isValid for msg in expected].count(False) == 1  # invalid master message, device message skipped
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        messages = decodeParallel(createSettings(), values, startTimes, endTimes, minChunkSize=10, executor=executor)
+    assertSameMessages(messages, expected)
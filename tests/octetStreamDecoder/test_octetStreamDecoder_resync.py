@@ -0,0 +1,131 @@
+import pytest
+
+from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder
+
+from .testDataHelper import createSettings, createMasterFrame, createDeviceFrame, createCapture
+
+
+def createMSequences():
+    return [
+        (createMasterFrame(0xA2, 0), createDeviceFrame(od=b'\x49')),
+        (createMasterFrame(0x20, 0, od=b'\x9A'), createDeviceFrame()),
+        (createMasterFrame(0x70, 2, pdOut=b'\x01\x02', od=b'\x10\x11'), createDeviceFrame(pdIn=b'\x0A\x0B\x0C\x0D')),
+    ]
+
+
+def createDecoder(frameSegmentation: bool, **kwargs) -> OctetStreamDecoder:
+    decoder = OctetStreamDecoder(createSettings(), resync=True, **kwargs)
+    decoder._useFrameSegmentation = decoder._useFrameSegmentation and frameSegmentation
+    return decoder
+
+
+def messageData(messages):
+    return [(type(msg).__name__, repr(msg), msg.isValid) for msg in messages]
+
+
+@pytest.mark.parametrize("frameSegmentation", [True, False])
+def test_resync_noiseBeforeMasterFrame(frameSegmentation):
+    mSequences = createMSequences()
+    expected = OctetStreamDecoder(createSettings()).processOctets(*createCapture(mSequences))
+
+    noisy = [(b'\x00' + mSequences[1][0], mSequences[1][1])] + mSequences  # noise octet within master timing
+    values, startTimes, endTimes = createCapture(noisy)
+    withoutResync = OctetStreamDecoder(createSettings()).processOctets(values, startTimes, endTimes)
+    assert not withoutResync[0].isValid
+
+    decoder = createDecoder(frameSegmentation)
+    messages = decoder.processOctets(values, startTimes, endTimes)
+    assert messageData(messages) == messageData(expected[2:3] + expected[3:4] + expected)
+    assert all(msg.isValid for msg in messages)
+    assert messages[0].startTime == startTimes[1]
+    assert decoder.skippedOctets == 1
+
+
+@pytest.mark.parametrize("frameSegmentation", [True, False])
+def test_resync_invalidMSeqType(frameSegmentation):
+    mSequences = createMSequences()
+    expected = OctetStreamDecoder(createSettings()).processOctets(*createCapture(mSequences))
+
+    # noise with M-sequence type 3 (CKT 0xFF) within master timing
+    noisy = [(b'\x00\xff' + mSequences[1][0], mSequences[1][1])] + mSequences
+    values, startTimes, endTimes = createCapture(noisy)
+    withoutResync = OctetStreamDecoder(createSettings()).processOctets(values, startTimes, endTimes)
+    assert not withoutResync[0].isValid and withoutResync[0].ckt.mSeqType == 3
+    assert messageData(withoutResync[1:]) == messageData(expected)
+
+    decoder = createDecoder(frameSegmentation)
+    messages = decoder.processOctets(values, startTimes, endTimes)
+    assert messageData(messages) == messageData(expected[2:4] + expected)
+    assert messages[0].startTime == startTimes[2]
+    assert decoder.skippedOctets == 2
+
+    decoder = createDecoder(frameSegmentation)
+    messages = [decoder.processOctet(*octet) for octet in zip(values, startTimes, endTimes)]
+    messages = [msg for msg in messages if msg is not None]
+    assert messageData(messages) == messageData(expected[2:4] + expected)
+    assert decoder.skippedOctets == 2
+
+
+@pytest.mark.parametrize("frameSegmentation", [True, False])
+def test_resync_lookaheadExceeded(frameSegmentation):
+    mSequences = createMSequences()
+    expected = OctetStreamDecoder(createSettings()).processOctets(*createCapture(mSequences))
+
+    noisy = [(b'\x00\x00\x00' + mSequences[1][0], mSequences[1][1])] + mSequences
+    values, startTimes, endTimes = createCapture(noisy)
+
+    decoder = createDecoder(frameSegmentation, maxResyncLookahead=2)
+    messages = decoder.processOctets(values, startTimes, endTimes)
+    assert messageData(messages) == messageData(expected)  # first M-sequence is discarded
+    assert decoder.skippedOctets == len(noisy[0][0]) + len(noisy[0][1])
+
+    decoder = createDecoder(frameSegmentation, maxResyncLookahead=3)
+    assert messageData(decoder.processOctets(values, startTimes, endTimes)) == \
+        messageData(expected[2:4] + expected)
+    assert decoder.skippedOctets == 3
+
+
+def test_resync_chunked():
+    mSequences = createMSequences()
+    noisy = [(b'\x00\x00' + mSequences[1][0], mSequences[1][1]), mSequences[0],
+             (b'\x00\x80' + mSequences[2][0], mSequences[2][1])] + mSequences
+    values, startTimes, endTimes = createCapture(noisy)
+
+    decoder = createDecoder(True)
+    expected = decoder.processOctets(values, startTimes, endTimes)
+    assert len(expected) == 2 * len(noisy) and all(msg.isValid for msg in expected)
+    assert decoder.skippedOctets == 4
+
+    for chunkSize in (1, 2, 5, 7):
+        decoder = createDecoder(True)
+        messages = []
+        for begin in range(0, len(values), chunkSize):
+            end = begin + chunkSize
+            messages += decoder.processOctets(values[begin:end], startTimes[begin:end], endTimes[begin:end])
+        assert messageData(messages) == messageData(expected)
+        assert decoder.skippedOctets == 4
+
+
+@pytest.mark.parametrize("frameSegmentation", [True, False])
+def test_resync_incompleteMasterFrame(frameSegmentation):
+    mSequences = createMSequences()
+    expected = OctetStreamDecoder(createSettings()).processOctets(*createCapture(mSequences))
+
+    # 0x7F 0x70: M-sequence type 1 (10 octets) -> master frame is cut by the response delay
+    noisy = [(b'\x7F' + mSequences[2][0], mSequences[2][1])] + mSequences
+    values, startTimes, endTimes = createCapture(noisy)
+
+    decoder = createDecoder(frameSegmentation)
+    assert messageData(decoder.processOctets(values, startTimes, endTimes)) == messageData(expected)
+    assert decoder.skippedOctets == len(noisy[0][0]) + len(noisy[0][1])
+
+
+def test_resync_validCaptureUnchanged():
+    values, startTimes, endTimes = createCapture(createMSequences() * 3)
+    values[-1] ^= 0x02  # invalid device message is still returned
+
+    expected = OctetStreamDecoder(createSettings()).processOctets(values, startTimes, endTimes)
+    for frameSegmentation in (True, False):
+        decoder = createDecoder(frameSegmentation)
+        assert messageData(decoder.processOctets(values, startTimes, endTimes)) == messageData(expected)
+        assert decoder.skippedOctets == 0
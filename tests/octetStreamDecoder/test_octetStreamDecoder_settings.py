@@ -1,8 +1,11 @@
 import pytest
+from datetime import datetime, timedelta
 
-from iolink_utils.exceptions import InvalidMSeqCode
-from iolink_utils.octetStreamDecoder.octetStreamDecoderSettings import MSeqPayloadLength, DecoderSettings
+from iolink_utils.exceptions import InvalidMSeqCode, InvalidSampleRate
+from iolink_utils.octetStreamDecoder.octetStreamDecoderSettings import MSeqPayloadLength, DecoderSettings, TimestampMode, \
+    FramePlan, getFramePlanIndex
 from iolink_utils.definitions.bitRate import BitRate
+from iolink_utils.definitions.timing import getMaxMSequenceTime
 
 
 def test_octetDecoder_settings():
@@ -58,3 +61,52 @@ def test_octetDecoder_settingsFromIodd():
     assert settings.operate.pdOut == 2
     assert settings.operate.od == 4
     assert settings.operate.pdIn == 5
+
+
+def test_octetDecoder_settingsTimingThreshold():
+    settings = DecoderSettings()
+    assert settings.timestampMode == TimestampMode.DateTime
+    assert settings.getTimestampOrigin() == datetime(1970, 1, 1)
+    assert settings.getTimingThreshold(4.34) == timedelta(microseconds=4.34)
+
+    settings.timestampMode = TimestampMode.Nanoseconds
+    assert settings.getTimestampOrigin() == 0
+    assert settings.getTimingThreshold(0) == 0
+    assert settings.getTimingThreshold(4.34) == 4340
+    assert settings.getTimingThreshold(43.4) == 43400
+    assert settings.getTimingThreshold(0.0005) == 1  # rounded up
+
+    settings.timestampMode = TimestampMode.Samples
+    with pytest.raises(InvalidSampleRate):
+        settings.getTimingThreshold(4.34)
+
+    settings.sampleRate = 10_000_000  # 10MHz -> 100ns per sample
+    assert settings.getTimestampOrigin() == 0
+    assert settings.getTimingThreshold(4.34) == 44  # 43.4 samples
+    assert settings.getTimingThreshold(26.0) == 260
+
+
+def test_octetDecoder_settingsFramePlans():
+    settings = DecoderSettings(
+        startup=MSeqPayloadLength(pdOut=0, od=1, pdIn=0),
+        preoperate=MSeqPayloadLength(pdOut=0, od=8, pdIn=0),
+        operate=MSeqPayloadLength(pdOut=2, od=3, pdIn=4)
+    )
+    framePlans = settings.compileFramePlans()
+    assert len(framePlans) == 8
+    assert framePlans[getFramePlanIndex(3, 0)] is None
+    assert framePlans[getFramePlanIndex(3, 1)] is None
+
+    assert framePlans[getFramePlanIndex(0, 1)] == FramePlan(0, 0, 1, 0, 2, 2, None)  # read
+    assert framePlans[getFramePlanIndex(0, 0)] == FramePlan(0, 1, 0, 0, 3, 1, None)  # write
+    assert framePlans[getFramePlanIndex(1, 1)] == FramePlan(0, 0, 8, 0, 2, 9, None)
+    assert framePlans[getFramePlanIndex(2, 1)] == FramePlan(2, 0, 3, 4, 4, 8, None)
+    assert framePlans[getFramePlanIndex(2, 0)] == FramePlan(2, 3, 0, 4, 7, 5, None)
+
+    settings.transmissionRate = BitRate.COM3
+    settings.timestampMode = TimestampMode.Nanoseconds
+    framePlans = settings.compileFramePlans()
+    assert framePlans[getFramePlanIndex(0, 1)].maxMSequenceTime == \
+        settings.getTimingThreshold(getMaxMSequenceTime(BitRate.COM3, 2, 2))
+    assert framePlans[getFramePlanIndex(2, 0)].maxMSequenceTime == \
+        settings.getTimingThreshold(getMaxMSequenceTime(BitRate.COM3, 7, 5))
@@ -0,0 +1,109 @@
+import random
+
+import pytest
+
+from iolink_utils.exceptions import SettingsInferenceFailed
+from iolink_utils.definitions.bitRate import BitRate
+from iolink_utils.definitions.mSequenceType import MSeqType
+from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder
+from iolink_utils.octetStreamDecoder.octetStreamDecoderSettings import MSeqPayloadLength, TimestampMode
+from iolink_utils.octetStreamDecoder.settingsInference import inferDecoderSettings, inferTransmissionRate, \
+    getPayloadLengthCandidates
+
+from .testDataHelper import createMasterFrame, createDeviceFrame, createCapture
+
+
+def createMSequences(count: int, pdOut: int, od: int, pdIn: int, preoperateOd: int):
+    rand = random.Random(count)
+    mSequences = [(createMasterFrame(0xA0 | (index & 0x0F), 0), createDeviceFrame(od=bytes([index & 0xFF])))
+                  for index in range(4)]
+    mSequences += [(createMasterFrame(0xE0 | (index & 0x0F), 1), createDeviceFrame(od=bytes(range(preoperateOd))))
+                   for index in range(4)]
+    for index in range(count):
+        pdOutData = bytes(rand.randrange(256) for _ in range(pdOut))
+        pdInData = bytes(rand.randrange(256) for _ in range(pdIn))
+        odData = bytes(rand.randrange(256) for _ in range(od))
+        if index % 3 == 0:
+            mSequences.append((createMasterFrame(0x70, 2, pdOut=pdOutData, od=odData), createDeviceFrame(pdIn=pdInData)))
+        else:
+            mSequences.append((createMasterFrame(0xF0, 2, pdOut=pdOutData), createDeviceFrame(od=odData, pdIn=pdInData)))
+    return mSequences
+
+
+def test_settingsInference_payloadLengthCandidates():
+    assert getPayloadLengthCandidates(MSeqType.Type_0_STARTUP) == [MSeqPayloadLength(0, 1, 0)]
+    assert getPayloadLengthCandidates(MSeqType.Type_1_PREOPERATE) == \
+        [MSeqPayloadLength(0, od, 0) for od in (1, 2, 8, 32)]
+
+    operate = getPayloadLengthCandidates(MSeqType.Type_2_OPERATE)
+    assert len(operate) == len(set(operate))
+    assert MSeqPayloadLength(pdOut=2, od=2, pdIn=4) in operate
+    assert MSeqPayloadLength(pdOut=0, od=1, pdIn=1) in operate
+    assert MSeqPayloadLength(pdOut=0, od=2, pdIn=0) in operate
+    assert MSeqPayloadLength(pdOut=0, od=1, pdIn=0) in operate
+    assert {payloadLength.od for payloadLength in operate} == {1, 2, 8, 32}
+
+
+@pytest.mark.parametrize("pdOut, od, pdIn, preoperateOd", [(2, 2, 4, 8), (0, 1, 1, 2), (32, 32, 32, 32), (0, 8, 3, 1)])
+def test_settingsInference_inferDecoderSettings(pdOut, od, pdIn, preoperateOd):
+    values, startTimes, endTimes = createCapture(createMSequences(100, pdOut, od, pdIn, preoperateOd),
+                                                 cycleTime=10_000_000)
+
+    settings = inferDecoderSettings(values, startTimes, endTimes, timestampMode=TimestampMode.Nanoseconds)
+    assert settings.transmissionRate == BitRate.COM3
+    assert settings.timestampMode == TimestampMode.Nanoseconds
+    assert settings.startup == MSeqPayloadLength(pdOut=0, od=1, pdIn=0)
+    assert settings.preoperate == MSeqPayloadLength(pdOut=0, od=preoperateOd, pdIn=0)
+    assert settings.operate == MSeqPayloadLength(pdOut=pdOut, od=od, pdIn=pdIn)
+
+    messages = OctetStreamDecoder(settings).processOctets(values, startTimes, endTimes)
+    assert all(msg.isValid for msg in messages)
+
+
+def test_settingsInference_withoutNumpy(mocker):
+    values, startTimes, endTimes = createCapture(createMSequences(50, 2, 2, 4, 8))
+    expected = inferDecoderSettings(values, startTimes, endTimes, TimestampMode.Nanoseconds)
+
+    mocker.patch('iolink_utils.octetStreamDecoder.settingsInference.np', None)
+    mocker.patch('iolink_utils.octetStreamDecoder.parallelDecoding.isFrameSegmentationAvailable', return_value=False)
+    assert inferDecoderSettings(bytes(values), startTimes, endTimes, TimestampMode.Nanoseconds) == expected
+    assert expected.operate == MSeqPayloadLength(pdOut=2, od=2, pdIn=4)
+
+
+def test_settingsInference_noisyCapture():
+    values, startTimes, endTimes = createCapture(createMSequences(200, 2, 2, 4, 8))
+    rand = random.Random(0)
+    for index in rand.sample(range(len(values)), len(values) // 40):
+        values[index] ^= 0x10
+
+    settings = inferDecoderSettings(values, startTimes, endTimes, TimestampMode.Nanoseconds, maxOctets=1500)
+    assert settings.operate == MSeqPayloadLength(pdOut=2, od=2, pdIn=4)
+
+
+def test_settingsInference_onlyStartup():
+    values, startTimes, endTimes = createCapture(createMSequences(0, 0, 0, 0, 2)[:4])
+    settings = inferDecoderSettings(values, startTimes, endTimes, TimestampMode.Nanoseconds,
+                                    transmissionRate=BitRate.COM2)
+    assert settings.transmissionRate == BitRate.COM2
+    assert settings.preoperate == MSeqPayloadLength()
+    assert settings.operate == MSeqPayloadLength()
+
+
+def test_settingsInference_failed():
+    with pytest.raises(SettingsInferenceFailed):
+        inferDecoderSettings([], [], [], TimestampMode.Nanoseconds)
+
+    rand = random.Random(1)
+    values, startTimes, endTimes = createCapture(
+        [(bytes([rand.randrange(256), 0x80 | rand.randrange(64)] + [rand.randrange(256) for _ in range(6)]), b'\x00')
+         for _ in range(50)])
+    with pytest.raises(SettingsInferenceFailed):
+        inferDecoderSettings(values, startTimes, endTimes, TimestampMode.Nanoseconds)
+
+
+def test_settingsInference_transmissionRate():
+    for transmissionRate, octetTime in ((BitRate.COM1, 2_291_667), (BitRate.COM2, 286_458), (BitRate.COM3, 47_740)):
+        values, startTimes, endTimes = createCapture(createMSequences(3, 2, 2, 4, 8), octetTime=octetTime)
+        settings = inferDecoderSettings(values, startTimes, endTimes, TimestampMode.Nanoseconds)
+        assert settings.transmissionRate == transmissionRate
+        assert inferTransmissionRate(startTimes, endTimes, settings) == transmissionRate
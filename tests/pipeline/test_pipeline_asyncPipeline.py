@@ -0,0 +1,143 @@
+import asyncio
+import struct
+
+import pytest
+
+from iolink_utils.capture.binaryCapture import RECORD_SIZE
+from iolink_utils.exceptions import InvalidCaptureFile
+from iolink_utils.messageInterpreter.messageInterpreter import MessageInterpreter
+from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder
+from iolink_utils.pipeline.asyncPipeline import AsyncPipeline, AsyncPortSource, readOctetChunks
+from iolink_utils.pipeline.multiPortDriver import PortResult
+
+from ..octetStreamDecoder.testDataHelper import createSettings, createMasterFrame, createDeviceFrame, createCapture
+
+
+def createRecords(mSequenceCount: int):
+    # read direct parameter page 1 (address 0..count-1)
+    values, startTimes, endTimes = createCapture(
+        [(createMasterFrame(0xA0 | (address & 0x1F), 0), createDeviceFrame(od=bytes([address])))
+         for address in range(mSequenceCount)])
+    data = b''.join(struct.pack('<BBqq', *record) for record in zip(values, [0] * len(values), startTimes, endTimes))
+
+    interpreter = MessageInterpreter()
+    messages = OctetStreamDecoder(createSettings()).processOctets(values, startTimes, endTimes)
+    return data, [result for result in map(interpreter.processMessage, messages) if result is not None]
+
+
+def createReader(data: bytes, eof: bool = True) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    if eof:
+        reader.feed_eof()
+    return reader
+
+
+def test_asyncPipeline_readOctetChunks():
+    data, _ = createRecords(5)
+
+    async def readChunks(pieceSize: int):  # records split across reads
+        reader = asyncio.StreamReader()
+        chunks = asyncio.ensure_future(collectChunks(reader))
+        for begin in range(0, len(data), pieceSize):
+            reader.feed_data(data[begin:begin + pieceSize])
+            await asyncio.sleep(0)
+        reader.feed_eof()
+        return await chunks
+
+    async def collectChunks(reader: asyncio.StreamReader):
+        return [chunk async for chunk in readOctetChunks(reader, maxRecords=3)]
+
+    for pieceSize in (len(data), 7, RECORD_SIZE, 100):
+        chunks = asyncio.run(readChunks(pieceSize))
+        assert all(0 < len(chunk.values) <= 3 for chunk in chunks)
+        assert [value for chunk in chunks for value in chunk.values] == list(data[::RECORD_SIZE])
+        assert [time for chunk in chunks for time in chunk.endTimes] == \
+            [struct.unpack_from('<q', data, offset + 10)[0] for offset in range(0, len(data), RECORD_SIZE)]
+
+    async def readTruncated():
+        return await collectChunks(createReader(data[:-5]))
+
+    with pytest.raises(InvalidCaptureFile):
+        asyncio.run(readTruncated())
+
+
+def test_asyncPipeline_localSockets():
+    expected = {}
+    records = {}
+    for portId, mSequenceCount in ((1, 5), (2, 30), (3, 0)):
+        records[portId], expected[portId] = createRecords(mSequenceCount)
+
+    async def sendRecords(data: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        for begin in range(0, len(data), 100):  # live source: records arrive in small pieces
+            writer.write(data[begin:begin + 100])
+            await writer.drain()
+            await asyncio.sleep(0)
+        writer.close()
+
+    async def run():
+        servers, writers, ports = [], [], []
+        for portId, data in records.items():
+            server = await asyncio.start_server(
+                lambda reader, writer, data=data: sendRecords(data, reader, writer), '127.0.0.1', 0)
+            reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+            servers.append(server)
+            writers.append(writer)
+            ports.append(AsyncPortSource(portId, createSettings(), reader))
+
+        pipeline = AsyncPipeline(ports, queueSize=2, maxRecords=16)
+        results = [result async for result in pipeline]
+        for writer in writers:
+            writer.close()
+        for server in servers:
+            server.close()
+        return pipeline, results
+
+    pipeline, results = asyncio.run(run())
+    assert all(isinstance(result, PortResult) for result in results)
+    for portId, transactions in expected.items():
+        received = [result.result for result in results if result.portId == portId]
+        assert [transaction.data() for transaction in received] == [transaction.data() for transaction in transactions]
+
+    assert sorted(pipeline.statistics) == [1, 2, 3]
+    assert pipeline.statistics[2].octets == 30 * 4
+    assert pipeline.statistics[2].messages == 30 * 2
+    assert pipeline.statistics[2].results == 30
+    assert pipeline.statistics[3].octets == 0
+
+
+def test_asyncPipeline_backpressure():
+    data, expected = createRecords(20)
+
+    async def run():
+        reader = createReader(data)
+        results = AsyncPipeline([AsyncPortSource(1, createSettings(), reader)], queueSize=1, maxRecords=4).run()
+        first = await results.__anext__()
+        assert not reader.at_eof()  # port waits for the consumer instead of reading everything
+        await results.aclose()  # port task is cancelled
+        return first
+
+    assert asyncio.run(run()).result.data() == expected[0].data()
+
+
+def test_asyncPipeline_error():
+    data, expected = createRecords(3)
+
+    async def run():
+        ports = [AsyncPortSource(1, createSettings(), createReader(data)),
+                 AsyncPortSource(2, createSettings(), createReader(data[:-1]))]
+        pipeline = AsyncPipeline(ports)
+        with pytest.raises(InvalidCaptureFile):
+            async for _ in pipeline:
+                pass
+        return pipeline
+
+    pipeline = asyncio.run(run())
+    assert 2 in pipeline.statistics
+
+
+def test_asyncPipeline_noPorts():
+    async def run():
+        return [result async for result in AsyncPipeline([])]
+
+    assert asyncio.run(run()) == []
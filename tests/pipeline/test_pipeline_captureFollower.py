@@ -0,0 +1,186 @@
+import pytest
+
+from iolink_utils.capture.binaryCapture import CaptureHeader, HEADER_SIZE, writeBinaryCapture
+from iolink_utils.exceptions import InvalidCaptureFile
+from iolink_utils.messageInterpreter.messageInterpreter import MessageInterpreter
+from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder
+from iolink_utils.pipeline.captureFollower import CaptureFollower
+from iolink_utils.definitions.bitRate import BitRate
+
+from ..octetStreamDecoder.testDataHelper import createSettings, createMasterFrame, createDeviceFrame, createCapture
+
+
+def createOctets(mSequenceCount: int):
+    # read direct parameter page 1 (address 0..count-1)
+    return createCapture([(createMasterFrame(0xA0 | (address & 0x1F), 0), createDeviceFrame(od=bytes([address])))
+                          for address in range(mSequenceCount)])
+
+
+def expectedData(values, startTimes, endTimes) -> list:
+    interpreter = MessageInterpreter()
+    messages = OctetStreamDecoder(createSettings()).processOctets(values, startTimes, endTimes)
+    return [result.data() for result in map(interpreter.processMessage, messages) if result is not None]
+
+
+def createBinaryCapture(tmp_path, values, startTimes, endTimes) -> bytes:
+    filename = str(tmp_path / "full.iolcap")
+    writeBinaryCapture(filename, zip(values, [0] * len(values), startTimes, endTimes), CaptureHeader(BitRate.COM3))
+    with open(filename, 'rb') as file:
+        return file.read()
+
+
+def createCsvCapture(values, startTimes, endTimes) -> bytes:
+    def timestamp(ns: int) -> str:
+        return f"2050-01-01 00:01:{ns // 1_000_000_000:02d}.{ns % 1_000_000_000:09d}+00:00"
+
+    lines = ["value,error,start,end,type", "0, , 2050-01-01 00:00:00.0+00:00, 2050-01-01 00:00:00.0+00:00, break"]
+    lines += [f"{value}, , {timestamp(start)}, {timestamp(end)}, data" for value, start, end in
+              zip(values, startTimes, endTimes)]
+    return ("\n".join(lines) + "\n").encode('utf-8')
+
+
+def appendPieces(filename, data: bytes, pieceSize: int):
+    for begin in range(0, len(data), pieceSize):
+        with open(filename, 'ab') as file:
+            file.write(data[begin:begin + pieceSize])
+        yield begin + pieceSize
+
+
+@pytest.mark.parametrize("extension", ['.iolcap', '.csv'])
+def test_captureFollower_growingFile(tmp_path, extension):
+    values, startTimes, endTimes = createOctets(20)
+    data = createBinaryCapture(tmp_path, values, startTimes, endTimes) if extension == '.iolcap' else \
+        createCsvCapture(values, startTimes, endTimes)
+    filename = str(tmp_path / f"capture{extension}")
+
+    follower = CaptureFollower(filename, createSettings(), chunkSize=7)
+    assert follower.poll() == []  # file does not exist yet
+
+    results = []
+    for written in appendPieces(filename, data, 45):  # records and lines are split across polls
+        results += follower.poll()
+        assert follower.offset <= min(written, len(data))
+    assert follower.offset == len(data)
+    assert [result.data() for result in results] == expectedData(values, startTimes, endTimes)
+    assert follower.poll() == []
+
+
+@pytest.mark.parametrize("extension", ['.iolcap', '.csv'])
+def test_captureFollower_restart(tmp_path, extension):
+    values, startTimes, endTimes = createOctets(20)
+    data = createBinaryCapture(tmp_path, values, startTimes, endTimes) if extension == '.iolcap' else \
+        createCsvCapture(values, startTimes, endTimes)
+    filename = str(tmp_path / f"capture{extension}")
+    stateFilename = str(tmp_path / "capture.state")
+
+    results = []
+    for written in appendPieces(filename, data, 100):
+        # new process for every poll: decoding continues at the persisted offset
+        follower = CaptureFollower(filename, createSettings(), stateFilename=stateFilename)
+        results += follower.poll()
+        follower.commit()
+    assert follower.offset == len(data)
+    assert [result.data() for result in results] == expectedData(values, startTimes, endTimes)
+
+
+@pytest.mark.parametrize("extension", ['.iolcap', '.csv'])
+def test_captureFollower_restartAfterPartialBatch(tmp_path, extension):
+    values, startTimes, endTimes = createOctets(30)
+    data = createBinaryCapture(tmp_path, values, startTimes, endTimes) if extension == '.iolcap' else \
+        createCsvCapture(values, startTimes, endTimes)
+    filename = str(tmp_path / f"capture{extension}")
+    stateFilename = str(tmp_path / "capture.state")
+    pieces = appendPieces(filename, data, len(data) // 3 + 1)
+
+    def restart() -> CaptureFollower:
+        return CaptureFollower(filename, createSettings(), stateFilename=stateFilename)
+
+    next(pieces)
+    follower = restart()
+    firstBatch = [result.data() for result in follower.poll()]
+    follower.commit()
+
+    # process stops while processing the second batch: the batch is delivered again after a restart
+    next(pieces)
+    follow = restart().follow(interval=0)
+    partial = [next(follow).data() for _ in range(3)]
+    follow.close()
+    secondBatch = [result.data() for result in restart().poll()]
+    assert secondBatch[:3] == partial
+
+    # follow() commits a batch when the result after its last one is requested
+    follow = restart().follow(interval=0)
+    assert [next(follow).data() for _ in secondBatch] == secondBatch
+    next(pieces)
+    firstOfThirdBatch = next(follow).data()
+    follow.close()
+    thirdBatch = [result.data() for result in restart().poll()]  # second batch is not delivered again
+    assert thirdBatch[0] == firstOfThirdBatch
+
+    assert min(len(firstBatch), len(secondBatch), len(thirdBatch)) > 3
+    assert firstBatch + secondBatch + thirdBatch == expectedData(values, startTimes, endTimes)
+
+
+@pytest.mark.parametrize("extension", ['.iolcap', '.csv'])
+def test_captureFollower_retryFailedChunk(tmp_path, monkeypatch, extension):
+    values, startTimes, endTimes = createOctets(20)
+    data = createBinaryCapture(tmp_path, values, startTimes, endTimes) if extension == '.iolcap' else \
+        createCsvCapture(values, startTimes, endTimes)
+    filename = str(tmp_path / f"capture{extension}")
+    with open(filename, 'wb') as file:
+        file.write(data)
+
+    follower = CaptureFollower(filename, createSettings(), stateFilename=str(tmp_path / "capture.state"), chunkSize=7)
+    processOctets = OctetStreamDecoder.processOctets
+    calls = []
+
+    def failingProcessOctets(decoder, *chunk):
+        calls.append(len(chunk[0]))
+        if len(calls) == 3:  # after two chunks have been decoded
+            raise RuntimeError("decoding failed")
+        return processOctets(decoder, *chunk)
+
+    monkeypatch.setattr(OctetStreamDecoder, 'processOctets', failingProcessOctets)
+    with pytest.raises(RuntimeError):
+        follower.poll()
+    assert follower.offset == 0
+    follower.commit()  # nothing to commit
+
+    results = follower.poll()  # retried from the start: no data is skipped or decoded twice
+    assert len(calls) > 3
+    assert follower.offset == len(data)
+    assert [result.data() for result in results] == expectedData(values, startTimes, endTimes)
+
+
+def test_captureFollower_messages(tmp_path):
+    values, startTimes, endTimes = createOctets(3)
+    filename = str(tmp_path / "capture.iolcap")
+    with open(filename, 'wb') as file:
+        file.write(createBinaryCapture(tmp_path, values, startTimes, endTimes))
+
+    messages = CaptureFollower(filename, createSettings(), interpret=False).poll()
+    expected = OctetStreamDecoder(createSettings()).processOctets(values, startTimes, endTimes)
+    assert [repr(message) for message in messages] == [repr(message) for message in expected]
+
+
+def test_captureFollower_truncatedFile(tmp_path):
+    values, startTimes, endTimes = createOctets(10)
+    filename = str(tmp_path / "capture.iolcap")
+    with open(filename, 'wb') as file:
+        file.write(createBinaryCapture(tmp_path, values, startTimes, endTimes))
+
+    follower = CaptureFollower(filename, createSettings())
+    assert len(follower.poll()) == 10
+
+    # capture is restarted: file is replaced by a shorter one
+    values, startTimes, endTimes = createOctets(2)
+    with open(filename, 'wb') as file:
+        file.write(createBinaryCapture(tmp_path, values, startTimes, endTimes))
+    assert [result.data() for result in follower.poll()] == expectedData(values, startTimes, endTimes)
+
+
+def test_captureFollower_invalidHeader(tmp_path):
+    filename = tmp_path / "capture.iolcap"
+    filename.write_bytes(b'\x00' * HEADER_SIZE)
+    with pytest.raises(InvalidCaptureFile):
+        CaptureFollower(str(filename), createSettings()).poll()
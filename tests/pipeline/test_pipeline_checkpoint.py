@@ -0,0 +1,116 @@
+import pytest
+
+from iolink_utils.capture.binaryCapture import BinaryCaptureReader, CaptureHeader, writeBinaryCapture
+from iolink_utils.messageInterpreter.messageInterpreter import MessageInterpreter
+from iolink_utils.messageInterpreter.diagnosis.transactionDiagnosis import TransactionDiagEventMemory
+from iolink_utils.messageInterpreter.isdu.ISDUrequests import ISDURequest_Read8bitIdxSub
+from iolink_utils.messageInterpreter.isdu.ISDUresponses import ISDUResponse_ReadResp_P
+from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder
+from iolink_utils.octetStreamDecoder.octetStreamDecoderSettings import DecoderSettings, MSeqPayloadLength
+from iolink_utils.pipeline.checkpoint import Checkpoint, createCheckpoint, restoreCheckpoint, saveCheckpoint, \
+    loadCheckpoint
+from iolink_utils.definitions.bitRate import BitRate
+
+from ..octetStreamDecoder.testDataHelper import createSettings, createMasterFrame, createDeviceFrame, createCapture
+
+OPERATE = MSeqPayloadLength(pdOut=7, od=2, pdIn=10)  # payload of the M-sequences in OPERATE (see createMSequences)
+
+
+def createMSequences():
+    pdOut, pdIn = bytes(7), bytes(10)
+    return [
+        # ISDU read request (index 0x01, subindex 0xA6) and response
+        (createMasterFrame(0x70, 2, pdOut=pdOut, od=b'\xA4\x03'), createDeviceFrame(pdIn=pdIn)),
+        (createMasterFrame(0x61, 2, pdOut=pdOut, od=b'\x01\xA6'), createDeviceFrame(pdIn=pdIn)),
+        (createMasterFrame(0xF0, 2, pdOut=pdOut), createDeviceFrame(od=b'\xD3\x00', pdIn=pdIn)),
+        (createMasterFrame(0xE1, 2, pdOut=pdOut), createDeviceFrame(od=b'\xD3\x00', pdIn=pdIn)),
+        # read event memory (status code, event 2)
+        (createMasterFrame(0xC0, 2, pdOut=pdOut), createDeviceFrame(od=b'\x82\x00', pdIn=pdIn, eventFlag=1)),
+        (createMasterFrame(0xC4, 2, pdOut=pdOut), createDeviceFrame(od=b'\xF4\x00', pdIn=pdIn, eventFlag=1)),
+        (createMasterFrame(0xC5, 2, pdOut=pdOut), createDeviceFrame(od=b'\xAA\x00', pdIn=pdIn, eventFlag=1)),
+        (createMasterFrame(0xC6, 2, pdOut=pdOut), createDeviceFrame(od=b'\xBB\x00', pdIn=pdIn, eventFlag=1)),
+    ]
+
+
+def interpret(decoder: OctetStreamDecoder, interpreter: MessageInterpreter, values, startTimes, endTimes) -> list:
+    messages = decoder.processOctets(values, startTimes, endTimes)
+    return [result for result in map(interpreter.processMessage, messages) if result is not None]
+
+
+def resultData(results) -> list:
+    return [(type(result).__name__, result.data(), result.startTime, result.endTime) for result in results]
+
+
+def test_checkpoint_resumeAtEveryOctet(tmp_path):
+    values, startTimes, endTimes = createCapture(createMSequences())
+    expected = interpret(OctetStreamDecoder(createSettings(OPERATE)), MessageInterpreter(), values, startTimes, endTimes)
+    assert [type(result) for result in expected if not type(result).__name__.startswith('TransactionProcess')] == \
+        [ISDURequest_Read8bitIdxSub, ISDUResponse_ReadResp_P, TransactionDiagEventMemory]
+
+    filename = str(tmp_path / "job.checkpoint")
+    for position in range(len(values) + 1):
+        decoder, interpreter = OctetStreamDecoder(createSettings(OPERATE)), MessageInterpreter()
+        results = interpret(decoder, interpreter, values[:position], startTimes[:position], endTimes[:position])
+        saveCheckpoint(filename, createCheckpoint(position, decoder, interpreter))
+
+        decoder, interpreter = OctetStreamDecoder(createSettings(OPERATE)), MessageInterpreter()
+        resumeAt = restoreCheckpoint(loadCheckpoint(filename), decoder, interpreter)
+        assert resumeAt == position
+        results += interpret(decoder, interpreter, values[resumeAt:], startTimes[resumeAt:], endTimes[resumeAt:])
+        assert resultData(results) == resultData(expected)
+
+
+def test_checkpoint_restoreSeveralTimes():
+    values, startTimes, endTimes = createCapture(createMSequences())
+    position = len(values) - 30  # within reading the event memory
+
+    decoder, interpreter = OctetStreamDecoder(createSettings(OPERATE)), MessageInterpreter()
+    interpret(decoder, interpreter, values[:position], startTimes[:position], endTimes[:position])
+    checkpoint = createCheckpoint(position, decoder, interpreter)
+
+    continued = []
+    for _ in range(2):  # restoring must not modify the checkpoint
+        restoreCheckpoint(checkpoint, decoder, interpreter)
+        continued.append(resultData(interpret(decoder, interpreter, values[position:], startTimes[position:],
+                                              endTimes[position:])))
+    assert continued[0] == continued[1]
+    assert continued[0][-1][0] == 'TransactionDiagEventMemory'
+
+
+def test_checkpoint_decoderOnly():
+    values, startTimes, endTimes = createCapture(createMSequences())
+    expected = OctetStreamDecoder(createSettings(OPERATE)).processOctets(values, startTimes, endTimes)
+
+    decoder = OctetStreamDecoder(createSettings(OPERATE), resync=True)
+    messages = decoder.processOctets(values[:5], startTimes[:5], endTimes[:5])
+    checkpoint = createCheckpoint(5, decoder)
+    assert checkpoint == Checkpoint(5, checkpoint.decoder, None)
+
+    decoder = OctetStreamDecoder(DecoderSettings(transmissionRate=BitRate.COM1))
+    restoreCheckpoint(checkpoint, decoder, MessageInterpreter())
+    assert decoder.settings == createSettings(OPERATE)
+    messages += decoder.processOctets(values[5:], startTimes[5:], endTimes[5:])
+    assert [repr(msg) for msg in messages] == [repr(msg) for msg in expected]
+
+
+def test_checkpoint_binaryCaptureReader(tmp_path):
+    pytest.importorskip("numpy")
+    values, startTimes, endTimes = createCapture(createMSequences() * 3)
+    filename = str(tmp_path / "capture.iolcap")
+    writeBinaryCapture(filename, zip(values, [0] * len(values), startTimes, endTimes), CaptureHeader(BitRate.COM3))
+    expected = interpret(OctetStreamDecoder(createSettings(OPERATE)), MessageInterpreter(), values, startTimes, endTimes)
+
+    decoder, interpreter = OctetStreamDecoder(createSettings(OPERATE)), MessageInterpreter()
+    results = []
+    with BinaryCaptureReader(filename, chunkSize=50) as reader:
+        for chunkIndex, chunk in enumerate(reader.chunks()):
+            results += interpret(decoder, interpreter, *chunk)
+            if chunkIndex == 2:  # job is interrupted after 3 chunks
+                checkpoint = createCheckpoint((chunkIndex + 1) * reader.chunkSize, decoder, interpreter)
+                break
+
+    decoder, interpreter = OctetStreamDecoder(createSettings(OPERATE)), MessageInterpreter()
+    with BinaryCaptureReader(filename, chunkSize=50) as reader:
+        for chunk in reader.chunks(restoreCheckpoint(checkpoint, decoder, interpreter)):
+            results += interpret(decoder, interpreter, *chunk)
+    assert resultData(results) == resultData(expected)
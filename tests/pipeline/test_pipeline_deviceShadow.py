@@ -0,0 +1,85 @@
+from pathlib import Path
+
+from iolink_utils.iodd.iodd import Iodd
+from iolink_utils.messageInterpreter.messageInterpreter import MessageInterpreter
+from iolink_utils.messageInterpreter.page.transactionPage import TransactionPage
+from iolink_utils.pipeline.deviceShadow import DeviceShadow, ShadowValue
+
+from ..messageInterpreter.isdu.test_isdu_ISDUexchange import readMessages, writeErrorMessages, writeReadRespMessages, \
+    withTimes
+
+
+def writeMessages(index: int, value: int):
+    # write one octet, positive response
+    return withTimes([
+        ([0x14, index], [], 0x70),
+        ([value, 0x14 ^ index ^ value], [], 0x61),
+        ([], [0x52, 0x52], 0xF0),
+    ])
+
+
+def createShadow(sequences) -> DeviceShadow:
+    # every sequence starts 1000 later (exchanges end at 1000 * n + 350 (read) or + 250 (write))
+    messages = []
+    for position, sequence in enumerate(sequences):
+        for message in sequence:
+            message.startTime += position * 1000
+            message.endTime += position * 1000
+        messages += sequence
+
+    shadow = DeviceShadow()
+    shadow.update(MessageInterpreter(isduExchanges=True).processMessages(messages))
+    return shadow
+
+
+def test_deviceShadow_values():
+    shadow = createShadow([
+        readMessages(66, 0, 0x10),
+        readMessages(66, 0, 0x10),  # unchanged: not stored
+        writeMessages(66, 0x20),
+        writeErrorMessages(66),  # negative response: ignored
+        readMessages(67, 1, 0x30),
+        readMessages(66, 0, 0x21),
+        writeErrorMessages(66, 0x00, 0x00),  # negative response without error code: ignored
+        writeReadRespMessages(66),  # response service does not match the request: ignored
+    ])
+
+    assert len(shadow) == 2
+    assert shadow.keys() == [(66, 0), (67, 1)]
+    assert shadow.history(66) == [ShadowValue(350, b'\x10'), ShadowValue(2250, b'\x20'), ShadowValue(5350, b'\x21')]
+    assert shadow.value(66) == ShadowValue(5350, b'\x21')
+    assert shadow.value(67, 1) == ShadowValue(4350, b'\x30')
+    assert shadow.value(67) is None
+    assert shadow.history(99) == []
+
+    assert shadow.valueAt(66, 0, 349) is None
+    assert shadow.valueAt(66, 0, 350) == ShadowValue(350, b'\x10')
+    assert shadow.valueAt(66, 0, 2249) == ShadowValue(350, b'\x10')
+    assert shadow.valueAt(66, 0, 3000) == ShadowValue(2250, b'\x20')
+    assert shadow.valueAt(99, 0, 3000) is None
+
+    assert shadow.configurationAt(0) == {}
+    assert shadow.configurationAt(4000) == {(66, 0): b'\x20'}
+    assert shadow.configurationAt(10000) == {(66, 0): b'\x21', (67, 1): b'\x30'}
+
+
+def test_deviceShadow_decoded():
+    iodd = Iodd(str(Path(__file__).parent.parent.joinpath(
+        'iodd/IODDViewer1.4_Examples/IO-Link-09-AllSimpleDatatypesDevice-20211215-IODD1.1.xml')))
+    shadow = createShadow([readMessages(66, 0, 0xFE), readMessages(68, 0, 0x01), readMessages(99, 0, 0x02)])
+    assert shadow.configurationAt(10000, iodd.variableDecoders) == {
+        (66, 0): 254,
+        (68, 0): b'\x01',  # does not match the datatype (IntegerT 32)
+        (99, 0): b'\x02'  # unknown variable
+    }
+
+
+def test_deviceShadow_outOfOrder():
+    shadow = DeviceShadow()
+    exchanges = list(MessageInterpreter(isduExchanges=True).processMessages(
+        readMessages(66, 0, 0x10) + readMessages(66, 0, 0x20) + readMessages(66, 0, 0x20)))
+    exchanges[0].endTime, exchanges[1].endTime, exchanges[2].endTime = 100, 300, 200
+
+    assert not shadow.add(TransactionPage(0, 0, 0))
+    assert all(shadow.add(exchange) for exchange in exchanges)
+    assert shadow.history(66) == [ShadowValue(100, b'\x10'), ShadowValue(200, b'\x20')]
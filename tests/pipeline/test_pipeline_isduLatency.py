@@ -0,0 +1,78 @@
+import pickle
+from datetime import timedelta
+
+import pytest
+
+from iolink_utils.messageInterpreter.messageInterpreter import MessageInterpreter
+from iolink_utils.messageInterpreter.page.transactionPage import TransactionPage
+from iolink_utils.pipeline.isduLatency import ISDULatencyAggregator, LatencyHistogram
+
+from ..messageInterpreter.isdu.test_isdu_ISDUexchange import readMessages, writeErrorMessages
+
+
+def test_latencyHistogram_buckets():
+    for value in range(70000):
+        lower, upper = LatencyHistogram._bucketRange(LatencyHistogram._bucket(value))
+        assert lower <= value < upper
+        assert upper - lower <= max(1, lower // 8)  # relative error <= 12.5%
+
+    assert LatencyHistogram._bucket(2 ** 64) < 500
+
+
+def test_latencyHistogram_statistics():
+    histogram = LatencyHistogram()
+    assert (histogram.count, histogram.mean, histogram.quantile(0.5)) == (0, 0.0, 0)
+
+    for value in [5, 100, 1000, 1000, 2000, -3]:
+        histogram.add(value)
+    assert (histogram.count, histogram.total, histogram.minimum, histogram.maximum) == (6, 4105, 0, 2000)
+    assert histogram.buckets() == [(0, 1, 1), (5, 6, 1), (96, 104, 1), (960, 1024, 2), (1920, 2048, 1)]
+    assert histogram.quantile(0.0) == 0
+    assert histogram.quantile(0.5) == 103
+    assert histogram.quantile(0.6) == 1023
+    assert histogram.quantile(1.0) == 2000
+
+
+def test_latencyHistogram_merge():
+    values = list(range(0, 100000, 37))
+    expected, first, second = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for position, value in enumerate(values):
+        expected.add(value)
+        (first if position % 3 else second).add(value)
+
+    first.merge(second)
+    first.merge(LatencyHistogram())
+    assert first.buckets() == expected.buckets()
+    assert (first.count, first.total, first.minimum, first.maximum) == \
+        (expected.count, expected.total, expected.minimum, expected.maximum)
+    assert first.quantile(0.99) == expected.quantile(0.99)
+
+
+def test_isduLatencyAggregator():
+    interpreter = MessageInterpreter(isduExchanges=True)
+    messages = readMessages(0x12, 0x03, 0x77, busyCycles=5) + readMessages(0x20, 0x00, 0x11) + \
+        readMessages(0x12, 0x01, 0x77, busyCycles=1) + writeErrorMessages(0x20)
+
+    aggregator = ISDULatencyAggregator()
+    aggregator.update(interpreter.processMessages(messages))
+    aggregator.add(TransactionPage(0, 0, 0))  # ignored
+    assert len(aggregator) == 2
+    assert aggregator.indices() == [0x12, 0x20]
+    assert aggregator.histogram(0x20).count == 2
+    assert aggregator.histogram(0x99).count == 0
+
+    histogram = aggregator.histogram(0x12)
+    assert (histogram.minimum, histogram.maximum) == (150, 550)
+    assert [index for index, _ in aggregator.slowest(1)] == [0x12]
+    assert [index for index, _ in aggregator.slowest()] == [0x12, 0x20]
+
+    # e.g. aggregated by several processes
+    restored = pickle.loads(pickle.dumps(aggregator))
+    restored.merge(aggregator)
+    assert restored.histogram(0x12).count == 4
+    assert restored.histogram(0x12).maximum == 550
+
+
+@pytest.mark.parametrize("latency, expected", [(timedelta(milliseconds=2), 2000), (1234, 1234)])
+def test_isduLatencyAggregator_units(latency, expected):
+    assert ISDULatencyAggregator._toInt(latency) == expected
@@ -0,0 +1,89 @@
+import pytest
+
+from iolink_utils.capture.binaryCapture import CaptureHeader, writeBinaryCapture
+from iolink_utils.messageInterpreter.messageInterpreter import MessageInterpreter
+from iolink_utils.messageInterpreter.page.transactionPage import TransactionPage
+from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder
+from iolink_utils.pipeline.multiPortDriver import MultiPortDriver, PortSource, PortResult
+from iolink_utils.definitions.bitRate import BitRate
+
+from ..octetStreamDecoder.testDataHelper import createSettings, createMasterFrame, createDeviceFrame, createCapture
+
+
+def createPageReads(count: int):
+    # read direct parameter page 1 (address 0..count-1)
+    return [(createMasterFrame(0xA0 | (address & 0x1F), 0), createDeviceFrame(od=bytes([address])))
+            for address in range(count)]
+
+
+def writeCapture(filename, mSequenceCount: int) -> list:
+    values, startTimes, endTimes = createCapture(createPageReads(mSequenceCount))
+    writeBinaryCapture(str(filename), zip(values, [0] * len(values), startTimes, endTimes), CaptureHeader(BitRate.COM3))
+
+    interpreter = MessageInterpreter()
+    messages = OctetStreamDecoder(createSettings()).processOctets(values, startTimes, endTimes)
+    return [result for result in map(interpreter.processMessage, messages) if result is not None]
+
+
+def test_multiPortDriver_run(tmp_path):
+    expected = {}
+    ports = []
+    for portId, mSequenceCount in ((1, 5), (2, 20), (3, 0), (4, 12)):
+        filename = tmp_path / f"port{portId}.iolcap"
+        expected[portId] = writeCapture(filename, mSequenceCount)
+        ports.append(PortSource(portId, createSettings(), str(filename)))
+
+    driver = MultiPortDriver(ports, maxWorkers=2, queueSize=2, batchSize=3)
+    results = list(driver.run())
+
+    assert all(isinstance(result, PortResult) for result in results)
+    for portId, transactions in expected.items():
+        received = [result.result for result in results if result.portId == portId]
+        assert all(isinstance(transaction, TransactionPage) for transaction in received)
+        assert [transaction.data() for transaction in received] == [transaction.data() for transaction in transactions]
+        assert [transaction.startTime for transaction in received] == [transaction.startTime for transaction in transactions]
+
+    assert sorted(driver.statistics) == [1, 2, 3, 4]
+    assert driver.statistics[2].octets == 20 * 4
+    assert driver.statistics[2].messages == 20 * 2
+    assert driver.statistics[2].results == 20
+    assert driver.statistics[3].octets == 0
+    assert driver.statistics[2].octetsPerSecond > 0
+
+
+def test_multiPortDriver_noPorts():
+    driver = MultiPortDriver([])
+    assert list(driver.run()) == []
+    assert driver.statistics == {}
+
+
+def test_multiPortDriver_error(tmp_path):
+    filename = tmp_path / "port1.iolcap"
+    writeCapture(filename, 3)
+
+    driver = MultiPortDriver([PortSource(1, createSettings(), str(filename)),
+                              PortSource(2, createSettings(), str(tmp_path / "missing.iolcap"))])
+    with pytest.raises(FileNotFoundError):
+        list(driver.run())
+    assert driver.statistics[1].results == 3
+
+
+def test_multiPortDriver_breakEarly(tmp_path):
+    ports = []
+    for portId in (1, 2):
+        filename = tmp_path / f"port{portId}.iolcap"
+        writeCapture(filename, 200)
+        ports.append(PortSource(portId, createSettings(), str(filename)))
+
+    # workers block on the full queue until run() is left
+    driver = MultiPortDriver(ports, queueSize=1, batchSize=1)
+    results = []
+    for result in driver.run():
+        results.append(result)
+        if len(results) == 3:
+            break
+    assert len(results) == 3
+
+    run = driver.run()
+    assert isinstance(next(run), PortResult)
+    run.close()
@@ -0,0 +1,98 @@
+from pathlib import Path
+
+from iolink_utils.capture.octetChunk import OctetChunk
+from iolink_utils.definitions.communicationChannel import CommChannel
+from iolink_utils.iodd.iodd import Iodd
+from iolink_utils.messageInterpreter.messageInterpreter import MessageInterpreter
+from iolink_utils.messageInterpreter.process.transactionProcess import TransactionProcess
+from iolink_utils.octetStreamDecoder.octetStreamDecoder import OctetStreamDecoder
+from iolink_utils.octetStreamDecoder.octetStreamDecoderSettings import MSeqPayloadLength
+from iolink_utils.pipeline.transactionStream import decodeISDUPayloads, interpretChunks, iterTransactions
+from iolink_utils.definitions.transmissionDirection import TransmissionDirection
+
+from ..octetStreamDecoder.testDataHelper import createSettings, createMasterFrame, createDeviceFrame, createCapture
+from ..messageInterpreter.isdu.test_isdu_ISDUexchange import readMessages, writeErrorMessages
+
+OPERATE = MSeqPayloadLength(pdOut=7, od=2, pdIn=10)  # payload of the M-sequences in OPERATE (see createChunks)
+
+
+def createChunks(chunkSize: int):
+    pdOut, pdIn = bytes(7), bytes(10)
+    process = [(createMasterFrame(0x80, 2, pdOut=pdOut), createDeviceFrame(od=bytes(2), pdIn=pdIn))] * 5
+    values, startTimes, endTimes = createCapture(process + [
+        # ISDU read request (index 0x01, subindex 0xA6) and response
+        (createMasterFrame(0x70, 2, pdOut=pdOut, od=b'\xA4\x03'), createDeviceFrame(pdIn=pdIn)),
+        (createMasterFrame(0x61, 2, pdOut=pdOut, od=b'\x01\xA6'), createDeviceFrame(pdIn=pdIn)),
+    ] + process + [
+        (createMasterFrame(0xF0, 2, pdOut=pdOut), createDeviceFrame(od=b'\xD3\x00', pdIn=pdIn)),
+        (createMasterFrame(0xE1, 2, pdOut=pdOut), createDeviceFrame(od=b'\xD3\x00', pdIn=pdIn)),
+        # read event memory (status code, event 2)
+        (createMasterFrame(0xC0, 2, pdOut=pdOut), createDeviceFrame(od=b'\x82\x00', pdIn=pdIn, eventFlag=1)),
+        (createMasterFrame(0xC4, 2, pdOut=pdOut), createDeviceFrame(od=b'\xF4\x00', pdIn=pdIn, eventFlag=1)),
+        (createMasterFrame(0xC5, 2, pdOut=pdOut), createDeviceFrame(od=b'\xAA\x00', pdIn=pdIn, eventFlag=1)),
+        (createMasterFrame(0xC6, 2, pdOut=pdOut), createDeviceFrame(od=b'\xBB\x00', pdIn=pdIn, eventFlag=1)),
+    ] + process)
+    return [OctetChunk(values[begin:begin + chunkSize], startTimes[begin:begin + chunkSize],
+                       endTimes[begin:begin + chunkSize]) for begin in range(0, len(values), chunkSize)]
+
+
+def resultData(results) -> list:
+    return [(type(result).__name__, result.data(), result.startTime, result.endTime) for result in results]
+
+
+def test_transactionStream_allChannels():
+    decoder, interpreter = OctetStreamDecoder(createSettings(OPERATE)), MessageInterpreter()
+    expected = []
+    for chunk in createChunks(1000):
+        expected += [result for result in map(interpreter.processMessage, decoder.processOctets(*chunk))
+                     if result is not None]
+
+    for chunkSize in (1, 13, 1000):
+        assert resultData(iterTransactions(createChunks(chunkSize), createSettings(OPERATE))) == resultData(expected)
+    assert sum(isinstance(result, TransactionProcess) for result in expected) == 2 * 15
+
+
+def test_transactionStream_channelFilter():
+    expected = [result for result in iterTransactions(createChunks(1000), createSettings(OPERATE))
+                if not isinstance(result, TransactionProcess)]
+    assert [type(result).__name__ for result in expected] == \
+        ['ISDURequest_Read8bitIdxSub', 'ISDUResponse_ReadResp_P', 'TransactionDiagEventMemory']
+
+    for chunkSize in (1, 13, 1000):
+        for messageViews in (False, True):
+            results = iterTransactions(createChunks(chunkSize), createSettings(OPERATE),
+                                       channels=[CommChannel.ISDU, CommChannel.Diagnosis], messageViews=messageViews)
+            assert resultData(results) == resultData(expected)
+
+    isduOnly = iterTransactions(createChunks(13), createSettings(OPERATE), channels=[CommChannel.ISDU])
+    assert resultData(isduOnly) == resultData(expected[:2])
+
+
+def test_transactionStream_continueWithState():
+    chunks = createChunks(50)
+    decoder = OctetStreamDecoder(createSettings(OPERATE))
+    interpreter = MessageInterpreter(channels=[CommChannel.ISDU, CommChannel.Diagnosis])
+    results = list(interpretChunks(chunks[:len(chunks) // 2], decoder, interpreter))
+    results += interpretChunks(chunks[len(chunks) // 2:], decoder, interpreter)
+    assert [type(result).__name__ for result in results] == \
+        ['ISDURequest_Read8bitIdxSub', 'ISDUResponse_ReadResp_P', 'TransactionDiagEventMemory']
+
+
+def test_transactionStream_decodeISDUPayloads():
+    iodd = Iodd(str(Path(__file__).parent.parent.joinpath(
+        'iodd/IODDViewer1.4_Examples/IO-Link-09-AllSimpleDatatypesDevice-20211215-IODD1.1.xml')))
+    messages = readMessages(66, 0, 0xFE) + writeErrorMessages(66) + writeErrorMessages(66, 0x00, 0x00) + \
+        readMessages(68, 0, 0x01) + readMessages(0x99, 0, 0x01)
+    interpreter = MessageInterpreter(isduExchanges=True)
+
+    exchanges = list(decodeISDUPayloads(interpreter.processMessages(messages), iodd.variableDecoders))
+    assert [exchange.value for exchange in exchanges] == [
+        254,
+        None,  # negative response
+        None,  # negative response without error code
+        None,  # 1 octet for an IntegerT with 32 bits
+        None  # unknown index
+    ]
+
+    transactions = [TransactionProcess('Master', TransmissionDirection.Read)]
+    assert list(decodeISDUPayloads(transactions, iodd.variableDecoders)) == transactions